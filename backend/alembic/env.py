@@ -77,6 +77,9 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # pysqlite autocommits each DDL statement on its own, so open one
+        # explicit transaction and commit all pending migrations together
+        connection.exec_driver_sql("BEGIN")
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
@@ -84,6 +87,7 @@ def run_migrations_online() -> None:
         )
         with context.begin_transaction():
             context.run_migrations()
+        connection.commit()
 
 
 if context.is_offline_mode():
@@ -12,6 +12,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
 
 from ignition_toolkit.credentials import CredentialVault
 from ignition_toolkit.storage import get_database
@@ -326,12 +327,11 @@ async def _get_executions_summary(limit: int = 10, include_steps: bool = False)
         with db.session_scope() as session:
             from ignition_toolkit.storage.models import ExecutionModel
 
-            db_executions = (
-                session.query(ExecutionModel)
-                .order_by(ExecutionModel.started_at.desc())
-                .limit(limit)
-                .all()
-            )
+            query = session.query(ExecutionModel)
+            if include_steps:
+                # Load every listed execution's steps in one extra query
+                query = query.options(selectinload(ExecutionModel.step_results))
+            db_executions = query.order_by(ExecutionModel.started_at.desc()).limit(limit).all()
 
             for db_exec in db_executions:
                 step_results = []
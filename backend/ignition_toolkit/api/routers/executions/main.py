@@ -9,6 +9,7 @@ from datetime import datetime
 
 import yaml
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy.orm import selectinload
 
 from ignition_toolkit.api.routers.executions.helpers import (
     DEFAULT_EXECUTION_LIST_LIMIT,
@@ -116,7 +117,12 @@ async def list_executions(limit: int = DEFAULT_EXECUTION_LIST_LIMIT, status: str
         with db.session_scope() as session:
             from ignition_toolkit.storage.models import ExecutionModel
 
-            query = session.query(ExecutionModel).order_by(ExecutionModel.started_at.desc())
+            # Load every listed execution's steps in one extra query, not one per execution
+            query = (
+                session.query(ExecutionModel)
+                .options(selectinload(ExecutionModel.step_results))
+                .order_by(ExecutionModel.started_at.desc())
+            )
 
             if status:
                 query = query.filter(ExecutionModel.status == status)
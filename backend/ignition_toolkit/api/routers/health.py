@@ -16,9 +16,10 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
 
 from ignition_toolkit import __version__
-from ignition_toolkit.startup.health import HealthStatus, get_health_state
+from ignition_toolkit.startup.health import HealthStatus, get_health_payload, get_health_state
 from ignition_toolkit.storage import get_database
 
 logger = logging.getLogger(__name__)
@@ -95,7 +96,7 @@ async def readiness_probe(response: Response) -> dict[str, Any]:
 
 
 @router.get("/detailed")
-async def detailed_health(response: Response) -> dict[str, Any]:
+async def detailed_health() -> Response:
     """
     Detailed health check with component-level information
 
@@ -112,10 +113,12 @@ async def detailed_health(response: Response) -> dict[str, Any]:
     health = get_health_state()
 
     # Return 503 if unhealthy
-    if health.overall == HealthStatus.UNHEALTHY:
-        response.status_code = 503
+    status_code = 503 if health.overall == HealthStatus.UNHEALTHY else 200
 
-    return health.to_dict()
+    # Serve pre-encoded JSON so probes skip FastAPI's response encoding
+    return Response(
+        content=get_health_payload(), status_code=status_code, media_type="application/json"
+    )
 
 
 @router.get("/database")
@@ -314,6 +317,7 @@ async def cleanup_old_data(request: CleanupRequest) -> dict[str, Any]:
             # Find old executions
             old_executions = (
                 session.query(ExecutionModel)
+                .options(selectinload(ExecutionModel.step_results))
                 .filter(ExecutionModel.started_at < cutoff_date)
                 .all()
             )
@@ -0,0 +1,138 @@
+"""
+JSON encoding and decoding
+
+Uses orjson, a declared dependency, for speed. The stdlib json module is the
+fallback for environments where the orjson wheel cannot be installed, and
+for any value orjson cannot encode the way json.dumps would, so both paths
+accept the same values and produce JSON that decodes to the same values.
+The exceptions are uuid.UUID and plain Enum members, which orjson encodes
+natively and json.dumps rejects.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hand datetimes, dataclasses and subclasses of builtin types back as TypeError,
+# so json.dumps decides how (or whether) to encode them
+_PASSTHROUGH = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """
+    Check a JSON-like value for NaN or Infinity floats
+
+    Called for every orjson output that contains null, so containers are
+    matched by exact type. Subclasses of dict and list are passed through to
+    json.dumps and never get here.
+    """
+    kind = type(value)
+    if kind is dict:
+        value = value.values()
+    elif kind is not list and kind is not tuple:
+        return isinstance(value, float) and not math.isfinite(value)
+    for item in value:
+        kind = type(item)
+        if kind is dict or kind is list or kind is tuple:
+            if _has_non_finite(item):
+                return True
+        elif kind is float or isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+    return False
+
+
+def _orjson_dumps(value: Any, option: int) -> bytes | None:
+    """
+    Encode with orjson, or return None when the value needs json.dumps
+
+    orjson raises TypeError for integers beyond 64 bits, non-str dict keys
+    and the passthrough types, all of which json.dumps handles or rejects
+    itself. orjson also writes NaN and Infinity as null, which would lose
+    them; json.dumps keeps them. Non-finite floats encode as null, so the
+    value is only searched when the output contains one.
+    """
+    try:
+        encoded = orjson.dumps(value, option=option | _PASSTHROUGH)
+    except TypeError:
+        return None
+    if b"null" in encoded and _has_non_finite(value):
+        return None
+    return encoded
+
+
+def dumps(value: Any, *, indent: bool = False) -> str:
+    """
+    Encode a value as JSON text
+
+    Non-str dict keys are written as strings, and NaN/Infinity as bare
+    NaN/Infinity tokens, as json.dumps does.
+
+    Args:
+        value: JSON-serializable value
+        indent: Indent nested values by two spaces
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If json.dumps cannot encode the value either
+    """
+    if orjson is not None:
+        encoded = _orjson_dumps(value, orjson.OPT_INDENT_2 if indent else 0)
+        if encoded is not None:
+            return encoded.decode("utf-8")
+    return json.dumps(value, indent=2 if indent else None)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Encode a value as UTF-8 JSON, e.g. for a raw HTTP response body
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If json.dumps cannot encode the value either
+    """
+    if orjson is not None:
+        encoded = _orjson_dumps(value, 0)
+        if encoded is not None:
+            return encoded
+    return json.dumps(value).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decode JSON text
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dumps writes NaN/Infinity, which orjson rejects; let json decide
+            pass
+    return json.loads(data)
@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import insert
+
 from ignition_toolkit.browser import BrowserManager
 from ignition_toolkit.credentials import CredentialVault
 from ignition_toolkit.designer import DesignerManager
@@ -803,19 +805,24 @@ class PlaybookEngine:
                 session.add(execution_model)
                 session.flush()  # Get the auto-generated ID
 
-                # Save initial pending steps to database
-                for step_result in execution_state.step_results:
-                    step_model = StepResultModel(
-                        execution_id=execution_model.id,
-                        step_id=step_result.step_id,
-                        step_name=step_result.step_name,
-                        status=step_result.status.value,
-                        started_at=step_result.started_at,
-                        completed_at=step_result.completed_at,
-                        error_message=step_result.error,
-                        output=step_result.output,
+                # Save initial pending steps in one multi-row INSERT
+                if execution_state.step_results:
+                    session.execute(
+                        insert(StepResultModel),
+                        [
+                            {
+                                "execution_id": execution_model.id,
+                                "step_id": step_result.step_id,
+                                "step_name": step_result.step_name,
+                                "status": step_result.status.value,
+                                "started_at": step_result.started_at,
+                                "completed_at": step_result.completed_at,
+                                "error_message": step_result.error,
+                                "output": step_result.output,
+                            }
+                            for step_result in execution_state.step_results
+                        ],
                     )
-                    session.add(step_model)
 
                 # Store the database ID for later queries
                 execution_state.db_execution_id = execution_model.id
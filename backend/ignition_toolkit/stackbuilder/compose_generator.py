@@ -7,7 +7,6 @@ Generates docker-compose.yml and related configuration files.
 from __future__ import annotations
 
 import io
-import json
 import logging
 import zipfile
 from typing import Any
@@ -40,6 +39,7 @@ from ignition_toolkit.stackbuilder.integration_engine import get_integration_eng
 from ignition_toolkit.stackbuilder.keycloak_generator import (
     generate_keycloak_readme_section,
     generate_keycloak_realm,
+    serialize_keycloak_realm,
 )
 
 logger = logging.getLogger(__name__)
@@ -814,7 +814,7 @@ class ComposeGenerator:
         # Keycloak Realm Configuration
         if keycloak_realm_config:
             realm_name = integration_settings.oauth.get("realm_name", "iiot")
-            realm_json = json.dumps(keycloak_realm_config, indent=2)
+            realm_json = serialize_keycloak_realm(keycloak_realm_config)
             config_files[f"configs/keycloak/import/realm-{realm_name}.json"] = realm_json
 
     def _generate_ignition_startup_scripts(self, stack_name: str) -> dict[str, str]:
@@ -6,11 +6,108 @@ Generates config files for MQTT, Grafana datasources, Traefik, etc.
 
 import base64
 import hashlib
+import json
 import os
+import re
 import secrets
+from string import Template
 from typing import Any
 
-import yaml
+# Strings matching this pattern are emitted as plain (unquoted) YAML scalars
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9_./:@-]*\Z")
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+# Fixed-schema YAML templates for the Grafana datasource provisioning file
+_PROMETHEUS_DATASOURCE_YAML = Template(
+    """- name: Prometheus
+  type: prometheus
+  access: proxy
+  url: $url
+  isDefault: $is_default
+  editable: true
+"""
+)
+
+_POSTGRES_DATASOURCE_YAML = Template(
+    """- name: $name
+  type: postgres
+  access: proxy
+  url: $url
+  database: $database
+  user: $user
+  secureJsonData:
+    password: $password
+  jsonData:
+    sslmode: disable
+    postgresVersion: 1400
+  editable: true
+"""
+)
+
+_MYSQL_DATASOURCE_YAML = Template(
+    """- name: $name
+  type: mysql
+  access: proxy
+  url: $url
+  database: $database
+  user: $user
+  secureJsonData:
+    password: $password
+  editable: true
+"""
+)
+
+# Fixed-schema YAML templates for the Traefik dynamic configuration file
+_TRAEFIK_ROUTER_YAML = Template(
+    """    $router_name:
+      rule: $rule
+      service: $service
+      entryPoints:
+      - $entry_point
+"""
+)
+
+_TRAEFIK_ROUTER_TLS_YAML = """      tls:
+        certResolver: letsencrypt
+"""
+
+_TRAEFIK_SERVICE_YAML = Template(
+    """    $service:
+      loadBalancer:
+        servers:
+        - url: $url
+"""
+)
+
+
+def _yaml_scalar(value: Any) -> str:
+    """
+    Render a scalar value for insertion into a hand-built YAML template.
+
+    Simple identifiers, hostnames and URLs are emitted plain; anything else
+    is emitted as a double-quoted (JSON-compatible) YAML string.
+
+    Args:
+        value: Scalar value to render
+
+    Returns:
+        YAML representation of the value
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+
+    text = str(value)
+    if (
+        _YAML_PLAIN_RE.match(text)
+        and not text.endswith(":")
+        and text.lower() not in _YAML_RESERVED_WORDS
+    ):
+        return text
+    return json.dumps(text)
 
 
 def generate_secure_password(length: int = 16) -> str:
@@ -147,6 +244,8 @@ def generate_emqx_config(
     Returns:
         YAML configuration string for EMQX authentication
     """
+    import yaml  # Deferred: only the YAML-emitting generators need it
+
     config: dict[str, Any] = {"authentication": []}
 
     if username and password:
@@ -173,7 +272,7 @@ def generate_grafana_datasources(datasources: list[dict[str, Any]]) -> str:
     Returns:
         YAML provisioning configuration for Grafana datasources
     """
-    provisioning: dict[str, Any] = {"apiVersion": 1, "datasources": []}
+    parts: list[str] = []
 
     for idx, ds in enumerate(datasources):
         ds_type = ds.get("type")
@@ -181,51 +280,40 @@ def generate_grafana_datasources(datasources: list[dict[str, Any]]) -> str:
         config = ds.get("config", {})
 
         if ds_type == "prometheus":
-            provisioning["datasources"].append({
-                "name": "Prometheus",
-                "type": "prometheus",
-                "access": "proxy",
-                "url": f"http://{instance_name}:9090",
-                "isDefault": idx == 0,
-                "editable": True,
-            })
+            parts.append(
+                _PROMETHEUS_DATASOURCE_YAML.substitute(
+                    url=_yaml_scalar(f"http://{instance_name}:9090"),
+                    is_default=_yaml_scalar(idx == 0),
+                )
+            )
 
         elif ds_type == "postgres":
-            db_name = config.get("database", "postgres")
-            db_user = config.get("username", "postgres")
-            db_password = config.get("password", "postgres")
             port = config.get("port", 5432)
-
-            provisioning["datasources"].append({
-                "name": f"PostgreSQL-{instance_name}",
-                "type": "postgres",
-                "access": "proxy",
-                "url": f"{instance_name}:{port}",
-                "database": db_name,
-                "user": db_user,
-                "secureJsonData": {"password": db_password},
-                "jsonData": {"sslmode": "disable", "postgresVersion": 1400},
-                "editable": True,
-            })
+            parts.append(
+                _POSTGRES_DATASOURCE_YAML.substitute(
+                    name=_yaml_scalar(f"PostgreSQL-{instance_name}"),
+                    url=_yaml_scalar(f"{instance_name}:{port}"),
+                    database=_yaml_scalar(config.get("database", "postgres")),
+                    user=_yaml_scalar(config.get("username", "postgres")),
+                    password=_yaml_scalar(config.get("password", "postgres")),
+                )
+            )
 
         elif ds_type in ("mysql", "mariadb"):
-            db_name = config.get("database", "mysql")
-            db_user = config.get("username", "root")
-            db_password = config.get("password", "password")
             port = config.get("port", 3306)
+            parts.append(
+                _MYSQL_DATASOURCE_YAML.substitute(
+                    name=_yaml_scalar(f"MySQL-{instance_name}"),
+                    url=_yaml_scalar(f"{instance_name}:{port}"),
+                    database=_yaml_scalar(config.get("database", "mysql")),
+                    user=_yaml_scalar(config.get("username", "root")),
+                    password=_yaml_scalar(config.get("password", "password")),
+                )
+            )
 
-            provisioning["datasources"].append({
-                "name": f"MySQL-{instance_name}",
-                "type": "mysql",
-                "access": "proxy",
-                "url": f"{instance_name}:{port}",
-                "database": db_name,
-                "user": db_user,
-                "secureJsonData": {"password": db_password},
-                "editable": True,
-            })
-
-    return yaml.dump(provisioning, default_flow_style=False, sort_keys=False)
+    if not parts:
+        return "apiVersion: 1\ndatasources: []\n"
+    return "apiVersion: 1\ndatasources:\n" + "".join(parts)
 
 
 def generate_traefik_static_config(
@@ -244,6 +332,8 @@ def generate_traefik_static_config(
     Returns:
         YAML configuration string for Traefik
     """
+    import yaml  # Deferred: only the YAML-emitting generators need it
+
     # Dashboard is enabled but secured (requires auth middleware)
     # For development, access via: traefik:8080 from within Docker network
     # For production, configure basicAuth or forwardAuth middleware
@@ -299,7 +389,9 @@ def generate_traefik_dynamic_config(
     Returns:
         YAML configuration string for Traefik dynamic routing
     """
-    config: dict[str, Any] = {"http": {"routers": {}, "services": {}}}
+    # Keyed by name so a repeated instance replaces its earlier entry
+    routers: dict[str, str] = {}
+    lb_services: dict[str, str] = {}
 
     for svc in services:
         instance_name = svc["instance_name"]
@@ -308,23 +400,28 @@ def generate_traefik_dynamic_config(
 
         # Router configuration
         router_name = f"{instance_name}-router"
-        config["http"]["routers"][router_name] = {
-            "rule": f"Host(`{subdomain}.{domain}`)",
-            "service": instance_name,
-            "entryPoints": ["websecure" if enable_https else "web"],
-        }
-
+        router = _TRAEFIK_ROUTER_YAML.substitute(
+            router_name=_yaml_scalar(router_name),
+            rule=_yaml_scalar(f"Host(`{subdomain}.{domain}`)"),
+            service=_yaml_scalar(instance_name),
+            entry_point="websecure" if enable_https else "web",
+        )
         if enable_https:
-            config["http"]["routers"][router_name]["tls"] = {
-                "certResolver": "letsencrypt"
-            }
+            router += _TRAEFIK_ROUTER_TLS_YAML
+        routers[router_name] = router
 
         # Service configuration
-        config["http"]["services"][instance_name] = {
-            "loadBalancer": {"servers": [{"url": f"http://{instance_name}:{port}"}]}
-        }
-
-    return yaml.dump(config, default_flow_style=False, sort_keys=False)
+        lb_services[instance_name] = _TRAEFIK_SERVICE_YAML.substitute(
+            service=_yaml_scalar(instance_name),
+            url=_yaml_scalar(f"http://{instance_name}:{port}"),
+        )
+
+    parts = ["http:\n"]
+    parts.append("  routers:\n" if routers else "  routers: {}\n")
+    parts.extend(routers.values())
+    parts.append("  services:\n" if lb_services else "  services: {}\n")
+    parts.extend(lb_services.values())
+    return "".join(parts)
 
 
 def generate_oauth_env_vars(
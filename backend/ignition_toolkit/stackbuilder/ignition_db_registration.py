@@ -5,89 +5,39 @@ Creates Python scripts to automatically register databases in Ignition Gateway
 using the Gateway REST API.
 """
 
-import json
+import string
 from typing import Any
 
 
-def generate_ignition_db_registration_script(
-    ignition_host: str,
-    ignition_port: int,
-    admin_username: str,
-    admin_password: str,
-    databases: list[dict[str, Any]],
-) -> str:
-    """
-    Generate a Python script that auto-registers databases in Ignition Gateway
-
-    Args:
-        ignition_host: Ignition Gateway hostname
-        ignition_port: Ignition Gateway HTTP port
-        admin_username: Gateway admin username
-        admin_password: Gateway admin password
-        databases: List of database configurations
-
-    Returns:
-        Complete Python script as string
-    """
-    # Build database connection configurations
-    db_configs = []
-    for db in databases:
-        db_type = db.get("type")
-        instance_name = db.get("instance_name")
-        config = db.get("config", {})
-
-        if db_type == "postgres":
-            jdbc_url = f"jdbc:postgresql://{instance_name}:{config.get('port', 5432)}/{config.get('database', 'postgres')}"
-            driver = "org.postgresql.Driver"
-            username = config.get("username", "postgres")
-            password = config.get("password", "postgres")
-            validation_query = "SELECT 1"
-
-        elif db_type in ["mariadb", "mysql"]:
-            jdbc_url = f"jdbc:mysql://{instance_name}:{config.get('port', 3306)}/{config.get('database', 'mysql')}"
-            driver = "com.mysql.cj.jdbc.Driver"
-            username = config.get("username", "root")
-            password = config.get("password", "password")
-            validation_query = "SELECT 1"
-
-        elif db_type == "mssql":
-            jdbc_url = f"jdbc:sqlserver://{instance_name}:{config.get('port', 1433)}"
-            driver = "com.microsoft.sqlserver.jdbc.SQLServerDriver"
-            username = config.get("username", "sa")
-            password = config.get("sa_password", "YourStrong!Passw0rd")
-            validation_query = "SELECT 1"
-
-        else:
-            continue
-
-        db_configs.append(
-            {
-                "name": f"{db_type.upper()}-{instance_name}",
-                "jdbc_url": jdbc_url,
-                "driver": driver,
-                "username": username,
-                "password": password,
-                "validation_query": validation_query,
-            }
-        )
-
-    script = f'''#!/usr/bin/env python3
+# Registration script source; only the configuration constants vary per stack
+_REGISTRATION_SCRIPT = string.Template(
+    '''#!/usr/bin/env python3
 """
 Ignition Gateway Database Auto-Registration Script
 Automatically configures database connections in Ignition Gateway
 """
 import requests
+import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Configuration
-GATEWAY_URL = "http://{ignition_host}:{ignition_port}"
-ADMIN_USERNAME = "{admin_username}"
-ADMIN_PASSWORD = "{admin_password}"
+GATEWAY_URL = "http://$IGNITION_HOST:$IGNITION_PORT"
+ADMIN_USERNAME = "$ADMIN_USERNAME"
+ADMIN_PASSWORD = "$ADMIN_PASSWORD"
 
 # Database configurations
-DATABASES = {json.dumps(db_configs, indent=4)}
+DATABASES = $DATABASES
+
+# Keep-alive pool shared by all Gateway requests
+POOL_CONNECTIONS = 2
+POOL_MAXSIZE = 8
+MAX_WORKERS = min(POOL_MAXSIZE, max(1, len(DATABASES)))
 
 # ANSI color codes
 GREEN = '\\033[92m'
@@ -96,26 +46,34 @@ RED = '\\033[91m'
 BLUE = '\\033[94m'
 RESET = '\\033[0m'
 
+# Databases register concurrently; keep their output lines whole
+OUTPUT_LOCK = threading.Lock()
+
+
+def emit(line=""):
+    with OUTPUT_LOCK:
+        print(line)
+
 
 def log_info(message):
-    print(f"{{BLUE}}[INFO]{{RESET}} {{message}}")
+    emit(f"{BLUE}[INFO]{RESET} {message}")
 
 
 def log_success(message):
-    print(f"{{GREEN}}[SUCCESS]{{RESET}} {{message}}")
+    emit(f"{GREEN}[SUCCESS]{RESET} {message}")
 
 
 def log_warning(message):
-    print(f"{{YELLOW}}[WARNING]{{RESET}} {{message}}")
+    emit(f"{YELLOW}[WARNING]{RESET} {message}")
 
 
 def log_error(message):
-    print(f"{{RED}}[ERROR]{{RESET}} {{message}}")
+    emit(f"{RED}[ERROR]{RESET} {message}")
 
 
 def wait_for_gateway(max_wait=300):
     """Wait for Ignition Gateway to be ready"""
-    log_info(f"Waiting for Ignition Gateway at {{GATEWAY_URL}}...")
+    log_info(f"Waiting for Ignition Gateway at {GATEWAY_URL}...")
 
     start_time = time.time()
     while (time.time() - start_time) < max_wait:
@@ -132,7 +90,7 @@ def wait_for_gateway(max_wait=300):
 
         time.sleep(5)
         elapsed = int(time.time() - start_time)
-        log_info(f"Still waiting... ({{elapsed}}s/{{max_wait}}s)")
+        log_info(f"Still waiting... ({elapsed}s/{max_wait}s)")
 
     log_error("Gateway did not become ready in time")
     return False
@@ -141,15 +99,27 @@ def wait_for_gateway(max_wait=300):
 def get_gateway_session():
     """Create an authenticated session with the Gateway"""
     session = requests.Session()
+
+    # Reuse pooled keep-alive connections and retry transient gateway errors.
+    # Retry leaves POST out by default, so a create that reached the Gateway
+    # is never sent twice.
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
     login_url = urljoin(GATEWAY_URL, "/data/login")
 
     try:
         response = session.post(
             login_url,
-            json={{
+            json={
                 "username": ADMIN_USERNAME,
                 "password": ADMIN_PASSWORD
-            }},
+            },
             timeout=10
         )
 
@@ -157,11 +127,11 @@ def get_gateway_session():
             log_success("Successfully authenticated with Gateway")
             return session
         else:
-            log_error(f"Authentication failed: {{response.status_code}}")
+            log_error(f"Authentication failed: {response.status_code}")
             return None
 
     except requests.exceptions.RequestException as e:
-        log_error(f"Failed to authenticate: {{e}}")
+        log_error(f"Failed to authenticate: {e}")
         return None
 
 
@@ -178,7 +148,7 @@ def check_connection_exists(session, connection_name):
             return any(conn.get("name") == connection_name for conn in connections)
 
     except Exception as e:
-        log_warning(f"Could not check existing connections: {{e}}")
+        log_warning(f"Could not check existing connections: {e}")
 
     return False
 
@@ -187,15 +157,15 @@ def create_database_connection(session, db_config):
     """Create a database connection in Ignition"""
     connection_name = db_config["name"]
 
-    log_info(f"Creating database connection: {{connection_name}}")
+    log_info(f"Creating database connection: {connection_name}")
 
     if check_connection_exists(session, connection_name):
-        log_warning(f"Connection '{{connection_name}}' already exists, skipping")
+        log_warning(f"Connection '{connection_name}' already exists, skipping")
         return True
 
-    payload = {{
+    payload = {
         "name": connection_name,
-        "description": f"Auto-configured connection to {{connection_name}}",
+        "description": f"Auto-configured connection to {connection_name}",
         "enabled": True,
         "jdbcUrl": db_config["jdbc_url"],
         "driverClassName": db_config["driver"],
@@ -211,7 +181,7 @@ def create_database_connection(session, db_config):
         "testConnOnReturn": False,
         "testConnWhileIdle": True,
         "idleConnectionTestPeriod": 60000,
-    }}
+    }
 
     try:
         response = session.post(
@@ -221,15 +191,15 @@ def create_database_connection(session, db_config):
         )
 
         if response.status_code in [200, 201]:
-            log_success(f"Created connection: {{connection_name}}")
+            log_success(f"Created connection: {connection_name}")
             return True
         else:
-            log_error(f"Failed to create connection: {{response.status_code}}")
-            log_error(f"Response: {{response.text}}")
+            log_error(f"Failed to create connection: {response.status_code}")
+            log_error(f"Response: {response.text}")
             return False
 
     except requests.exceptions.RequestException as e:
-        log_error(f"Exception creating connection: {{e}}")
+        log_error(f"Exception creating connection: {e}")
         return False
 
 
@@ -250,31 +220,33 @@ def main():
         sys.exit(1)
 
     print()
-    log_info(f"Configuring {{len(DATABASES)}} database connection(s)...")
+    log_info(f"Configuring {len(DATABASES)} database connection(s)...")
     print()
 
-    success_count = 0
-    failed_count = 0
+    def register(db_config):
+        created = create_database_connection(session, db_config)
+        emit()
+        return created
 
-    for db_config in DATABASES:
-        if create_database_connection(session, db_config):
-            success_count += 1
-        else:
-            failed_count += 1
-        print()
+    # Connection creation is I/O bound, so register databases concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(register, DATABASES))
+
+    success_count = sum(1 for ok in results if ok)
+    failed_count = len(results) - success_count
 
     print("=" * 60)
     print("Summary")
     print("=" * 60)
-    log_success(f"Successfully configured: {{success_count}}")
+    log_success(f"Successfully configured: {success_count}")
     if failed_count > 0:
-        log_error(f"Failed: {{failed_count}}")
+        log_error(f"Failed: {failed_count}")
 
     print()
     log_info("Database auto-registration complete!")
     print()
     print("Next steps:")
-    print(f"  1. Open Ignition Gateway: {{GATEWAY_URL}}")
+    print(f"  1. Open Ignition Gateway: {GATEWAY_URL}")
     print("  2. Go to Config -> Databases -> Connections")
     print("  3. Verify connections are listed and enabled")
     print()
@@ -285,8 +257,91 @@ def main():
 if __name__ == "__main__":
     main()
 '''
+)
+
+
+# JDBC connection details and config defaults per supported database type
+_MYSQL_SPEC: dict[str, Any] = {
+    "jdbc_url": "jdbc:mysql://{host}:{port}/{database}",
+    "driver": "com.mysql.cj.jdbc.Driver",
+    "password_key": "password",
+    "defaults": {"port": 3306, "database": "mysql", "username": "root", "password": "password"},
+}
+
+_DB_SPECS: dict[str, dict[str, Any]] = {
+    "postgres": {
+        "jdbc_url": "jdbc:postgresql://{host}:{port}/{database}",
+        "driver": "org.postgresql.Driver",
+        "password_key": "password",
+        "defaults": {
+            "port": 5432,
+            "database": "postgres",
+            "username": "postgres",
+            "password": "postgres",
+        },
+    },
+    "mariadb": _MYSQL_SPEC,
+    "mysql": _MYSQL_SPEC,
+    "mssql": {
+        "jdbc_url": "jdbc:sqlserver://{host}:{port}",
+        "driver": "com.microsoft.sqlserver.jdbc.SQLServerDriver",
+        "password_key": "sa_password",
+        "defaults": {"port": 1433, "username": "sa", "sa_password": "YourStrong!Passw0rd"},
+    },
+}
 
-    return script
+
+def generate_ignition_db_registration_script(
+    ignition_host: str,
+    ignition_port: int,
+    admin_username: str,
+    admin_password: str,
+    databases: list[dict[str, Any]],
+) -> str:
+    """
+    Generate a Python script that auto-registers databases in Ignition Gateway
+
+    Args:
+        ignition_host: Ignition Gateway hostname
+        ignition_port: Ignition Gateway HTTP port
+        admin_username: Gateway admin username
+        admin_password: Gateway admin password
+        databases: List of database configurations
+
+    Returns:
+        Complete Python script as string
+    """
+    import json  # Deferred: only needed when a script is actually generated
+
+    # Build database connection configurations
+    db_configs = []
+    for db in databases:
+        db_type = db.get("type")
+        spec = _DB_SPECS.get(db_type)
+        if spec is None:
+            continue
+
+        instance_name = db.get("instance_name")
+        settings = {**spec["defaults"], **db.get("config", {})}
+
+        db_configs.append(
+            {
+                "name": f"{db_type.upper()}-{instance_name}",
+                "jdbc_url": spec["jdbc_url"].format(**{**settings, "host": instance_name}),
+                "driver": spec["driver"],
+                "username": settings["username"],
+                "password": settings[spec["password_key"]],
+                "validation_query": "SELECT 1",
+            }
+        )
+
+    return _REGISTRATION_SCRIPT.substitute(
+        IGNITION_HOST=ignition_host,
+        IGNITION_PORT=ignition_port,
+        ADMIN_USERNAME=admin_username,
+        ADMIN_PASSWORD=admin_password,
+        DATABASES=json.dumps(db_configs, indent=4),
+    )
 
 
 def generate_requirements_file() -> str:
@@ -296,9 +351,8 @@ requests>=2.31.0
 """
 
 
-def generate_ignition_db_readme_section(databases: list[dict[str, Any]]) -> str:
-    """Generate README section for Ignition database auto-registration"""
-    content = """
+# README fragments for the auto-registration section
+_README_HEADER = """
 ## Ignition Database Auto-Registration
 
 Your Ignition Gateway can be configured with automatic database registration.
@@ -316,21 +370,18 @@ The following databases will be automatically registered:
 
 """
 
-    for db in databases:
-        db_type = db.get("type", "").upper()
-        instance_name = db.get("instance_name")
-        config = db.get("config", {})
-
-        content += f"""
-#### {db_type} - {instance_name}
-- **Connection Name:** `{db_type}-{instance_name}`
-- **Host:** `{instance_name}`
-- **Port:** `{config.get('port', 'N/A')}`
-- **Database:** `{config.get('database', 'N/A')}`
-- **Username:** `{config.get('username', 'N/A')}`
+_README_DB_BLOCK = string.Template(
+    """
+#### $TYPE - $NAME
+- **Connection Name:** `$TYPE-$NAME`
+- **Host:** `$NAME`
+- **Port:** `$PORT`
+- **Database:** `$DB`
+- **Username:** `$USER`
 """
+)
 
-    content += """
+_README_FOOTER = """
 ### Running the Registration Script
 
 ```bash
@@ -357,4 +408,20 @@ python3 scripts/register_databases.py
 - Ensure database accepts connections from Docker network
 """
 
-    return content
+
+def generate_ignition_db_readme_section(databases: list[dict[str, Any]]) -> str:
+    """Generate README section for Ignition database auto-registration"""
+    blocks = []
+    for db in databases:
+        config = db.get("config", {})
+        blocks.append(
+            _README_DB_BLOCK.substitute(
+                TYPE=db.get("type", "").upper(),
+                NAME=db.get("instance_name"),
+                PORT=config.get("port", "N/A"),
+                DB=config.get("database", "N/A"),
+                USER=config.get("username", "N/A"),
+            )
+        )
+
+    return _README_HEADER + "".join(blocks) + _README_FOOTER
@@ -5,35 +5,146 @@ Handles automatic service integration detection and configuration generation.
 Ported from ignition-stack-builder project.
 """
 
+import copy
 import json
 import logging
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Detection handler signature: (providers, selected_services, instances_by_app) -> integration
+_Detector = Callable[[list[str], Iterable[str], dict[str, dict]], dict]
+
+# Config-derived attributes cached on first access
+_CACHED_ATTRS = (
+    "integrations",
+    "integration_types",
+    "service_capabilities",
+    "integration_rules",
+    "config_templates",
+    "_svc_integration",
+    "_type_providers_set",
+    "_service_to_types",
+    "_type_auto_targets",
+    "_exclusivity_rules",
+    "_recommendation_rules",
+    "_traefik_label_templates",
+)
+
+# Keys read from each integration capability during detection, with their defaults
+_CAPABILITY_DEFAULTS: dict[str, dict[str, Any]] = {
+    "reverse_proxy": {"method": "docker_labels", "ports": [], "health_check": None},
+    "oauth_provider": {"type": None, "supports": [], "env_vars": {}, "client_configs": {}},
+    "db_provider": {
+        "type": None,
+        "supports": [],
+        "auto_register": False,
+        "jdbc_drivers": {},
+        "jdbc_url_template": None,
+        "default_port": None,
+    },
+    "mqtt_broker": {
+        "type": None,
+        "supports": [],
+        "requires_module": None,
+        "config_file": None,
+        "mqtt_port": 1883,
+        "ws_port": None,
+    },
+    "visualization": {"datasource_types": {}},
+    "email_testing": {"type": None, "env_vars": {}},
+}
+
+# Shared read-only default for lookups whose result is only read, never returned
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Maximum number of memoized detect_integrations results per engine
+_DETECTION_CACHE_SIZE = 128
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a JSON-like value into a hashable, type-preserving cache key"""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy the dicts and lists of a detection result; leaves are shared, not copied"""
+    if isinstance(value, dict):
+        return {k: _copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=8)
+def _load_integrations_cached(path: str, mtime: float) -> dict[str, Any]:
+    """
+    Parse an integrations file, shared across engine instances
+
+    The file's mtime is part of the cache key so an edited file is re-parsed.
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
 
 class IntegrationEngine:
     """Core engine for managing service integrations"""
 
-    def __init__(self, integrations_path: Path | None = None):
+    def __init__(
+        self,
+        integrations_path: Path | None = None,
+        eager: bool = False,
+        auto_reload: bool = False,
+    ):
         """
         Initialize the integration engine
 
         Args:
             integrations_path: Path to integrations.json. If None, uses default.
+            eager: Load and preprocess integrations.json now instead of on first use
+            auto_reload: Check integrations.json for edits before each detection
         """
         if integrations_path is None:
             integrations_path = Path(__file__).parent / "data" / "integrations.json"
 
         self.integrations_path = integrations_path
-        self._integrations: dict[str, Any] | None = None
+        self.auto_reload = auto_reload
+
+        # mtime of integrations.json when it was last loaded (None if missing)
+        self._mtime_at_load: float | None = None
+
+        # Memoized detect_integrations results, least recently used first
+        self._detection_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+
+        # Detection handler per integration type
+        self._detectors: Mapping[str, _Detector] = MappingProxyType({
+            "reverse_proxy": self._detect_reverse_proxy_single,
+            "oauth_provider": self._detect_oauth,
+            "db_provider": self._detect_database,
+            "mqtt_broker": self._detect_mqtt,
+            "visualization": self._detect_visualization,
+            "email_testing": self._detect_email,
+        })
+
+        if eager:
+            self._preload()
 
     def _load_integrations(self) -> dict[str, Any]:
         """Load integrations configuration from JSON file"""
+        self._mtime_at_load = None
         try:
-            with open(self.integrations_path, encoding='utf-8') as f:
-                return json.load(f)
+            mtime = self.integrations_path.stat().st_mtime
+            self._mtime_at_load = mtime
+            return _load_integrations_cached(str(self.integrations_path), mtime)
         except FileNotFoundError:
             logger.error(f"Integrations file not found: {self.integrations_path}")
             return {}
@@ -41,39 +152,180 @@ class IntegrationEngine:
             logger.error(f"Error parsing integrations file: {e}")
             return {}
 
-    @property
+    @cached_property
     def integrations(self) -> dict[str, Any]:
-        """Get integrations config (lazy-loaded)"""
-        if self._integrations is None:
-            self._integrations = self._load_integrations()
-        return self._integrations
+        """Get integrations config (loaded on first access)"""
+        return self._load_integrations()
 
-    @property
+    @cached_property
     def integration_types(self) -> dict[str, Any]:
         return self.integrations.get("integration_types", {})
 
-    @property
+    @cached_property
     def service_capabilities(self) -> dict[str, Any]:
         return self.integrations.get("service_capabilities", {})
 
-    @property
+    @cached_property
     def integration_rules(self) -> dict[str, Any]:
         return self.integrations.get("integration_rules", {})
 
-    @property
+    @cached_property
     def config_templates(self) -> dict[str, Any]:
         return self.integrations.get("config_templates", {})
 
+    # Lookup structures derived from integrations.json, built once on first use
+
+    @cached_property
+    def _svc_integration(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Flat (service_id, integration_type) -> capability map with defaults filled in"""
+        table: dict[tuple[str, str], dict[str, Any]] = {}
+        for service_id, caps in self.service_capabilities.items():
+            for integration_type, capability in caps.get("integrations", _EMPTY).items():
+                # Empty capabilities behave exactly like missing ones
+                if not capability:
+                    continue
+                # Fill defaults so detection can index keys directly
+                defaults = copy.deepcopy(_CAPABILITY_DEFAULTS.get(integration_type, {}))
+                table[(service_id, integration_type)] = {**defaults, **capability}
+        return table
+
+    @cached_property
+    def _type_providers_set(self) -> dict[str, frozenset[str]]:
+        return {
+            integration_type: frozenset(type_config.get("providers", []))
+            for integration_type, type_config in self.integration_types.items()
+        }
+
+    @cached_property
+    def _service_to_types(self) -> dict[str, tuple[str, ...]]:
+        """Integration types each service provides, in integration_types order"""
+        mapping: dict[str, list[str]] = {}
+        for integration_type, type_config in self.integration_types.items():
+            for service_id in dict.fromkeys(type_config.get("providers", [])):
+                mapping.setdefault(service_id, []).append(integration_type)
+        return {service_id: tuple(types) for service_id, types in mapping.items()}
+
+    @cached_property
+    def _type_auto_targets(self) -> dict[str, frozenset[str]]:
+        return {
+            integration_type: frozenset(type_config.get("auto_configure_targets", []))
+            for integration_type, type_config in self.integration_types.items()
+        }
+
+    @cached_property
+    def _traefik_label_templates(self) -> dict[bool, tuple[str, ...]]:
+        """Label templates per HTTPS flag"""
+        templates = self.config_templates
+        return {
+            False: tuple(templates.get("traefik_label", [])),
+            True: tuple(templates.get("traefik_https_label", [])),
+        }
+
+    @cached_property
+    def _exclusivity_rules(self) -> list[tuple[dict[str, Any], frozenset[str]]]:
+        return [
+            (rule, frozenset(rule["services"]))
+            for rule in self.integration_rules.get("mutual_exclusivity", [])
+        ]
+
+    @cached_property
+    def _recommendation_rules(self) -> list[tuple[dict[str, Any], frozenset[str], frozenset[str]]]:
+        return [
+            (
+                rule,
+                frozenset(rule.get("if_selected", [])),
+                frozenset(rule.get("if_not_selected", [])),
+            )
+            for rule in self.integration_rules.get("recommendations", [])
+        ]
+
+    def _preload(self) -> None:
+        """Resolve the config and every derived lookup structure up front"""
+        for name in _CACHED_ATTRS:
+            getattr(self, name)
+
+    def maybe_reload(self) -> bool:
+        """
+        Reload integrations.json if it changed on disk since it was loaded
+
+        Drops every config-derived table and memoized detection so the next
+        access rebuilds them from the edited file.
+
+        Returns:
+            True if the configuration was reloaded
+        """
+        if "integrations" not in self.__dict__:
+            # Not loaded yet, the first access will read the current file
+            return False
+
+        try:
+            mtime: float | None = self.integrations_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime == self._mtime_at_load:
+            return False
+
+        logger.info(f"Integrations file changed, reloading: {self.integrations_path}")
+        for name in _CACHED_ATTRS:
+            self.__dict__.pop(name, None)
+        self._detection_cache.clear()
+        self._preload()
+        return True
+
     def detect_integrations(self, instances: list[dict]) -> dict[str, Any]:
         """
         Detect all possible integrations based on selected services
 
+        Results are memoized per engine on the instances' app_id, instance_name
+        and config, which are the only fields detection reads. Each caller gets
+        its own copy, so mutating a result never reaches the cache or the
+        shared integrations config.
+
         Args:
             instances: List of instance configurations with app_id, instance_name, config
 
         Returns:
             Dictionary containing detected integrations, conflicts, and recommendations
         """
+        if not instances:
+            # Nothing selected, so no rule can match; skip loading the config entirely
+            return {
+                "integrations": {},
+                "conflicts": [],
+                "warnings": [],
+                "recommendations": [],
+                "auto_add_services": [],
+            }
+
+        if self.auto_reload:
+            self.maybe_reload()
+
+        cache_key: tuple | None = tuple(
+            (inst["app_id"], inst.get("instance_name"), _freeze(inst.get("config", {})))
+            for inst in instances
+        )
+        try:
+            cached = self._detection_cache.get(cache_key)
+        except TypeError:
+            # Unhashable config values, skip memoization
+            cache_key = cached = None
+
+        if cached is not None:
+            self._detection_cache.move_to_end(cache_key)
+            return _copy_result(cached)
+
+        result = self._detect_integrations_uncached(instances)
+
+        if cache_key is not None:
+            self._detection_cache[cache_key] = result
+            if len(self._detection_cache) > _DETECTION_CACHE_SIZE:
+                self._detection_cache.popitem(last=False)
+
+        return _copy_result(result)
+
+    def _detect_integrations_uncached(self, instances: list[dict]) -> dict[str, Any]:
+        """Run the full integration detection pipeline for a set of instances"""
         result: dict[str, Any] = {
             "integrations": {},
             "conflicts": [],
@@ -82,52 +334,41 @@ class IntegrationEngine:
             "auto_add_services": [],
         }
 
-        # Get list of selected service IDs
-        selected_services = [inst["app_id"] for inst in instances]
+        # Index instances by service ID (first instance wins for repeated services).
+        # Its keys are the selected services in selection order, without repeats,
+        # and serve as the selection for every check that ignores multiplicity.
+        instances_by_app: dict[str, dict] = {}
+        for inst in instances:
+            instances_by_app.setdefault(inst["app_id"], inst)
 
-        # Check mutual exclusivity
-        conflicts = self.check_mutual_exclusivity(selected_services)
+        # Check mutual exclusivity (repeated services still conflict with each other)
+        conflicts = self.check_mutual_exclusivity([inst["app_id"] for inst in instances])
         result["conflicts"] = conflicts
 
         # Check dependencies
-        deps = self.check_dependencies(selected_services, instances)
+        deps = self.check_dependencies(instances_by_app, instances)
         result["warnings"].extend(deps["warnings"])
         result["auto_add_services"] = deps["auto_add"]
 
+        # Group selected services by the integration types they provide
+        service_to_types = self._service_to_types
+        providers_by_type: dict[str, list[str]] = {}
+        for service_id in instances_by_app:
+            for integration_type in service_to_types.get(service_id, ()):
+                providers_by_type.setdefault(integration_type, []).append(service_id)
+
         # Detect available integrations
-        for integration_type, type_config in self.integration_types.items():
-            providers = [
-                s for s in selected_services if s in type_config.get("providers", [])
-            ]
-
-            if providers:
-                if integration_type == "reverse_proxy":
-                    result["integrations"][integration_type] = self._detect_reverse_proxy(
-                        providers[0], selected_services, instances
-                    )
-                elif integration_type == "oauth_provider":
-                    result["integrations"][integration_type] = self._detect_oauth(
-                        providers, selected_services, instances
-                    )
-                elif integration_type == "db_provider":
-                    result["integrations"][integration_type] = self._detect_database(
-                        providers, selected_services, instances
-                    )
-                elif integration_type == "mqtt_broker":
-                    result["integrations"][integration_type] = self._detect_mqtt(
-                        providers, selected_services, instances
-                    )
-                elif integration_type == "visualization":
-                    result["integrations"][integration_type] = self._detect_visualization(
-                        providers, selected_services, instances
-                    )
-                elif integration_type == "email_testing":
-                    result["integrations"][integration_type] = self._detect_email(
-                        providers, selected_services, instances
-                    )
+        for integration_type in self.integration_types:
+            providers = providers_by_type.get(integration_type)
+
+            handler = self._detectors.get(integration_type) if providers else None
+            if handler:
+                result["integrations"][integration_type] = handler(
+                    providers, instances_by_app, instances_by_app
+                )
 
         # Get recommendations
-        recommendations = self.get_recommendations(selected_services)
+        recommendations = self.get_recommendations(instances_by_app)
         result["recommendations"] = recommendations
 
         return result
@@ -136,10 +377,7 @@ class IntegrationEngine:
         """Check for mutually exclusive service conflicts"""
         conflicts = []
 
-        exclusivity_rules = self.integration_rules.get("mutual_exclusivity", [])
-
-        for rule in exclusivity_rules:
-            group_services = rule["services"]
+        for rule, group_services in self._exclusivity_rules:
             selected_from_group = [s for s in selected_services if s in group_services]
 
             if len(selected_from_group) > 1:
@@ -154,17 +392,18 @@ class IntegrationEngine:
         return conflicts
 
     def check_dependencies(
-        self, selected_services: list[str], instances: list[dict]
+        self, selected_services: Collection[str], instances: list[dict]
     ) -> dict:
         """Check for missing dependencies and requirements"""
         result: dict[str, list] = {"warnings": [], "auto_add": []}
+        selected_set = frozenset(selected_services)
 
         dependency_rules = self.integration_rules.get("dependencies", [])
 
         for rule in dependency_rules:
             service = rule["service"]
 
-            if service not in selected_services:
+            if service not in selected_set:
                 continue
 
             # Check hard requirements
@@ -205,25 +444,23 @@ class IntegrationEngine:
 
         return result
 
-    def get_recommendations(self, selected_services: list[str]) -> list[dict]:
+    def get_recommendations(self, selected_services: Collection[str]) -> list[dict]:
         """Get recommendations for additional services based on current selection"""
         recommendations = []
+        selected_set = frozenset(selected_services)
 
-        rec_rules = self.integration_rules.get("recommendations", [])
-
-        for rule in rec_rules:
-            if_selected = rule.get("if_selected", [])
-            if_not_selected = rule.get("if_not_selected", [])
+        for rule, if_selected, if_not_selected in self._recommendation_rules:
+            triggered = bool(if_selected) and if_selected <= selected_set
 
-            if if_selected and all(s in selected_services for s in if_selected):
-                if if_not_selected and all(s not in selected_services for s in if_not_selected):
+            if triggered:
+                if if_not_selected and if_not_selected.isdisjoint(selected_set):
                     recommendations.append({
                         "message": rule["message"],
                         "level": rule.get("level", "info"),
                         "suggest": rule.get("suggest", []),
                     })
                 elif "suggest" in rule and not if_not_selected:
-                    missing = [s for s in rule["suggest"] if s not in selected_services]
+                    missing = [s for s in rule["suggest"] if s not in selected_set]
                     if missing:
                         recommendations.append({
                             "message": rule["message"],
@@ -233,8 +470,8 @@ class IntegrationEngine:
 
             if "suggest_for" in rule:
                 suggest_for = rule["suggest_for"]
-                if if_selected and all(s in selected_services for s in if_selected):
-                    applicable = [s for s in suggest_for if s in selected_services]
+                if triggered:
+                    applicable = [s for s in suggest_for if s in selected_set]
                     if applicable:
                         recommendations.append({
                             "message": rule["message"],
@@ -244,23 +481,18 @@ class IntegrationEngine:
 
         return recommendations
 
-    def _find_providers(self, integration_type: str, selected_services: list[str]) -> list[str]:
+    def _find_providers(
+        self, integration_type: str, selected_services: Iterable[str]
+    ) -> list[str]:
         """Find services that provide a specific integration type"""
-        providers = []
-
-        type_config = self.integration_types.get(integration_type, {})
-        type_providers = type_config.get("providers", [])
-
-        for service in selected_services:
-            if service in type_providers:
-                providers.append(service)
-
-        return providers
+        type_providers = self._type_providers_set.get(integration_type, frozenset())
+        return [s for s in selected_services if s in type_providers]
 
     def _detect_reverse_proxy(
-        self, provider: str, selected_services: list[str], instances: list[dict]
+        self, provider: str, selected_services: Iterable[str], instances_by_app: dict[str, dict]
     ) -> dict:
         """Detect reverse proxy integrations"""
+        svc_integration = self._svc_integration
         integration: dict[str, Any] = {
             "provider": provider,
             "targets": [],
@@ -268,121 +500,140 @@ class IntegrationEngine:
             "config": {},
         }
 
-        provider_caps = self.service_capabilities.get(provider, {})
-        provider_integration = provider_caps.get("integrations", {}).get("reverse_proxy", {})
-        integration["method"] = provider_integration.get("method", "docker_labels")
+        provider_integration = svc_integration.get(
+            (provider, "reverse_proxy"), _CAPABILITY_DEFAULTS["reverse_proxy"]
+        )
+        integration["method"] = provider_integration["method"]
 
-        type_config = self.integration_types.get("reverse_proxy", {})
-        auto_targets = type_config.get("auto_configure_targets", [])
+        auto_targets = self._type_auto_targets.get("reverse_proxy", frozenset())
 
         for service_id in selected_services:
             if service_id == provider:
                 continue
 
             if service_id in auto_targets:
-                service_caps = self.service_capabilities.get(service_id, {})
-                service_integration = service_caps.get("integrations", {}).get("reverse_proxy", {})
+                service_integration = svc_integration.get((service_id, "reverse_proxy"))
 
                 if service_integration:
-                    instance = next((i for i in instances if i["app_id"] == service_id), None)
+                    instance = instances_by_app.get(service_id)
                     if instance:
-                        custom_name = instance.get("config", {}).get("name")
+                        custom_name = instance.get("config", _EMPTY).get("name")
                         subdomain = custom_name or instance.get("instance_name") or service_id
 
                         target = {
                             "service_id": service_id,
                             "instance_name": instance.get("instance_name"),
-                            "ports": service_integration.get("ports", []),
+                            "ports": service_integration["ports"],
                             "default_subdomain": subdomain,
-                            "health_check": service_integration.get("health_check"),
+                            "health_check": service_integration["health_check"],
                         }
                         integration["targets"].append(target)
 
         return integration
 
+    def _detect_reverse_proxy_single(
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
+    ) -> dict:
+        """Detect reverse proxy integrations for the first selected proxy"""
+        return self._detect_reverse_proxy(providers[0], selected_services, instances_by_app)
+
     def _detect_oauth(
-        self, providers: list[str], selected_services: list[str], instances: list[dict]
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
     ) -> dict:
         """Detect OAuth/SSO integrations"""
+        svc_integration = self._svc_integration
         integration: dict[str, Any] = {"providers": [], "clients": []}
 
+        # Index OAuth clients by each provider they support, in selection order
+        clients_by_provider: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for service_id in selected_services:
+            service_integration = svc_integration.get((service_id, "oauth_provider"))
+            if service_integration and service_integration["type"] == "client":
+                for supported_id in dict.fromkeys(service_integration["supports"]):
+                    clients_by_provider.setdefault(supported_id, []).append(
+                        (service_id, service_integration)
+                    )
+
         for provider_id in providers:
             # Build provider info dict (matching db_provider format)
-            instance = next((i for i in instances if i["app_id"] == provider_id), None)
+            instance = instances_by_app.get(provider_id)
             if instance:
                 integration["providers"].append({
                     "service_id": provider_id,
                     "instance_name": instance.get("instance_name"),
                     "config": instance.get("config", {}),
                 })
-            provider_caps = self.service_capabilities.get(provider_id, {})
-            provider_integration = provider_caps.get("integrations", {}).get("oauth_provider", {})
+            provider_integration = svc_integration.get((provider_id, "oauth_provider"))
 
             if not provider_integration:
                 continue
 
-            client_configs = provider_integration.get("client_configs", {})
-
-            for service_id in selected_services:
-                service_caps = self.service_capabilities.get(service_id, {})
-                service_integration = service_caps.get("integrations", {}).get("oauth_provider", {})
-
-                if service_integration and service_integration.get("type") == "client":
-                    supports = service_integration.get("supports", [])
+            client_configs = provider_integration["client_configs"]
 
-                    if provider_id in supports:
-                        instance = next((i for i in instances if i["app_id"] == service_id), None)
-                        if instance:
-                            client = {
-                                "service_id": service_id,
-                                "instance_name": instance.get("instance_name"),
-                                "provider": provider_id,
-                                "env_vars": service_integration.get("env_vars", {}),
-                                "client_config": client_configs.get(service_id, {}),
-                            }
-                            integration["clients"].append(client)
+            for service_id, service_integration in clients_by_provider.get(provider_id, ()):
+                instance = instances_by_app.get(service_id)
+                if instance:
+                    client = {
+                        "service_id": service_id,
+                        "instance_name": instance.get("instance_name"),
+                        "provider": provider_id,
+                        "env_vars": service_integration["env_vars"],
+                        "client_config": client_configs.get(service_id, {}),
+                    }
+                    integration["clients"].append(client)
 
         return integration
 
     def _detect_database(
-        self, providers: list[str], selected_services: list[str], instances: list[dict]
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
     ) -> dict:
         """Detect database integrations"""
+        svc_integration = self._svc_integration
         integration: dict[str, Any] = {"providers": [], "clients": []}
 
         for provider_id in providers:
-            instance = next((i for i in instances if i["app_id"] == provider_id), None)
+            instance = instances_by_app.get(provider_id)
             if instance:
-                provider_caps = self.service_capabilities.get(provider_id, {})
-                provider_integration = provider_caps.get("integrations", {}).get("db_provider", {})
+                provider_integration = svc_integration.get(
+                    (provider_id, "db_provider"), _CAPABILITY_DEFAULTS["db_provider"]
+                )
 
                 provider_info = {
                     "service_id": provider_id,
                     "instance_name": instance.get("instance_name"),
                     "config": instance.get("config", {}),
-                    "jdbc_url_template": provider_integration.get("jdbc_url_template"),
-                    "default_port": provider_integration.get("default_port"),
+                    "jdbc_url_template": provider_integration["jdbc_url_template"],
+                    "default_port": provider_integration["default_port"],
                 }
                 integration["providers"].append(provider_info)
 
+        providers_by_id = {p["service_id"]: p for p in integration["providers"]}
+
         for service_id in selected_services:
-            service_caps = self.service_capabilities.get(service_id, {})
-            service_integration = service_caps.get("integrations", {}).get("db_provider", {})
+            service_integration = svc_integration.get((service_id, "db_provider"))
 
-            if service_integration and service_integration.get("type") == "client":
-                instance = next((i for i in instances if i["app_id"] == service_id), None)
+            if service_integration and service_integration["type"] == "client":
+                instance = instances_by_app.get(service_id)
                 if instance:
                     client = {
                         "service_id": service_id,
                         "instance_name": instance.get("instance_name"),
-                        "supports": service_integration.get("supports", []),
-                        "auto_register": service_integration.get("auto_register", False),
-                        "jdbc_drivers": service_integration.get("jdbc_drivers", {}),
+                        "supports": service_integration["supports"],
+                        "auto_register": service_integration["auto_register"],
+                        "jdbc_drivers": service_integration["jdbc_drivers"],
                     }
 
                     compatible_providers = [
-                        p for p in integration["providers"]
-                        if p["service_id"] in client["supports"]
+                        providers_by_id[sid] for sid in client["supports"] if sid in providers_by_id
                     ]
                     client["matched_providers"] = compatible_providers
 
@@ -391,43 +642,48 @@ class IntegrationEngine:
         return integration
 
     def _detect_mqtt(
-        self, providers: list[str], selected_services: list[str], instances: list[dict]
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
     ) -> dict:
         """Detect MQTT broker integrations"""
+        svc_integration = self._svc_integration
         integration: dict[str, Any] = {"providers": [], "clients": []}
 
         for provider_id in providers:
-            instance = next((i for i in instances if i["app_id"] == provider_id), None)
+            instance = instances_by_app.get(provider_id)
             if instance:
-                provider_caps = self.service_capabilities.get(provider_id, {})
-                provider_integration = provider_caps.get("integrations", {}).get("mqtt_broker", {})
+                provider_integration = svc_integration.get(
+                    (provider_id, "mqtt_broker"), _CAPABILITY_DEFAULTS["mqtt_broker"]
+                )
 
                 provider_info = {
                     "service_id": provider_id,
                     "instance_name": instance.get("instance_name"),
-                    "mqtt_port": provider_integration.get("mqtt_port", 1883),
-                    "ws_port": provider_integration.get("ws_port"),
+                    "mqtt_port": provider_integration["mqtt_port"],
+                    "ws_port": provider_integration["ws_port"],
                 }
                 integration["providers"].append(provider_info)
 
+        providers_by_id = {p["service_id"]: p for p in integration["providers"]}
+
         for service_id in selected_services:
-            service_caps = self.service_capabilities.get(service_id, {})
-            service_integration = service_caps.get("integrations", {}).get("mqtt_broker", {})
+            service_integration = svc_integration.get((service_id, "mqtt_broker"))
 
-            if service_integration and service_integration.get("type") == "client":
-                instance = next((i for i in instances if i["app_id"] == service_id), None)
+            if service_integration and service_integration["type"] == "client":
+                instance = instances_by_app.get(service_id)
                 if instance:
                     client = {
                         "service_id": service_id,
                         "instance_name": instance.get("instance_name"),
-                        "supports": service_integration.get("supports", []),
-                        "requires_module": service_integration.get("requires_module"),
-                        "config_file": service_integration.get("config_file"),
+                        "supports": service_integration["supports"],
+                        "requires_module": service_integration["requires_module"],
+                        "config_file": service_integration["config_file"],
                     }
 
                     compatible_providers = [
-                        p for p in integration["providers"]
-                        if p["service_id"] in client["supports"]
+                        providers_by_id[sid] for sid in client["supports"] if sid in providers_by_id
                     ]
                     client["matched_providers"] = compatible_providers
 
@@ -436,7 +692,10 @@ class IntegrationEngine:
         return integration
 
     def _detect_visualization(
-        self, providers: list[str], selected_services: list[str], instances: list[dict]
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
     ) -> dict:
         """Detect visualization (Grafana) datasource integrations"""
         integration: dict[str, Any] = {
@@ -447,13 +706,14 @@ class IntegrationEngine:
         if not integration["provider"]:
             return integration
 
-        provider_caps = self.service_capabilities.get(integration["provider"], {})
-        provider_integration = provider_caps.get("integrations", {}).get("visualization", {})
-        datasource_types = provider_integration.get("datasource_types", {})
+        provider_integration = self._svc_integration.get(
+            (integration["provider"], "visualization"), _CAPABILITY_DEFAULTS["visualization"]
+        )
+        datasource_types = provider_integration["datasource_types"]
 
         for service_id in selected_services:
             if service_id in datasource_types:
-                instance = next((i for i in instances if i["app_id"] == service_id), None)
+                instance = instances_by_app.get(service_id)
                 if instance:
                     datasource = {
                         "service_id": service_id,
@@ -466,7 +726,10 @@ class IntegrationEngine:
         return integration
 
     def _detect_email(
-        self, providers: list[str], selected_services: list[str], instances: list[dict]
+        self,
+        providers: list[str],
+        selected_services: Iterable[str],
+        instances_by_app: dict[str, dict],
     ) -> dict:
         """Detect email testing (MailHog) integrations"""
         integration: dict[str, Any] = {
@@ -477,17 +740,18 @@ class IntegrationEngine:
         if not integration["provider"]:
             return integration
 
+        svc_integration = self._svc_integration
+
         for service_id in selected_services:
-            service_caps = self.service_capabilities.get(service_id, {})
-            service_integration = service_caps.get("integrations", {}).get("email_testing", {})
+            service_integration = svc_integration.get((service_id, "email_testing"))
 
-            if service_integration and service_integration.get("type") == "client":
-                instance = next((i for i in instances if i["app_id"] == service_id), None)
+            if service_integration and service_integration["type"] == "client":
+                instance = instances_by_app.get(service_id)
                 if instance:
                     client = {
                         "service_id": service_id,
                         "instance_name": instance.get("instance_name"),
-                        "env_vars": service_integration.get("env_vars", {}),
+                        "env_vars": service_integration["env_vars"],
                     }
                     integration["clients"].append(client)
 
@@ -502,67 +766,68 @@ class IntegrationEngine:
         https: bool = False,
     ) -> list[str]:
         """Generate Traefik labels for a service"""
-        template = self.config_templates.get(
-            "traefik_https_label" if https else "traefik_label", []
-        )
-
-        labels = []
-        for label_template in template:
-            label = label_template.format(
-                service_name=service_name, subdomain=subdomain, domain=domain, port=port
-            )
-            labels.append(label)
-
-        return labels
+        values = {
+            "service_name": service_name,
+            "subdomain": subdomain,
+            "domain": domain,
+            "port": port,
+        }
+        return [
+            template.format_map(values)
+            for template in self._traefik_label_templates[bool(https)]
+        ]
 
     def get_integration_summary(self, detection_result: dict) -> str:
         """Generate a human-readable summary of detected integrations"""
-        lines = ["# Integration Summary\n"]
+        return "\n".join(self._summary_lines(detection_result))
+
+    @staticmethod
+    def _summary_lines(detection_result: dict) -> Iterator[str]:
+        """Yield the summary line by line so it is joined in a single pass"""
+        yield "# Integration Summary\n"
 
-        integrations = detection_result.get("integrations", {})
+        integrations = detection_result.get("integrations", _EMPTY)
 
         if "reverse_proxy" in integrations:
             rp = integrations["reverse_proxy"]
-            lines.append(f"## Reverse Proxy: {rp['provider']}")
-            lines.append(f"Configured {len(rp['targets'])} services:")
+            yield f"## Reverse Proxy: {rp['provider']}"
+            yield f"Configured {len(rp['targets'])} services:"
             for target in rp["targets"]:
-                lines.append(f"  - {target['instance_name']} -> {target['default_subdomain']}.localhost")
-            lines.append("")
+                yield f"  - {target['instance_name']} -> {target['default_subdomain']}.localhost"
+            yield ""
 
         if "oauth_provider" in integrations:
             oauth = integrations["oauth_provider"]
             provider_names = [p["service_id"] for p in oauth["providers"]]
-            lines.append(f"## OAuth/SSO: {', '.join(provider_names)}")
-            lines.append(f"Configured {len(oauth['clients'])} clients:")
+            yield f"## OAuth/SSO: {', '.join(provider_names)}"
+            yield f"Configured {len(oauth['clients'])} clients:"
             for client in oauth["clients"]:
-                lines.append(f"  - {client['instance_name']} -> {client['provider']}")
-            lines.append("")
+                yield f"  - {client['instance_name']} -> {client['provider']}"
+            yield ""
 
         if "db_provider" in integrations:
             db = integrations["db_provider"]
-            lines.append("## Databases")
+            yield "## Databases"
             for provider in db["providers"]:
-                lines.append(f"  Provider: {provider['instance_name']}")
+                yield f"  Provider: {provider['instance_name']}"
             for client in db["clients"]:
                 if client.get("auto_register"):
-                    lines.append(f"  - Auto-registered in {client['instance_name']}")
-            lines.append("")
+                    yield f"  - Auto-registered in {client['instance_name']}"
+            yield ""
 
         conflicts = detection_result.get("conflicts", [])
         if conflicts:
-            lines.append("## Conflicts")
+            yield "## Conflicts"
             for conflict in conflicts:
-                lines.append(f"  - {conflict['message']}")
-            lines.append("")
+                yield f"  - {conflict['message']}"
+            yield ""
 
         warnings = detection_result.get("warnings", [])
         if warnings:
-            lines.append("## Warnings")
+            yield "## Warnings"
             for warning in warnings:
-                lines.append(f"  - {warning['message']}")
-            lines.append("")
-
-        return "\n".join(lines)
+                yield f"  - {warning['message']}"
+            yield ""
 
 
 # Singleton instance
@@ -573,5 +838,8 @@ def get_integration_engine() -> IntegrationEngine:
     """Get or create the integration engine singleton"""
     global _engine
     if _engine is None:
-        _engine = IntegrationEngine()
+        from ignition_toolkit.core.config import is_dev_mode
+
+        # Pick up edits to integrations.json without a restart while developing
+        _engine = IntegrationEngine(eager=True, auto_reload=is_dev_mode())
     return _engine
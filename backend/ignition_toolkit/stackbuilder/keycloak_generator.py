@@ -5,13 +5,59 @@ Generates realm-import.json for automatic OAuth/SSO setup with pre-generated
 client secrets for integrated services like Grafana, n8n, and Portainer.
 """
 
+import base64
 import secrets
+import string
+from collections.abc import Callable
 from typing import Any
 
+from ignition_toolkit.core import json_codec
+
+
+# Static realm-level settings. Only scalars live here so the per-call dict
+# unpacking is a cheap shallow copy; nested sections are still built fresh
+# in generate_keycloak_realm so callers never share mutable state.
+_REALM_SETTINGS: dict[str, Any] = {
+    "displayName": "IIoT Stack",
+    "displayNameHtml": '<div class="kc-logo-text"><span>IIoT Stack</span></div>',
+    "enabled": True,
+    "sslRequired": "external",
+    "registrationAllowed": False,
+    "loginWithEmailAllowed": True,
+    "duplicateEmailsAllowed": False,
+    "resetPasswordAllowed": True,
+    "editUsernameAllowed": False,
+    "bruteForceProtected": True,
+    # Session settings
+    "ssoSessionIdleTimeout": 1800,
+    "ssoSessionMaxLifespan": 36000,
+    "offlineSessionIdleTimeout": 2592000,
+    # Token settings
+    "accessTokenLifespan": 300,
+    "accessTokenLifespanForImplicitFlow": 900,
+    "accessCodeLifespan": 60,
+    "accessCodeLifespanUserAction": 300,
+}
+
+
+# Random bytes per client secret (matches secrets.token_urlsafe(32))
+_CLIENT_SECRET_BYTES = 32
+
 
 def generate_client_secret() -> str:
     """Generate a secure client secret"""
-    return secrets.token_urlsafe(32)
+    return secrets.token_urlsafe(_CLIENT_SECRET_BYTES)
+
+
+def _generate_client_secrets(count: int) -> list[str]:
+    """Generate several client secrets from a single read of the OS random source"""
+    if count <= 0:
+        return []
+    raw = secrets.token_bytes(_CLIENT_SECRET_BYTES * count)
+    return [
+        base64.urlsafe_b64encode(raw[i : i + _CLIENT_SECRET_BYTES]).rstrip(b"=").decode("ascii")
+        for i in range(0, len(raw), _CLIENT_SECRET_BYTES)
+    ]
 
 
 def generate_keycloak_realm(
@@ -38,29 +84,20 @@ def generate_keycloak_realm(
     users = users or []
     protocol = "https" if enable_https else "http"
 
+    # OAuth client builders for the requested services, one secret each
+    selected = set(services)
+    builders = [
+        (service_id, build)
+        for service_id, build in _CLIENT_BUILDERS.items()
+        if service_id in selected
+    ]
+    client_secrets = _generate_client_secrets(len(builders))
+
     # Base realm configuration
     realm: dict[str, Any] = {
         "id": realm_name,
         "realm": realm_name,
-        "displayName": "IIoT Stack",
-        "displayNameHtml": '<div class="kc-logo-text"><span>IIoT Stack</span></div>',
-        "enabled": True,
-        "sslRequired": "external",
-        "registrationAllowed": False,
-        "loginWithEmailAllowed": True,
-        "duplicateEmailsAllowed": False,
-        "resetPasswordAllowed": True,
-        "editUsernameAllowed": False,
-        "bruteForceProtected": True,
-        # Session settings
-        "ssoSessionIdleTimeout": 1800,
-        "ssoSessionMaxLifespan": 36000,
-        "offlineSessionIdleTimeout": 2592000,
-        # Token settings
-        "accessTokenLifespan": 300,
-        "accessTokenLifespanForImplicitFlow": 900,
-        "accessCodeLifespan": 60,
-        "accessCodeLifespanUserAction": 300,
+        **_REALM_SETTINGS,
         # Roles
         "roles": {
             "realm": [
@@ -170,31 +207,14 @@ def generate_keycloak_realm(
                 ],
             },
         ],
-        "users": [],
-        "clients": [],
+        "users": [_generate_user(user, realm_name) for user in users],
+        # OAuth clients for each service, in registry order
+        "clients": [
+            build_client(f"{protocol}://{service_id}.{base_domain}", client_secret)
+            for (service_id, build_client), client_secret in zip(builders, client_secrets)
+        ],
     }
 
-    # Add users
-    for user in users:
-        realm["users"].append(_generate_user(user, realm_name))
-
-    # Add OAuth clients for each service
-    clients = []
-
-    if "grafana" in services:
-        clients.append(_generate_grafana_client(base_domain, protocol))
-
-    if "n8n" in services:
-        clients.append(_generate_n8n_client(base_domain, protocol))
-
-    if "portainer" in services:
-        clients.append(_generate_portainer_client(base_domain, protocol))
-
-    if "ignition" in services:
-        clients.append(_generate_ignition_client(base_domain, protocol))
-
-    realm["clients"] = clients
-
     return realm
 
 
@@ -205,6 +225,7 @@ def _generate_user(user_data: dict[str, Any], realm_name: str) -> dict[str, Any]
     email = user_data.get("email", f"{username}@{realm_name}.local")
     first_name = user_data.get("firstName", username.capitalize())
     last_name = user_data.get("lastName", "User")
+    temporary = user_data.get("temporary", True)
 
     roles = user_data.get("roles", ["user"])
     if not isinstance(roles, list):
@@ -221,20 +242,16 @@ def _generate_user(user_data: dict[str, Any], realm_name: str) -> dict[str, Any]
             {
                 "type": "password",
                 "value": password,
-                "temporary": user_data.get("temporary", True),
+                "temporary": temporary,
             }
         ],
         "realmRoles": roles,
-        "requiredActions": (
-            ["UPDATE_PASSWORD"] if user_data.get("temporary", True) else []
-        ),
+        "requiredActions": ["UPDATE_PASSWORD"] if temporary else [],
     }
 
 
-def _generate_grafana_client(base_domain: str, protocol: str) -> dict[str, Any]:
+def _generate_grafana_client(base_url: str, client_secret: str) -> dict[str, Any]:
     """Generate Grafana OAuth client configuration"""
-    client_secret = generate_client_secret()
-    redirect_uri = f"{protocol}://grafana.{base_domain}/*"
 
     return {
         "clientId": "grafana",
@@ -244,8 +261,8 @@ def _generate_grafana_client(base_domain: str, protocol: str) -> dict[str, Any]:
         "clientAuthenticatorType": "client-secret",
         "secret": client_secret,
         "redirectUris": [
-            redirect_uri,
-            f"{protocol}://grafana.{base_domain}/login/generic_oauth",
+            f"{base_url}/*",
+            f"{base_url}/login/generic_oauth",
         ],
         "webOrigins": ["+"],
         "protocol": "openid-connect",
@@ -276,10 +293,8 @@ def _generate_grafana_client(base_domain: str, protocol: str) -> dict[str, Any]:
     }
 
 
-def _generate_n8n_client(base_domain: str, protocol: str) -> dict[str, Any]:
+def _generate_n8n_client(base_url: str, client_secret: str) -> dict[str, Any]:
     """Generate n8n OAuth client configuration"""
-    client_secret = generate_client_secret()
-
     return {
         "clientId": "n8n",
         "name": "n8n Workflow Automation",
@@ -287,8 +302,8 @@ def _generate_n8n_client(base_domain: str, protocol: str) -> dict[str, Any]:
         "clientAuthenticatorType": "client-secret",
         "secret": client_secret,
         "redirectUris": [
-            f"{protocol}://n8n.{base_domain}/*",
-            f"{protocol}://n8n.{base_domain}/rest/oauth2-credential/callback",
+            f"{base_url}/*",
+            f"{base_url}/rest/oauth2-credential/callback",
         ],
         "webOrigins": ["+"],
         "protocol": "openid-connect",
@@ -300,17 +315,15 @@ def _generate_n8n_client(base_domain: str, protocol: str) -> dict[str, Any]:
     }
 
 
-def _generate_portainer_client(base_domain: str, protocol: str) -> dict[str, Any]:
+def _generate_portainer_client(base_url: str, client_secret: str) -> dict[str, Any]:
     """Generate Portainer OAuth client configuration"""
-    client_secret = generate_client_secret()
-
     return {
         "clientId": "portainer",
         "name": "Portainer",
         "enabled": True,
         "clientAuthenticatorType": "client-secret",
         "secret": client_secret,
-        "redirectUris": [f"{protocol}://portainer.{base_domain}/*"],
+        "redirectUris": [f"{base_url}/*"],
         "webOrigins": ["+"],
         "protocol": "openid-connect",
         "publicClient": False,
@@ -321,10 +334,8 @@ def _generate_portainer_client(base_domain: str, protocol: str) -> dict[str, Any
     }
 
 
-def _generate_ignition_client(base_domain: str, protocol: str) -> dict[str, Any]:
+def _generate_ignition_client(base_url: str, client_secret: str) -> dict[str, Any]:
     """Generate Ignition OAuth client configuration"""
-    client_secret = generate_client_secret()
-
     return {
         "clientId": "ignition",
         "name": "Ignition SCADA",
@@ -332,8 +343,8 @@ def _generate_ignition_client(base_domain: str, protocol: str) -> dict[str, Any]
         "clientAuthenticatorType": "client-secret",
         "secret": client_secret,
         "redirectUris": [
-            f"{protocol}://ignition.{base_domain}/*",
-            f"{protocol}://ignition.{base_domain}/data/perspective/client/*",
+            f"{base_url}/*",
+            f"{base_url}/data/perspective/client/*",
         ],
         "webOrigins": ["+"],
         "protocol": "openid-connect",
@@ -345,23 +356,32 @@ def _generate_ignition_client(base_domain: str, protocol: str) -> dict[str, Any]
     }
 
 
-def generate_keycloak_readme_section(
-    realm_name: str, clients: list[dict[str, Any]]
-) -> str:
+def serialize_keycloak_realm(realm: dict[str, Any]) -> str:
     """
-    Generate README section with Keycloak setup instructions.
-
-    Note: Client secrets are NOT included in the README for security.
-    They can be found in the .env file or Keycloak admin console.
+    Serialize a realm configuration as indented realm-import JSON.
 
     Args:
-        realm_name: The Keycloak realm name
-        clients: List of OAuth client configurations
+        realm: Realm configuration from generate_keycloak_realm
 
     Returns:
-        Markdown content for the README
+        JSON text with two-space indentation
+    """
+    return json_codec.dumps(realm, indent=True)
+
+
+# OAuth client builder per service ID, called with the service's base URL
+# (protocol://service.domain) and its client secret; services not listed get no client
+_CLIENT_BUILDERS: dict[str, Callable[[str, str], dict[str, Any]]] = {
+    "grafana": _generate_grafana_client,
+    "n8n": _generate_n8n_client,
+    "portainer": _generate_portainer_client,
+    "ignition": _generate_ignition_client,
+}
+
+
+# README fragments for the Keycloak SSO section
+_README_HEADER = string.Template(
     """
-    content = f"""
 ## Keycloak SSO Configuration
 
 Your stack includes automatic Keycloak realm configuration for Single Sign-On (SSO).
@@ -370,26 +390,28 @@ Your stack includes automatic Keycloak realm configuration for Single Sign-On (S
 
 The realm configuration is automatically imported on first startup.
 
-**Realm Name:** `{realm_name}`
+**Realm Name:** `$REALM_NAME`
 
 ### OAuth Client Credentials
 
 The following OAuth clients have been configured:
 
 """
+)
 
-    for client in clients:
-        client_id = client.get("clientId")
-        # Don't expose secrets in README - reference .env file instead
-        content += f"""
-#### {client.get("name", client_id)}
-- **Client ID:** `{client_id}`
+# Don't expose secrets in README - reference .env file instead
+_README_CLIENT_BLOCK = string.Template(
+    """
+#### $NAME
+- **Client ID:** `$CLIENT_ID`
 - **Client Secret:** See `.env` file or Keycloak admin console
 - **Scopes:** openid, profile, email, roles
 
 """
+)
 
-    content += f"""
+_README_FOOTER = string.Template(
+    """
 > **Security Note:** Client secrets are stored in the `.env` file.
 > Keep this file secure and never commit it to version control.
 
@@ -397,7 +419,7 @@ The following OAuth clients have been configured:
 
 1. Navigate to Keycloak: `http://keycloak.localhost` (or your configured domain)
 2. Login with admin credentials (from your `.env` file)
-3. Select the `{realm_name}` realm from the dropdown
+3. Select the `$REALM_NAME` realm from the dropdown
 
 ### Default Roles
 
@@ -408,5 +430,31 @@ Three realm roles are available:
 
 Assign roles in Admin Console -> Users -> Role Mappings.
 """
+)
+
+
+def generate_keycloak_readme_section(
+    realm_name: str, clients: list[dict[str, Any]]
+) -> str:
+    """
+    Generate README section with Keycloak setup instructions.
+
+    Note: Client secrets are NOT included in the README for security.
+    They can be found in the .env file or Keycloak admin console.
+
+    Args:
+        realm_name: The Keycloak realm name
+        clients: List of OAuth client configurations
+
+    Returns:
+        Markdown content for the README
+    """
+    parts = [_README_HEADER.substitute(REALM_NAME=realm_name)]
+    for client in clients:
+        client_id = client.get("clientId")
+        parts.append(
+            _README_CLIENT_BLOCK.substitute(NAME=client.get("name", client_id), CLIENT_ID=client_id)
+        )
+    parts.append(_README_FOOTER.substitute(REALM_NAME=realm_name))
 
-    return content
+    return "".join(parts)
@@ -5,16 +5,23 @@ Manages the lifecycle of StackBuilder-generated Docker Compose stacks
 on the local Docker environment.
 """
 
+import functools
+import hashlib
 import logging
 import os
 import platform
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from ignition_toolkit.core import json_codec
+
 logger = logging.getLogger(__name__)
 
 # Windows-specific subprocess flag to hide console window
@@ -24,6 +31,7 @@ _CREATION_FLAGS = (
 )
 
 
+@functools.cache
 def _is_wsl() -> bool:
     """
     Check if running inside Windows Subsystem for Linux (WSL).
@@ -32,50 +40,39 @@ def _is_wsl() -> bool:
         return False
 
     try:
-        with open("/proc/version", "r") as f:
-            version_info = f.read().lower()
-            return "microsoft" in version_info or "wsl" in version_info
+        # The kernel banner is short; the marker appears in its first bytes
+        with open("/proc/version", "rb") as f:
+            version_info = f.read(256).lower()
+            return b"microsoft" in version_info or b"wsl" in version_info
     except (FileNotFoundError, PermissionError):
         return False
 
 
-def _find_docker_executable() -> str | None:
+def _build_docker_search_paths() -> tuple[Path, ...]:
     """
-    Find the Docker executable path.
+    Build the fallback Docker locations for this platform, in search order.
     """
-    # First, try to find docker in PATH
-    docker_path = shutil.which("docker")
-    if docker_path:
-        return docker_path
+    system = platform.system()
 
     # On Linux (including WSL), check standard Linux paths
-    if platform.system() == "Linux":
-        linux_paths = [
+    if system == "Linux":
+        paths = [
             Path("/usr/bin/docker"),
             Path("/usr/local/bin/docker"),
             Path("/snap/bin/docker"),
         ]
 
-        for path in linux_paths:
-            if path.exists():
-                logger.info(f"Found Docker at: {path}")
-                return str(path)
-
         # If running in WSL, also check Windows Docker Desktop paths via /mnt/c
         if _is_wsl():
-            wsl_windows_paths = [
+            paths += [
                 Path("/mnt/c/Program Files/Docker/Docker/resources/bin/docker.exe"),
                 Path("/mnt/c/Program Files/Docker/Docker/resources/bin/docker"),
             ]
-
-            for path in wsl_windows_paths:
-                if path.exists():
-                    logger.info(f"Found Docker (WSL Windows) at: {path}")
-                    return str(path)
+        return tuple(paths)
 
     # On Windows, check common Docker Desktop installation paths
-    if platform.system() == "Windows":
-        common_paths = [
+    if system == "Windows":
+        return (
             Path(os.environ.get("ProgramFiles", "C:\\Program Files"))
             / "Docker"
             / "Docker"
@@ -92,16 +89,41 @@ def _find_docker_executable() -> str | None:
             / "resources"
             / "bin"
             / "docker.exe",
-        ]
+        )
+
+    return ()
 
-        for path in common_paths:
-            if path.exists():
-                logger.info(f"Found Docker at: {path}")
-                return str(path)
+
+# Docker locations checked when docker is not on PATH (fixed for the process)
+_DOCKER_SEARCH_PATHS = _build_docker_search_paths()
+
+
+@functools.cache
+def _find_docker_executable() -> str | None:
+    """
+    Find the Docker executable path.
+
+    The result is cached for the life of the process; call _docker_cache_clear()
+    to search again (e.g. after the cached path stopped working).
+    """
+    # First, try to find docker in PATH
+    docker_path = shutil.which("docker")
+    if docker_path:
+        return docker_path
+
+    for path in _DOCKER_SEARCH_PATHS:
+        if path.exists():
+            logger.info(f"Found Docker at: {path}")
+            return str(path)
 
     return None
 
 
+def _docker_cache_clear() -> None:
+    """Forget the cached Docker executable so the next command searches again."""
+    _find_docker_executable.cache_clear()
+
+
 def _get_docker_command() -> list[str]:
     """Get the Docker command with proper path handling."""
     docker_path = _find_docker_executable()
@@ -110,6 +132,103 @@ def _get_docker_command() -> list[str]:
     return ["docker"]
 
 
+# Upper bound on threads used to write or delete a stack's files
+_MAX_FILE_WORKERS = 8
+
+# Stack directories with at most this many top-level entries are removed serially
+_SERIAL_REMOVE_LIMIT = 4
+
+
+def _write_files(writes: list[tuple[Path, str]]) -> None:
+    """
+    Write (path, content) pairs as UTF-8, overlapping the writes on a thread pool.
+
+    Parent directories are created up front so workers never race on mkdir.
+    """
+    for parent in {path.parent for path, _ in writes}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    if len(writes) == 1:
+        path, content = writes[0]
+        path.write_text(content, encoding='utf-8')
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_FILE_WORKERS, len(writes))) as executor:
+        # Consume the results so the first failed write is raised here
+        list(executor.map(lambda item: item[0].write_text(item[1], encoding='utf-8'), writes))
+
+
+def _remove_entry(entry: os.DirEntry) -> None:
+    """Remove one directory entry, recursing into real directories but not symlinks."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def _remove_tree(path: Path) -> None:
+    """
+    Delete a directory tree, removing its top-level entries on a thread pool.
+
+    Small directories fall back to a plain shutil.rmtree.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    if len(entries) <= _SERIAL_REMOVE_LIMIT:
+        shutil.rmtree(path)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_FILE_WORKERS, len(entries))) as executor:
+        # Consume the results so the first failed removal is raised here
+        list(executor.map(_remove_entry, entries))
+    path.rmdir()
+
+
+# Seconds `docker compose ps` may run before get_stack_status kills it
+_STATUS_TIMEOUT = 30
+
+# File in each stack directory recording the content hash of its last successful deploy
+_DEPLOY_HASH_FILE = ".deploy.hash"
+
+
+def _deploy_digest(
+    compose_content: str, env_content: str, config_files: dict[str, str] | None
+) -> str:
+    """Hash everything deploy_stack writes, so an identical redeploy can be detected."""
+    digest = hashlib.blake2b(digest_size=16)
+    # NUL-separate the fields so different splits of the same bytes can't collide
+    for part in (compose_content, env_content):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    for file_path in sorted(config_files or {}):
+        digest.update(file_path.encode('utf-8'))
+        digest.update(b"\0")
+        digest.update(config_files[file_path].encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _iter_compose_ps(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Yield container dicts from `docker compose ps --format json` output lines.
+
+    Newer Compose releases print one JSON object per line, older ones a single
+    JSON array; both are handled. Lines that fail to parse are skipped.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            parsed = json_codec.loads(line)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            yield parsed
+        elif isinstance(parsed, list):
+            yield from (c for c in parsed if isinstance(c, dict))
+
+
 StackStatus = Literal["running", "partial", "stopped", "not_deployed", "unknown"]
 
 
@@ -158,6 +277,7 @@ class StackRunner:
             docker_cmd = _get_docker_command()
             result = subprocess.run(
                 docker_cmd + ["info"],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 timeout=30,
                 creationflags=_CREATION_FLAGS,
@@ -165,6 +285,7 @@ class StackRunner:
             return result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
             logger.debug(f"Docker not available: {e}")
+            _docker_cache_clear()
             return False
 
     def deploy_stack(
@@ -186,32 +307,41 @@ class StackRunner:
         Returns:
             DeployResult with success status and output/error
         """
-        if not self.check_docker_available():
-            return DeployResult(
-                success=False,
-                error="Docker is not available. Please ensure Docker is installed and running.",
-            )
+        # No `docker info` pre-flight here: a missing Docker surfaces as
+        # FileNotFoundError and a stopped daemon through compose's own exit
+        # status. Use check_docker_available() (/docker-status) to probe upfront.
 
         # Create stack directory
         stack_dir = self._get_stack_dir(stack_name)
         stack_dir.mkdir(parents=True, exist_ok=True)
 
+        # Skip rewriting files and `compose up` when this exact content is already running
+        digest = _deploy_digest(compose_content, env_content, config_files)
+        hash_path = stack_dir / _DEPLOY_HASH_FILE
         try:
-            # Write compose file
-            compose_path = stack_dir / "docker-compose.yml"
-            compose_path.write_text(compose_content, encoding='utf-8')
+            previous_digest = hash_path.read_text(encoding='utf-8')
+        except OSError:
+            previous_digest = None
+        if previous_digest == digest and self.get_stack_status(stack_name).status == "running":
+            logger.info(f"Stack '{stack_name}' is unchanged and running, skipping deploy")
+            return DeployResult(
+                success=True,
+                output="Stack is already running with this configuration.",
+            )
 
-            # Write env file
-            if env_content:
-                env_path = stack_dir / ".env"
-                env_path.write_text(env_content, encoding='utf-8')
+        try:
+            # Forget the previous deploy until this one succeeds
+            hash_path.unlink(missing_ok=True)
 
-            # Write additional config files
+            # Compose file, env file and additional config files
+            writes = [(stack_dir / "docker-compose.yml", compose_content)]
+            if env_content:
+                writes.append((stack_dir / ".env", env_content))
             if config_files:
-                for file_path, content in config_files.items():
-                    full_path = stack_dir / file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(content, encoding='utf-8')
+                writes.extend(
+                    (stack_dir / file_path, content) for file_path, content in config_files.items()
+                )
+            _write_files(writes)
 
             # Run docker compose up
             logger.info(f"Deploying stack '{stack_name}' from {stack_dir}")
@@ -220,6 +350,7 @@ class StackRunner:
             result = subprocess.run(
                 docker_cmd + ["compose", "-p", stack_name, "up", "-d"],
                 cwd=stack_dir,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
@@ -230,6 +361,7 @@ class StackRunner:
 
             if result.returncode == 0:
                 logger.info(f"Stack '{stack_name}' deployed successfully")
+                hash_path.write_text(digest, encoding='utf-8')
                 return DeployResult(
                     success=True,
                     output=result.stdout or result.stderr,
@@ -248,9 +380,10 @@ class StackRunner:
                 error="Docker compose command timed out. Images may still be pulling in the background.",
             )
         except FileNotFoundError:
+            _docker_cache_clear()
             return DeployResult(
                 success=False,
-                error="Docker not found. Please install Docker.",
+                error="Docker is not available. Please ensure Docker is installed and running.",
             )
         except Exception as e:
             logger.exception(f"Error deploying stack: {e}")
@@ -289,6 +422,7 @@ class StackRunner:
             result = subprocess.run(
                 cmd,
                 cwd=stack_dir,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
@@ -317,6 +451,7 @@ class StackRunner:
                 error="Docker compose command timed out.",
             )
         except FileNotFoundError:
+            _docker_cache_clear()
             return DeployResult(
                 success=False,
                 error="Docker not found.",
@@ -349,45 +484,61 @@ class StackRunner:
         try:
             docker_cmd = _get_docker_command()
 
-            # Get container status using docker compose ps
-            result = subprocess.run(
-                docker_cmd + ["compose", "-p", stack_name, "ps", "--format", "json"],
+            # Get container status using docker compose ps, parsing lines as they arrive
+            cmd = docker_cmd + ["compose", "-p", stack_name, "ps", "--format", "json"]
+            timeout = _STATUS_TIMEOUT
+            proc = subprocess.Popen(
+                cmd,
                 cwd=stack_dir,
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                timeout=30,
                 creationflags=_CREATION_FLAGS,
             )
 
-            if result.returncode != 0:
-                # No containers found
-                return DeployedStackStatus(
-                    status="not_deployed",
-                    services={},
-                )
+            # Reading stdout has no timeout of its own, so kill docker if it hangs
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
 
-            # Parse JSON output (one JSON object per line)
-            import json
+            watchdog = threading.Timer(timeout, _kill)
+            watchdog.start()
 
             services = {}
             running_count = 0
             total_count = 0
 
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                try:
-                    container = json.loads(line)
-                    service_name = container.get("Service", container.get("Name", "unknown"))
-                    state = container.get("State", "unknown").lower()
-                    services[service_name] = state
-                    total_count += 1
-                    if state == "running":
-                        running_count += 1
-                except json.JSONDecodeError:
-                    continue
+            try:
+                with proc.stdout:
+                    for container in _iter_compose_ps(proc.stdout):
+                        service_name = container.get("Service", container.get("Name", "unknown"))
+                        state = (container.get("State") or "unknown").lower()
+                        services[service_name] = state
+                        total_count += 1
+                        if state == "running":
+                            running_count += 1
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    # Parsing failed part-way; don't leave docker running or unreaped
+                    proc.kill()
+                    proc.wait()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            if returncode != 0:
+                # No containers found
+                return DeployedStackStatus(
+                    status="not_deployed",
+                    services={},
+                )
 
             if total_count == 0:
                 return DeployedStackStatus(
@@ -428,7 +579,9 @@ class StackRunner:
         """List all deployed stack names."""
         if not self.STACKS_DIR.exists():
             return []
-        return [d.name for d in self.STACKS_DIR.iterdir() if d.is_dir()]
+        # DirEntry.is_dir() uses the type from readdir, avoiding a stat per entry
+        with os.scandir(self.STACKS_DIR) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
 
     def delete_stack(self, stack_name: str) -> DeployResult:
         """
@@ -453,7 +606,7 @@ class StackRunner:
             self.stop_stack(stack_name, remove_volumes=True)
 
             # Remove directory
-            shutil.rmtree(stack_dir)
+            _remove_tree(stack_dir)
             logger.info(f"Stack '{stack_name}' directory deleted")
             return DeployResult(
                 success=True,
@@ -467,13 +620,7 @@ class StackRunner:
             )
 
 
-# Singleton instance
-_runner: StackRunner | None = None
-
-
+@functools.cache
 def get_stack_runner() -> StackRunner:
     """Get or create the StackRunner singleton."""
-    global _runner
-    if _runner is None:
-        _runner = StackRunner()
-    return _runner
+    return StackRunner()
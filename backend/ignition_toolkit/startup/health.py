@@ -5,10 +5,13 @@ Tracks component health and overall system readiness for monitoring
 and debugging.
 """
 
+import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 
+from ignition_toolkit.core import json_codec
+
 
 class HealthStatus(str, Enum):
     """Health status for system components"""
@@ -19,11 +22,18 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Enum .value goes through a descriptor; health payloads look it up here instead
+_STATUS_VALUES = {status: status.value for status in HealthStatus}
+
+
+@dataclass(frozen=True, slots=True)
 class ComponentHealth:
     """
     Health information for a single component
 
+    Immutable: setters replace the whole entry, so one instance can be
+    shared between SystemHealth objects.
+
     Attributes:
         status: Health status (healthy/degraded/unhealthy/unknown)
         message: Human-readable status message
@@ -39,13 +49,25 @@ class ComponentHealth:
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict"""
         return {
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "message": self.message,
             "last_checked": self.last_checked.isoformat(),
             "error": self.error,
         }
 
 
+# Components reported in the health payload, from startup onwards and in this order.
+# Other phases (environment, services) are tracked but only surface via errors/warnings.
+DEFAULT_COMPONENTS = ("database", "vault", "playbooks", "browser", "frontend", "scheduler")
+
+# Shared initial state for every component; last_checked of datetime.min means never
+_UNKNOWN = ComponentHealth(HealthStatus.UNKNOWN, last_checked=datetime.min.replace(tzinfo=UTC))
+
+
+def _default_components() -> dict[str, ComponentHealth]:
+    return dict.fromkeys(DEFAULT_COMPONENTS, _UNKNOWN)
+
+
 @dataclass
 class SystemHealth:
     """
@@ -59,48 +81,61 @@ class SystemHealth:
     ready: bool = False
     startup_time: datetime | None = None
 
-    # Component health
-    database: ComponentHealth = field(default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN))
-    vault: ComponentHealth = field(default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN))
-    playbooks: ComponentHealth = field(
-        default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN)
-    )
-    browser: ComponentHealth = field(default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN))
-    frontend: ComponentHealth = field(default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN))
-    scheduler: ComponentHealth = field(default_factory=lambda: ComponentHealth(HealthStatus.UNKNOWN))
+    # Component health, keyed by component name
+    components: dict[str, ComponentHealth] = field(default_factory=_default_components)
 
     # Startup issues
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
 
+    # Serialized components, rebuilt only after a component changes
+    _components_dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def set_component(self, name: str, comp_health: ComponentHealth) -> None:
+        """Replace a component's health and invalidate the serialized copy"""
+        self.components[name] = comp_health
+        self._components_dict = None
+
+    def components_dict(self) -> dict:
+        """
+        Get the JSON-serializable map of reported components
+
+        The serialized form is cached until a component changes; callers get a
+        copy, so mutating a response cannot leak into later ones.
+        """
+        cached = self._components_dict
+        if cached is None:
+            components = self.components
+            cached = {
+                name: components.get(name, _UNKNOWN).to_dict() for name in DEFAULT_COMPONENTS
+            }
+            self._components_dict = cached
+        return {name: dict(component) for name, component in cached.items()}
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict for API responses"""
         # Calculate uptime from startup_time
+        startup_time = self.startup_time
         uptime_seconds = 0.0
-        if self.startup_time:
-            uptime_seconds = (datetime.now(UTC) - self.startup_time).total_seconds()
+        if startup_time:
+            uptime_seconds = (datetime.now(UTC) - startup_time).total_seconds()
 
+        overall = _STATUS_VALUES[self.overall]
         return {
-            "status": self.overall.value,
-            "overall": self.overall.value,
+            "status": overall,
+            "overall": overall,
             "ready": self.ready,
-            "startup_time": self.startup_time.isoformat() if self.startup_time else None,
+            "startup_time": startup_time.isoformat() if startup_time else None,
             "uptime_seconds": uptime_seconds,
-            "components": {
-                "database": self.database.to_dict(),
-                "vault": self.vault.to_dict(),
-                "playbooks": self.playbooks.to_dict(),
-                "browser": self.browser.to_dict(),
-                "frontend": self.frontend.to_dict(),
-                "scheduler": self.scheduler.to_dict(),
-            },
+            "components": self.components_dict(),
             "errors": self.errors,
             "warnings": self.warnings,
         }
 
 
-# Global health state (singleton)
+# Global health state (singleton); updates may come from worker threads
 _health_state = SystemHealth()
+_lock = threading.Lock()
 
 
 def get_health_state() -> SystemHealth:
@@ -113,6 +148,19 @@ def get_health_state() -> SystemHealth:
     return _health_state
 
 
+def get_health_payload() -> bytes:
+    """
+    Get the detailed health state encoded as JSON
+
+    Component entries are only re-serialized after they change, so
+    frequent health probes mostly pay for encoding the top-level fields.
+
+    Returns:
+        UTF-8 encoded JSON of SystemHealth.to_dict()
+    """
+    return json_codec.dumps_bytes(_health_state.to_dict())
+
+
 def set_component_healthy(component: str, message: str = "") -> None:
     """
     Mark a component as healthy
@@ -122,7 +170,8 @@ def set_component_healthy(component: str, message: str = "") -> None:
         message: Optional status message
     """
     comp_health = ComponentHealth(HealthStatus.HEALTHY, message)
-    setattr(_health_state, component, comp_health)
+    with _lock:
+        _health_state.set_component(component, comp_health)
 
 
 def set_component_unhealthy(component: str, error: str) -> None:
@@ -134,8 +183,9 @@ def set_component_unhealthy(component: str, error: str) -> None:
         error: Error message
     """
     comp_health = ComponentHealth(HealthStatus.UNHEALTHY, error=error)
-    setattr(_health_state, component, comp_health)
-    _health_state.errors.append(f"{component}: {error}")
+    with _lock:
+        _health_state.set_component(component, comp_health)
+        _health_state.errors.append(f"{component}: {error}")
 
 
 def set_component_degraded(component: str, warning: str) -> None:
@@ -147,11 +197,13 @@ def set_component_degraded(component: str, warning: str) -> None:
         warning: Warning message
     """
     comp_health = ComponentHealth(HealthStatus.DEGRADED, error=warning)
-    setattr(_health_state, component, comp_health)
-    _health_state.warnings.append(f"{component}: {warning}")
+    with _lock:
+        _health_state.set_component(component, comp_health)
+        _health_state.warnings.append(f"{component}: {warning}")
 
 
 def reset_health_state() -> None:
     """Reset health state to initial values (for testing)"""
     global _health_state
-    _health_state = SystemHealth()
+    with _lock:
+        _health_state = SystemHealth()
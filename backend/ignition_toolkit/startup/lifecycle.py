@@ -5,8 +5,13 @@ Orchestrates application startup and shutdown using FastAPI's lifespan
 context manager pattern.
 """
 
+import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, UTC
 
 from fastapi import FastAPI
@@ -14,212 +19,356 @@ from fastapi import FastAPI
 from ignition_toolkit.core.config import is_dev_mode
 from ignition_toolkit.startup.exceptions import StartupError
 from ignition_toolkit.startup.health import (
+    DEFAULT_COMPONENTS,
     HealthStatus,
     get_health_state,
     set_component_degraded,
     set_component_healthy,
     set_component_unhealthy,
 )
-from ignition_toolkit.startup.validators import (
-    initialize_database,
-    initialize_vault,
-    validate_environment,
-    validate_frontend,
-    validate_playbooks,
-)
 
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 60
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """
+    A single startup phase
+
+    Attributes:
+        component: Health component updated with the phase result
+        label: Human-readable phase name used in log messages
+        run: Coroutine function taking the app and returning the healthy
+            status message, or None to leave the component unrecorded
+        critical: Whether a failure aborts startup (otherwise it degrades)
     """
-    FastAPI lifespan context manager
 
-    Handles startup initialization and shutdown cleanup.
-    Runs validation in phases:
-    1. Environment (CRITICAL - must pass)
-    2. Database (CRITICAL - must pass)
-    3. Credential Vault (CRITICAL - must pass)
-    4. Playbook Library (NON-FATAL - warns if fails)
-    5. Frontend Build (NON-FATAL - production only)
+    component: str
+    label: str
+    run: Callable[[FastAPI], Awaitable[str | None]]
+    critical: bool = False
 
-    Yields control to FastAPI to handle requests, then cleans up on shutdown.
+
+async def _validate_environment(app: FastAPI) -> None:
+    from ignition_toolkit.startup.validators import validate_environment
+
+    await validate_environment()
+
+
+async def _initialize_database(app: FastAPI) -> str:
+    from ignition_toolkit.startup.validators import initialize_database
+
+    await initialize_database()
+    return "Database operational"
+
+
+async def _initialize_vault(app: FastAPI) -> str:
+    from ignition_toolkit.startup.validators import initialize_vault
+
+    await initialize_vault()
+    return "Vault operational"
+
+
+async def _initialize_services(app: FastAPI) -> str:
+    from ignition_toolkit.api.services import AppServices
+
+    app.state.services = AppServices.create(ttl_minutes=30)
+    return "Application services initialized"
+
+
+async def _check_playbooks(app: FastAPI) -> str:
+    from ignition_toolkit.startup.validators import validate_playbooks
+
+    stats = await validate_playbooks()
+    return f"Found {stats['total']} playbooks"
+
+
+def _probe_browser() -> str | None:
     """
-    health = get_health_state()
-    start_time = datetime.now(UTC)
+    Look for the bundled Playwright browser
 
-    logger.info("=" * 60)
-    logger.info("Ignition Automation Toolkit - Startup")
-    logger.info("=" * 60)
+    Returns:
+        None if a browser is installed, otherwise a diagnostic detail
+    """
+    from ignition_toolkit.startup.playwright_installer import (
+        get_playwright_browsers_path,
+        is_browser_installed_cached,
+    )
+
+    browsers_path = get_playwright_browsers_path()
+    logger.info("Checking for browsers at: %s", browsers_path)
+    if is_browser_installed_cached():
+        return None
+
+    # Browser not found - provide diagnostic detail
+    if browsers_path.exists():
+        contents = [p.name for p in browsers_path.iterdir()]
+        return (
+            f"Browser directory exists at {browsers_path} but no Chromium executable found. "
+            f"Contents: {contents}"
+        )
+    return f"Browser directory not found at {browsers_path}"
+
+
+async def _check_browser(app: FastAPI) -> str:
+    """
+    Browsers should be bundled with the installer - just verify they exist.
+    The probe is pure filesystem work, so it runs off the event loop.
+    """
+    detail = await asyncio.to_thread(_probe_browser)
+    if detail is not None:
+        logger.warning("   Playbooks requiring a browser will fail.")
+        raise RuntimeError(detail)
+    return "Chromium browser ready"
 
-    try:
-        # Phase 1: Environment Validation (CRITICAL)
-        logger.info("Phase 1/8: Environment Validation")
-        try:
-            await validate_environment()
-            logger.info("[OK] Environment validated")
-        except StartupError as e:
-            logger.error(f"[ERROR] {e}")
-            set_component_unhealthy("environment", str(e))
-            raise
 
-        # Phase 2: Database Initialization (CRITICAL)
-        logger.info("Phase 2/8: Database Initialization")
-        try:
-            await initialize_database()
-            set_component_healthy("database", "Database operational")
-            logger.info("[OK] Database initialized")
-        except StartupError as e:
-            logger.error(f"[ERROR] {e}")
-            set_component_unhealthy("database", str(e))
-            raise
+async def _check_frontend(app: FastAPI) -> str:
+    """
+    Production only. In frozen mode (PyInstaller), Electron serves the
+    frontend, so validation is skipped.
+    """
+    from ignition_toolkit.core.paths import is_frozen
 
-        # Phase 3: Credential Vault (CRITICAL)
-        logger.info("Phase 3/8: Credential Vault Initialization")
-        try:
-            await initialize_vault()
-            set_component_healthy("vault", "Vault operational")
-            logger.info("[OK] Credential vault initialized")
-        except StartupError as e:
-            logger.error(f"[ERROR] {e}")
-            set_component_unhealthy("vault", str(e))
-            raise
+    if is_frozen():
+        return "Electron serves frontend"
+    if is_dev_mode():
+        return "Dev mode - frontend served separately"
+
+    from ignition_toolkit.startup.validators import validate_frontend
+
+    await validate_frontend()
+    return "Frontend build verified"
+
+
+async def _start_scheduler(app: FastAPI) -> str:
+    from ignition_toolkit.scheduler import get_scheduler
+
+    await get_scheduler().start()
+    return "Scheduler running"
+
+
+# Startup phases in order. Critical phases run one after another before
+# requests are served; the rest are independent and run concurrently after.
+PHASES = (
+    PhaseSpec("environment", "Environment Validation", _validate_environment, critical=True),
+    PhaseSpec("database", "Database Initialization", _initialize_database, critical=True),
+    PhaseSpec("vault", "Credential Vault Initialization", _initialize_vault, critical=True),
+    PhaseSpec("services", "Application Services", _initialize_services, critical=True),
+    PhaseSpec("playbooks", "Playbook Library Validation", _check_playbooks),
+    PhaseSpec("browser", "Playwright Browser Check", _check_browser),
+    PhaseSpec("frontend", "Frontend Validation", _check_frontend),
+    PhaseSpec("scheduler", "Playbook Scheduler", _start_scheduler),
+)
+
+
+class _PhaseLog:
+    """
+    Collects one phase's log lines and emits them as a single record
+
+    Lines are buffered while the phase runs and flushed on exit with an
+    [OK] or [ERROR] line appended, so phases running concurrently never
+    interleave their output.
+    """
+
+    def __init__(self, index: int, label: str):
+        self.label = label
+        self.level = logging.INFO
+        self.lines = [f"Phase {index}/{len(PHASES)}: {label}"]
+
+    def warning(self, line: str) -> None:
+        """Add a line and raise the record to WARNING level"""
+        self.lines.append(line)
+        self.level = max(self.level, logging.WARNING)
+
+    def __enter__(self) -> "_PhaseLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.level = logging.ERROR
+            self.lines.append(f"[ERROR] {self.label} failed")
+        elif self.level == logging.INFO:
+            self.lines.append(f"[OK] {self.label} complete")
+        if logger.isEnabledFor(self.level):
+            logger.log(self.level, "%s", "\n".join(self.lines))
 
-        # Phase 4: Playbook Library (NON-FATAL)
-        logger.info("Phase 4/8: Playbook Library Validation")
+
+async def _run_critical_phase(index: int, phase: PhaseSpec, app: FastAPI) -> None:
+    """
+    Run a critical startup phase, re-raising any failure
+
+    StartupError carries its component and is recorded once by lifespan();
+    other exceptions are recorded against the phase's component here. The
+    failure details are logged by lifespan()'s error banner.
+
+    Args:
+        index: 1-based position of the phase in PHASES
+        phase: Phase to run
+        app: FastAPI application being started
+    """
+    with _PhaseLog(index, phase.label):
         try:
-            stats = await validate_playbooks()
-            set_component_healthy("playbooks", f"Found {stats['total']} playbooks")
-            logger.info("[OK] Playbook library validated")
+            message = await phase.run(app)
+        except StartupError:
+            raise
         except Exception as e:
-            logger.warning(f"[WARN]  Playbook validation failed: {e}")
-            set_component_degraded("playbooks", str(e))
+            set_component_unhealthy(phase.component, str(e))
+            raise
+        if message is not None:
+            set_component_healthy(phase.component, message)
+
 
-        # Phase 5: Playwright Browser (NON-FATAL but required for playbook execution)
-        # Browsers should be bundled with the installer - just verify they exist
-        logger.info("Phase 5/8: Playwright Browser Check")
+async def _run_phase(index: int, phase: PhaseSpec, app: FastAPI) -> None:
+    """
+    Run a non-fatal startup phase and record its outcome
+
+    Args:
+        index: 1-based position of the phase in PHASES
+        phase: Phase to run
+        app: FastAPI application being started
+    """
+    with _PhaseLog(index, phase.label) as log:
         try:
-            from ignition_toolkit.startup.playwright_installer import (
-                is_browser_installed,
-                get_playwright_browsers_path,
-            )
-
-            browsers_path = get_playwright_browsers_path()
-            logger.info(f"Checking for browsers at: {browsers_path}")
-            logger.info(f"  Path exists: {browsers_path.exists()}")
-            if browsers_path.exists():
-                contents = list(browsers_path.iterdir())
-                logger.info(f"  Contents: {[p.name for p in contents]}")
-
-            if is_browser_installed():
-                set_component_healthy("browser", "Chromium browser ready")
-                logger.info("[OK] Playwright browser ready")
-            else:
-                # Browser not found - provide diagnostic detail
-                if browsers_path.exists():
-                    contents = [p.name for p in browsers_path.iterdir()]
-                    detail = f"Browser directory exists at {browsers_path} but no Chromium executable found. Contents: {contents}"
-                else:
-                    detail = f"Browser directory not found at {browsers_path}"
-                set_component_degraded("browser", detail)
-                logger.warning(f"[WARN]  {detail}")
-                logger.warning("   Playbooks requiring a browser will fail.")
+            message = await phase.run(app)
         except Exception as e:
-            logger.warning(f"[WARN]  Browser check failed: {e}")
-            set_component_degraded("browser", str(e))
-
-        # Phase 6: Frontend Build (NON-FATAL, production only)
-        # In frozen mode (PyInstaller), Electron serves the frontend - skip validation
-        from ignition_toolkit.core.paths import is_frozen
-        if is_frozen():
-            logger.info("Phase 6/8: Frontend Validation (SKIPPED - Electron serves frontend)")
-            set_component_healthy("frontend", "Electron serves frontend")
-        elif not is_dev_mode():
-            logger.info("Phase 6/8: Frontend Validation")
-            try:
-                await validate_frontend()
-                set_component_healthy("frontend", "Frontend build verified")
-                logger.info("[OK] Frontend validated")
-            except Exception as e:
-                logger.warning(f"[WARN]  Frontend validation failed: {e}")
-                set_component_degraded("frontend", str(e))
-        else:
-            logger.info("Phase 6/8: Frontend Validation (SKIPPED - dev mode)")
-            set_component_healthy("frontend", "Dev mode - frontend served separately")
-
-        # Phase 7: Start Scheduler (NON-FATAL)
-        logger.info("Phase 7/8: Starting Playbook Scheduler")
-        try:
-            from ignition_toolkit.scheduler import get_scheduler
+            log.warning(f"[WARN]  {phase.label} failed: {e}")
+            set_component_degraded(phase.component, str(e))
+            return
+        if message is not None:
+            set_component_healthy(phase.component, message)
 
-            scheduler = get_scheduler()
-            await scheduler.start()
-            set_component_healthy("scheduler", "Scheduler running")
-            logger.info("[OK] Playbook scheduler started")
-        except Exception as e:
-            logger.warning(f"[WARN]  Scheduler startup failed: {e}")
-            set_component_degraded("scheduler", str(e))
 
-        # Phase 8: Initialize Application Services
-        logger.info("Phase 8/8: Initializing Application Services")
-        try:
-            from ignition_toolkit.api.services import AppServices
+async def _deferred_init(app: FastAPI, start_time: float) -> None:
+    """
+    Run the non-fatal startup phases concurrently, then mark the system ready
+
+    Args:
+        app: FastAPI application being started
+        start_time: time.monotonic() value when startup began
+    """
+    deferred = [(i, phase) for i, phase in enumerate(PHASES, 1) if not phase.critical]
+    logger.info("Running %d non-fatal phases in the background", len(deferred))
+    await asyncio.gather(*(_run_phase(i, phase, app) for i, phase in deferred))
+    _finish_startup(start_time)
+
+
+def _finish_startup(start_time: float) -> None:
+    """
+    Mark the system ready, settle overall health and log the summary
+
+    Args:
+        start_time: time.monotonic() value when startup began
+    """
+    health = get_health_state()
+    health.ready = True
+    health.startup_time = datetime.now(UTC)
+
+    # Determine overall health
+    if health.errors:
+        health.overall = HealthStatus.UNHEALTHY
+    elif health.warnings:
+        health.overall = HealthStatus.DEGRADED
+    else:
+        health.overall = HealthStatus.HEALTHY
+
+    # Startup summary; the multi-line blocks are only built if they will be logged
+    elapsed = time.monotonic() - start_time
+    if logger.isEnabledFor(logging.INFO):
+        summary = [
+            _SEP,
+            f"[OK] System Ready (Startup time: {elapsed:.2f}s)",
+            f"   Overall Status: {health.overall.value.upper()}",
+        ]
+        summary.extend(
+            f"   {name.capitalize()}: {health.components[name].status.value}"
+            for name in DEFAULT_COMPONENTS
+        )
+        logger.info("%s", "\n".join(summary))
+
+    if health.warnings and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "   Warnings: %d\n%s",
+            len(health.warnings),
+            "\n".join(f"     - {warning}" for warning in health.warnings),
+        )
+
+    logger.info(_SEP)
+
+
+async def _cleanup_services(app: FastAPI) -> None:
+    """Release application services, logging (not raising) failures"""
+    try:
+        services = getattr(app.state, "services", None)
+        if services is not None:
+            await services.cleanup()
+            logger.info("[OK] Application services cleaned up")
+    except Exception as e:
+        logger.warning("[WARN]  Service cleanup warning: %s", e)
 
-            services = AppServices.create(ttl_minutes=30)
-            app.state.services = services
-            set_component_healthy("services", "Application services initialized")
-            logger.info("[OK] Application services initialized")
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to initialize services: {e}")
-            set_component_unhealthy("services", str(e))
-            raise
 
-        # Mark system ready
-        health.ready = True
-        health.startup_time = datetime.now(UTC)
-
-        # Determine overall health
-        if health.errors:
-            health.overall = HealthStatus.UNHEALTHY
-        elif health.warnings:
-            health.overall = HealthStatus.DEGRADED
-        else:
-            health.overall = HealthStatus.HEALTHY
-
-        # Startup summary
-        elapsed = (datetime.now(UTC) - start_time).total_seconds()
-        logger.info("=" * 60)
-        logger.info(f"[OK] System Ready (Startup time: {elapsed:.2f}s)")
-        logger.info(f"   Overall Status: {health.overall.value.upper()}")
-        logger.info(f"   Database: {health.database.status.value}")
-        logger.info(f"   Vault: {health.vault.status.value}")
-        logger.info(f"   Playbooks: {health.playbooks.status.value}")
-        logger.info(f"   Browser: {health.browser.status.value}")
-        logger.info(f"   Frontend: {health.frontend.status.value}")
-        logger.info(f"   Scheduler: {health.scheduler.status.value if hasattr(health, 'scheduler') else 'N/A'}")
-
-        if health.warnings:
-            logger.warning(f"   Warnings: {len(health.warnings)}")
-            for warning in health.warnings:
-                logger.warning(f"     - {warning}")
-
-        logger.info("=" * 60)
+async def _stop_scheduler() -> None:
+    """Stop the playbook scheduler, logging (not raising) failures"""
+    try:
+        from ignition_toolkit.scheduler import get_scheduler
+
+        await get_scheduler().stop()
+        logger.info("[OK] Scheduler stopped")
+    except Exception as e:
+        logger.warning("[WARN]  Scheduler shutdown warning: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    FastAPI lifespan context manager
+
+    Handles startup initialization and shutdown cleanup.
+    Runs validation in phases:
+    1. Environment (CRITICAL - must pass)
+    2. Database (CRITICAL - must pass)
+    3. Credential Vault (CRITICAL - must pass)
+    4. Application Services (CRITICAL - must pass)
+    5. Playbook Library (NON-FATAL - warns if fails)
+    6. Playwright Browser (NON-FATAL)
+    7. Frontend Build (NON-FATAL - production only)
+    8. Playbook Scheduler (NON-FATAL)
+
+    Phases are declared in PHASES. Requests are served as soon as the
+    critical phases pass. Phases 5-8 are independent of each other and run
+    concurrently in the background; the system is marked ready once they
+    finish.
+
+    Yields control to FastAPI to handle requests, then cleans up on shutdown.
+    """
+    health = get_health_state()
+    start_time = time.monotonic()
+    deferred: asyncio.Task | None = None
+
+    logger.info("%s\nIgnition Automation Toolkit - Startup\n%s", _SEP, _SEP)
+
+    try:
+        for index, phase in enumerate(PHASES, 1):
+            if phase.critical:
+                await _run_critical_phase(index, phase, app)
+
+        # Phases 5-8 are non-fatal: start serving now and finish them in the
+        # background. Until they complete the system reports degraded/not ready.
+        health.overall = HealthStatus.DEGRADED
+        deferred = asyncio.create_task(_deferred_init(app, start_time))
 
         yield  # Application runs here
 
     except StartupError as e:
-        logger.error("=" * 60)
-        logger.error(f"[ERROR] Startup failed: {e}")
-        logger.error("=" * 60)
+        logger.error("%s\n[ERROR] Startup failed: %s\n%s", _SEP, e, _SEP)
+        set_component_unhealthy(e.component.lower(), str(e))
         health.overall = HealthStatus.UNHEALTHY
         health.ready = False
         raise
 
     except Exception as e:
-        logger.error("=" * 60)
-        logger.error(f"[ERROR] Unexpected startup error: {e}", exc_info=True)
-        logger.error("=" * 60)
+        logger.error("%s\n[ERROR] Unexpected startup error: %s\n%s", _SEP, e, _SEP, exc_info=True)
         health.overall = HealthStatus.UNHEALTHY
         health.ready = False
         raise
@@ -228,22 +377,12 @@ async def lifespan(app: FastAPI):
         # Shutdown cleanup
         logger.info("[STOP] Shutting down...")
 
-        # Cleanup application services
-        try:
-            if hasattr(app.state, "services"):
-                await app.state.services.cleanup()
-                logger.info("[OK] Application services cleaned up")
-        except Exception as e:
-            logger.warning(f"[WARN]  Service cleanup warning: {e}")
+        if deferred is not None and not deferred.done():
+            deferred.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await deferred
 
-        # Stop scheduler
-        try:
-            from ignition_toolkit.scheduler import get_scheduler
-
-            scheduler = get_scheduler()
-            await scheduler.stop()
-            logger.info("[OK] Scheduler stopped")
-        except Exception as e:
-            logger.warning(f"[WARN]  Scheduler shutdown warning: {e}")
+        # Services and scheduler hold disjoint resources, so stop them together
+        await asyncio.gather(_cleanup_services(app), _stop_scheduler())
 
         logger.info("[OK] Shutdown complete")
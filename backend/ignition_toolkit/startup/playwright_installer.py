@@ -9,9 +9,11 @@ run 'playwright install'.
 import asyncio
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+from functools import cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,46 @@ logger = logging.getLogger(__name__)
 # Browser to install (chromium is sufficient for this application)
 BROWSER_TYPE = "chromium"
 
-
+# Browser directory prefixes inside the Playwright cache, in lookup order
+BROWSER_DIR_PREFIXES = ("chromium-", "chromium_headless_shell-")
+
+# Executables to look for inside a browser directory, by platform and browser variant.
+# Playwright versions use different directory names (e.g., chrome-win vs chrome-win64)
+if sys.platform == "win32":
+    _BROWSER_EXECUTABLES = (
+        os.path.join("chrome-win", "chrome.exe"),
+        os.path.join("chrome-win64", "chrome.exe"),
+        os.path.join("chrome-win", "headless_shell.exe"),
+        os.path.join("chrome-win64", "headless_shell.exe"),
+        os.path.join("chrome-headless-shell-win64", "headless_shell.exe"),
+    )
+elif sys.platform == "darwin":
+    _BROWSER_EXECUTABLES = (
+        os.path.join("chrome-mac", "Chromium.app", "Contents", "MacOS", "Chromium"),
+        os.path.join("chrome-mac-arm64", "Chromium.app", "Contents", "MacOS", "Chromium"),
+        os.path.join("chrome-mac", "headless_shell"),
+        os.path.join("chrome-mac-arm64", "headless_shell"),
+    )
+else:
+    _BROWSER_EXECUTABLES = (
+        os.path.join("chrome-linux", "chrome"),
+        os.path.join("chrome-linux", "headless_shell"),
+    )
+
+# Seconds allowed for a browser download before the installer is killed
+INSTALL_TIMEOUT = 300
+
+# Download percentage in Playwright's install output (e.g. "|■■■■   |  40% of 150 MiB")
+_PERCENT_RE = re.compile(r"(\d{1,3})%")
+
+# Data-dir file remembering the executable found by the last successful check
+BROWSER_SENTINEL = ".browser_ok"
+
+# In-process cache of the last executable found and its mtime; cleared on install
+_BROWSER_CACHE: tuple[Path, float] | None = None
+
+
+@cache
 def get_playwright_browsers_path() -> Path:
     """
     Get the path where Playwright stores browsers.
@@ -27,6 +68,9 @@ def get_playwright_browsers_path() -> Path:
     Playwright uses different locations based on environment:
     - PLAYWRIGHT_BROWSERS_PATH env var if set
     - Otherwise platform-specific cache directory
+
+    The result is cached for the life of the process. core.config sets
+    PLAYWRIGHT_BROWSERS_PATH on import, which happens before this module loads.
     """
     # Check for custom path
     custom_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
@@ -51,59 +95,196 @@ def get_playwright_browsers_path() -> Path:
         return Path.home() / ".cache" / "ms-playwright"
 
 
-def is_browser_installed() -> bool:
+def _find_browser_executable() -> Path | None:
     """
-    Check if Playwright Chromium browser is installed.
+    Locate the Playwright Chromium executable.
 
     Checks for both regular chromium and headless shell variants,
     as Playwright versions may use different browser packages.
 
     Returns:
-        True if browser appears to be installed, False otherwise
+        Path of the first executable found, or None if not installed
     """
     browsers_path = get_playwright_browsers_path()
 
-    if not browsers_path.exists():
-        logger.info(f"Playwright browsers directory not found: {browsers_path}")
-        return False
-
     # Check for different Chromium variants (newer Playwright uses chromium_headless_shell)
-    # Pattern: chromium-*, chromium_headless_shell-*
-    browser_patterns = ["chromium-*", "chromium_headless_shell-*"]
-
-    for pattern in browser_patterns:
-        chromium_dirs = list(browsers_path.glob(pattern))
-        for chromium_dir in chromium_dirs:
-            # Check for executables based on platform and browser variant
-            # Playwright versions use different directory names (e.g., chrome-win vs chrome-win64)
-            if sys.platform == "win32":
-                exe_paths = [
-                    chromium_dir / "chrome-win" / "chrome.exe",
-                    chromium_dir / "chrome-win64" / "chrome.exe",
-                    chromium_dir / "chrome-win" / "headless_shell.exe",
-                    chromium_dir / "chrome-win64" / "headless_shell.exe",
-                    chromium_dir / "chrome-headless-shell-win64" / "headless_shell.exe",
-                ]
-            elif sys.platform == "darwin":
-                exe_paths = [
-                    chromium_dir / "chrome-mac" / "Chromium.app" / "Contents" / "MacOS" / "Chromium",
-                    chromium_dir / "chrome-mac-arm64" / "Chromium.app" / "Contents" / "MacOS" / "Chromium",
-                    chromium_dir / "chrome-mac" / "headless_shell",
-                    chromium_dir / "chrome-mac-arm64" / "headless_shell",
-                ]
-            else:
-                exe_paths = [
-                    chromium_dir / "chrome-linux" / "chrome",
-                    chromium_dir / "chrome-linux" / "headless_shell",
-                ]
-
-            for exe_path in exe_paths:
-                if exe_path.exists():
-                    logger.info(f"Found Chromium browser at: {exe_path}")
-                    return True
+    # in a single directory pass; regular chromium-* installs are tried first, and within
+    # each variant the newest revision, which is the one a current Playwright launches
+    try:
+        with os.scandir(browsers_path) as it:
+            candidates = [
+                (not entry.name.startswith("chromium-"), -entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.startswith(BROWSER_DIR_PREFIXES) and entry.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        logger.info("Playwright browsers directory not found: %s", browsers_path)
+        return None
+    candidates.sort()
+
+    for _, _, candidate in candidates:
+        for rel_path in _BROWSER_EXECUTABLES:
+            exe_path = os.path.join(candidate, rel_path)
+            # isfile() rejects directories and dangling symlinks with the same single stat
+            if os.path.isfile(exe_path):
+                logger.info("Found Chromium browser at: %s", exe_path)
+                return Path(exe_path)
 
     logger.info("No Chromium browser executable found in Playwright cache")
-    return False
+    return None
+
+
+def _browser_executable() -> Path | None:
+    """
+    Get the Chromium executable, reusing the in-process cache when valid.
+
+    The cached path is trusted while it still exists with the same mtime,
+    so repeated checks cost one stat instead of a directory walk.
+
+    Returns:
+        Path of the executable, or None if not installed
+    """
+    global _BROWSER_CACHE
+
+    if _BROWSER_CACHE is not None:
+        exe_path, mtime = _BROWSER_CACHE
+        try:
+            if exe_path.stat().st_mtime == mtime:
+                return exe_path
+        except OSError:
+            pass
+        _BROWSER_CACHE = None
+
+    exe_path = _find_browser_executable()
+    if exe_path is not None:
+        try:
+            _BROWSER_CACHE = (exe_path, exe_path.stat().st_mtime)
+        except OSError:
+            pass
+    return exe_path
+
+
+def _clear_browser_cache() -> None:
+    """Forget the cached executable so the next check walks the directory"""
+    global _BROWSER_CACHE
+    _BROWSER_CACHE = None
+
+
+def is_browser_installed() -> bool:
+    """
+    Check if Playwright Chromium browser is installed.
+
+    Returns:
+        True if browser appears to be installed, False otherwise
+    """
+    return _browser_executable() is not None
+
+
+def is_browser_installed_cached() -> bool:
+    """
+    Check for the Chromium browser, reusing the last successful result.
+
+    A sentinel file in the data directory records the executable found by
+    the last full check. While the sentinel is newer than the browsers
+    directory (no browser added or removed since) and the executable still
+    exists, the directory walk is skipped.
+
+    Returns:
+        True if browser appears to be installed, False otherwise
+    """
+    from ignition_toolkit.core.paths import get_data_dir
+
+    browsers_path = get_playwright_browsers_path()
+    sentinel = get_data_dir() / BROWSER_SENTINEL
+
+    try:
+        if sentinel.stat().st_mtime >= browsers_path.stat().st_mtime:
+            exe_path = Path(sentinel.read_text(encoding="utf-8"))
+            if exe_path.is_relative_to(browsers_path) and exe_path.exists():
+                return True
+    except OSError:
+        pass
+
+    exe_path = _browser_executable()
+    try:
+        if exe_path is None:
+            sentinel.unlink(missing_ok=True)
+        else:
+            sentinel.write_text(str(exe_path), encoding="utf-8")
+    except OSError as e:
+        logger.debug("Could not update browser sentinel %s: %s", sentinel, e)
+    return exe_path is not None
+
+
+async def _run_install_command(cmd: list[str], progress_callback, start: float):
+    """
+    Run a browser install command, streaming its download progress.
+
+    stdout is read line by line so progress_callback follows the percentages
+    Playwright prints, scaled between start and 0.95. stderr is drained
+    concurrently so neither pipe can fill up and stall the installer.
+
+    If the command times out, progress_callback raises, or the caller is
+    cancelled, the child is killed and reaped and the pipe readers are
+    cancelled before the error propagates.
+
+    Returns:
+        Tuple of (return code, stdout text, stderr text)
+
+    Raises:
+        asyncio.TimeoutError: If the command runs longer than INSTALL_TIMEOUT
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout = bytearray()
+    stderr = bytearray()
+
+    async def pump_stdout():
+        progress = start
+        async for line in process.stdout:
+            stdout.extend(line)
+            if progress_callback is None:
+                continue
+            text = line.decode(errors="ignore")
+            match = _PERCENT_RE.search(text)
+            if match:
+                # Playwright downloads several packages; never move the bar backwards
+                fraction = min(int(match.group(1)), 100) / 100
+                progress = max(progress, start + (0.95 - start) * fraction)
+                await progress_callback(text.strip(), progress)
+
+    async def pump_stderr():
+        async for line in process.stderr:
+            stderr.extend(line)
+
+    tasks = [
+        asyncio.ensure_future(pump_stdout()),
+        asyncio.ensure_future(pump_stderr()),
+        asyncio.ensure_future(process.wait()),
+    ]
+    try:
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=INSTALL_TIMEOUT)
+    except BaseException:
+        # gather does not cancel its siblings when one fails, so stop them here
+        for task in tasks:
+            task.cancel()
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return (
+        process.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
 
 
 async def install_browser(progress_callback=None) -> bool:
@@ -118,6 +299,7 @@ async def install_browser(progress_callback=None) -> bool:
         True if installation successful, False otherwise
     """
     logger.info("Installing Playwright Chromium browser...")
+    _clear_browser_cache()
 
     if progress_callback:
         await progress_callback("Starting browser download...", 0.0)
@@ -131,35 +313,30 @@ async def install_browser(progress_callback=None) -> bool:
         # Development mode - use python -m playwright
         playwright_cmd = [sys.executable, "-m", "playwright", "install", BROWSER_TYPE]
 
-        logger.info(f"Running: {' '.join(playwright_cmd)}")
+        logger.info("Running: %s", " ".join(playwright_cmd))
 
         if progress_callback:
             await progress_callback("Downloading Chromium browser...", 0.1)
 
         # Run installation with timeout (5 minutes max)
-        process = await asyncio.create_subprocess_exec(
-            *playwright_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+            returncode, stdout, stderr = await _run_install_command(
+                playwright_cmd, progress_callback, 0.1
+            )
         except asyncio.TimeoutError:
             logger.error("Browser installation timed out after 5 minutes")
-            process.kill()
             if progress_callback:
                 await progress_callback("Installation timed out", 1.0)
             return False
 
-        if process.returncode == 0:
+        if returncode == 0:
             logger.info("Playwright Chromium browser installed successfully")
             if progress_callback:
                 await progress_callback("Browser installed successfully", 1.0)
             return True
         else:
-            error_msg = stderr.decode() if stderr else stdout.decode()
-            logger.error(f"Browser installation failed: {error_msg}")
+            error_msg = stderr or stdout
+            logger.error("Browser installation failed: %s", error_msg)
             if progress_callback:
                 await progress_callback(f"Installation failed: {error_msg}", 1.0)
             return False
@@ -169,12 +346,30 @@ async def install_browser(progress_callback=None) -> bool:
         logger.warning("Playwright CLI not found, trying driver installation...")
         return await _install_browser_via_driver(progress_callback)
     except Exception as e:
-        logger.error(f"Browser installation error: {e}")
+        logger.error("Browser installation error: %s", e)
         if progress_callback:
             await progress_callback(f"Installation error: {e}", 1.0)
         return False
 
 
+@cache
+def _driver_executable():
+    """
+    Resolve Playwright's driver executable, once per process.
+
+    Playwright is imported here rather than at module level so that the
+    startup browser check doesn't pay for it. Import errors are not cached,
+    so a later call can still succeed.
+
+    Returns:
+        (node_executable, cli_js) tuple, or a single executable path on
+        older Playwright versions
+    """
+    from playwright._impl._driver import compute_driver_executable
+
+    return compute_driver_executable()
+
+
 async def _install_browser_via_driver(progress_callback=None) -> bool:
     """
     Install browser using Playwright's driver executable directly.
@@ -182,15 +377,13 @@ async def _install_browser_via_driver(progress_callback=None) -> bool:
     This method works for both frozen (PyInstaller) and development modes.
     It uses Playwright's bundled driver to download and install browsers.
     """
+    _clear_browser_cache()
     try:
         if progress_callback:
             await progress_callback("Using Playwright driver for installation...", 0.1)
 
-        # Import playwright's driver module
-        from playwright._impl._driver import compute_driver_executable
-
         # Get the driver path - returns (node_executable, cli_js_path)
-        driver_info = compute_driver_executable()
+        driver_info = _driver_executable()
 
         # Handle both tuple return (node, cli.js) and single executable return
         if isinstance(driver_info, tuple):
@@ -199,55 +392,47 @@ async def _install_browser_via_driver(progress_callback=None) -> bool:
         else:
             cmd = [str(driver_info), "install", BROWSER_TYPE]
 
-        logger.info(f"Running Playwright driver: {' '.join(cmd)}")
+        logger.info("Running Playwright driver: %s", " ".join(cmd))
 
         if progress_callback:
             await progress_callback("Downloading Chromium browser...", 0.2)
 
         # Run the driver with install command (5 minute timeout)
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+            returncode, stdout_text, stderr_text = await _run_install_command(
+                cmd, progress_callback, 0.2
+            )
         except asyncio.TimeoutError:
             logger.error("Driver browser installation timed out after 5 minutes")
-            process.kill()
             if progress_callback:
                 await progress_callback("Installation timed out", 1.0)
             return False
 
-        stdout_text = stdout.decode() if stdout else ""
-        stderr_text = stderr.decode() if stderr else ""
-
         # Log output for debugging
         if stdout_text:
-            logger.info(f"Driver stdout: {stdout_text}")
+            logger.info("Driver stdout: %s", stdout_text)
         if stderr_text:
-            logger.info(f"Driver stderr: {stderr_text}")
+            logger.info("Driver stderr: %s", stderr_text)
 
-        if process.returncode == 0:
+        if returncode == 0:
             logger.info("Browser installed via Playwright driver")
             if progress_callback:
                 await progress_callback("Browser installed successfully", 1.0)
             return True
         else:
             error_msg = stderr_text or stdout_text or "Unknown error"
-            logger.error(f"Driver installation failed (code {process.returncode}): {error_msg}")
+            logger.error("Driver installation failed (code %s): %s", returncode, error_msg)
             if progress_callback:
                 await progress_callback(f"Installation failed: {error_msg}", 1.0)
             return False
 
     except ImportError as e:
-        logger.error(f"Could not import Playwright driver: {e}")
+        logger.error("Could not import Playwright driver: %s", e)
         if progress_callback:
             await progress_callback(f"Playwright driver not available: {e}", 1.0)
         return False
     except Exception as e:
-        logger.error(f"Driver installation failed: {e}")
+        logger.error("Driver installation failed: %s", e)
         if progress_callback:
             await progress_callback(f"Installation error: {e}", 1.0)
         return False
@@ -290,13 +475,10 @@ def get_browser_info() -> dict:
         "chromium_path": None,
     }
 
-    if browsers_path.exists():
-        # Check for both chromium variants
-        for pattern in ["chromium-*", "chromium_headless_shell-*"]:
-            chromium_dirs = list(browsers_path.glob(pattern))
-            if chromium_dirs:
-                info["chromium_installed"] = True
-                info["chromium_path"] = str(chromium_dirs[0])
-                break
+    exe_path = _browser_executable()
+    if exe_path is not None:
+        # Report the chromium-*/chromium_headless_shell-* directory holding the executable
+        info["chromium_installed"] = True
+        info["chromium_path"] = str(browsers_path / exe_path.relative_to(browsers_path).parts[0])
 
     return info
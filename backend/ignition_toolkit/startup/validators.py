@@ -12,6 +12,8 @@ Validates system components during startup in phases:
 import logging
 import os
 import sys
+from collections.abc import Iterator
+from pathlib import Path
 
 from sqlalchemy import text
 
@@ -28,6 +30,19 @@ from ignition_toolkit.storage.database import get_database
 logger = logging.getLogger(__name__)
 
 
+def _iter_yaml(root: Path) -> Iterator[str]:
+    """
+    Yield the paths of *.yaml files under a directory, including subdirectories
+
+    Matches the rglob("*.yaml") discovery used by the playbook library in a
+    single os.walk pass; a missing directory yields nothing.
+    """
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".yaml"):
+                yield os.path.join(dirpath, name)
+
+
 async def validate_environment() -> None:
     """
     Phase 1: Validate environment requirements
@@ -46,7 +61,7 @@ async def validate_environment() -> None:
             f"Python 3.10+ required, found {sys.version}",
             recovery_hint="Upgrade Python: https://www.python.org/downloads/",
         )
-    logger.info(f"[OK] Python version: {sys.version_info.major}.{sys.version_info.minor}")
+    logger.info("[OK] Python version: %s.%s", sys.version_info.major, sys.version_info.minor)
 
     # Check/create data directory
     settings = get_settings()
@@ -55,7 +70,7 @@ async def validate_environment() -> None:
     if not data_dir.exists():
         try:
             data_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"[OK] Created data directory: {data_dir.absolute()}")
+            logger.info("[OK] Created data directory: %s", data_dir.absolute())
         except Exception as e:
             raise EnvironmentError(
                 f"Cannot create data directory: {e}", recovery_hint="Check filesystem permissions"
@@ -66,20 +81,20 @@ async def validate_environment() -> None:
             f"Data directory not writable: {data_dir.absolute()}",
             recovery_hint=f"Fix permissions: chmod u+w {data_dir}",
         )
-    logger.info(f"[OK] Data directory writable: {data_dir.absolute()}")
+    logger.info("[OK] Data directory writable: %s", data_dir.absolute())
 
     # Check/create toolkit directory
     toolkit_dir = settings.vault_path.parent
     if not toolkit_dir.exists():
         try:
             toolkit_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"[OK] Created toolkit directory: {toolkit_dir}")
+            logger.info("[OK] Created toolkit directory: %s", toolkit_dir)
         except Exception as e:
             raise EnvironmentError(
                 f"Cannot create toolkit directory: {e}",
                 recovery_hint="Check home directory permissions",
             )
-    logger.info(f"[OK] Toolkit directory: {toolkit_dir}")
+    logger.info("[OK] Toolkit directory: %s", toolkit_dir)
 
 
 async def initialize_database() -> None:
@@ -107,7 +122,7 @@ async def initialize_database() -> None:
             if result[0] != 1:
                 raise DatabaseInitError("Database test query failed")
 
-        logger.info(f"[OK] Database operational: {db.database_path}")
+        logger.info("[OK] Database operational: %s", db.database_path)
 
     except Exception as e:
         if isinstance(e, DatabaseInitError):
@@ -139,7 +154,7 @@ async def initialize_vault() -> None:
         if not vault.test_encryption():
             raise VaultInitError("Vault encryption test failed")
 
-        logger.info(f"[OK] Credential vault operational: {vault.vault_path}")
+        logger.info("[OK] Credential vault operational: %s", vault.vault_path)
 
     except Exception as e:
         if isinstance(e, VaultInitError):
@@ -169,28 +184,18 @@ async def validate_playbooks() -> dict:
         raise Exception(f"Playbooks directory not found: {playbooks_dir}")
 
     # Count playbooks by domain
-    gateway_playbooks = (
-        list((playbooks_dir / "gateway").glob("*.yaml"))
-        if (playbooks_dir / "gateway").exists()
-        else []
-    )
-    perspective_playbooks = (
-        list((playbooks_dir / "perspective").glob("*.yaml"))
-        if (playbooks_dir / "perspective").exists()
-        else []
-    )
-    example_playbooks = (
-        list((playbooks_dir / "examples").glob("*.yaml"))
-        if (playbooks_dir / "examples").exists()
-        else []
-    )
+    gateway_count = sum(1 for _ in _iter_yaml(playbooks_dir / "gateway"))
+    perspective_count = sum(1 for _ in _iter_yaml(playbooks_dir / "perspective"))
+    example_count = sum(1 for _ in _iter_yaml(playbooks_dir / "examples"))
 
-    total = len(gateway_playbooks) + len(perspective_playbooks) + len(example_playbooks)
+    total = gateway_count + perspective_count + example_count
 
     logger.info(
-        f"[OK] Found {total} playbooks "
-        f"({len(gateway_playbooks)} gateway, {len(perspective_playbooks)} perspective, "
-        f"{len(example_playbooks)} examples)"
+        "[OK] Found %d playbooks (%d gateway, %d perspective, %d examples)",
+        total,
+        gateway_count,
+        perspective_count,
+        example_count,
     )
 
     # PORTABILITY v4: Auto-detect and mark built-in playbooks
@@ -201,13 +206,13 @@ async def validate_playbooks() -> dict:
         metadata_store.auto_detect_built_ins(playbooks_dir)
         logger.info("[OK] Auto-detected built-in playbooks")
     except Exception as e:
-        logger.warning(f"[WARN]  Failed to auto-detect built-in playbooks: {e}")
+        logger.warning("[WARN]  Failed to auto-detect built-in playbooks: %s", e)
 
     return {
         "total": total,
-        "gateway": len(gateway_playbooks),
-        "perspective": len(perspective_playbooks),
-        "examples": len(example_playbooks),
+        "gateway": gateway_count,
+        "perspective": perspective_count,
+        "examples": example_count,
     }
 
 
@@ -232,4 +237,4 @@ async def validate_frontend() -> None:
     if not index_file.exists():
         raise Exception(f"Frontend index.html not found: {index_file.absolute()}")
 
-    logger.info(f"[OK] Frontend build verified: {frontend_dir.absolute()}")
+    logger.info("[OK] Frontend build verified: %s", frontend_dir.absolute())
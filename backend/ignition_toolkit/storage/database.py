@@ -7,25 +7,51 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from ignition_toolkit.config import get_toolkit_data_dir
+from ignition_toolkit.core import json_codec
 from ignition_toolkit.storage.models import Base
 
 logger = logging.getLogger(__name__)
 
+# database_path value selecting a private in-memory database (tests, diagnostics)
+MEMORY_DATABASE = ":memory:"
+
+
+# Connection settings applied as one batch when each SQLite connection opens.
+# WAL lets readers (health checks, schedule lookups) run while an execution
+# writes step results; NORMAL sync is durable in WAL mode apart from the last
+# transactions on power loss. cache_size is in KiB when negative (64 MiB).
+_SQLITE_PRAGMAS = """
+PRAGMA foreign_keys=ON;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+"""
+
 
-# Enable foreign key constraints for SQLite
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign key constraints on SQLite connections"""
+    """Enable foreign keys and WAL mode on SQLite connections"""
     cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.executescript(_SQLITE_PRAGMAS)
     cursor.close()
 
 
+# JSON column codec options for create_engine
+_JSON_ENGINE_OPTIONS = {
+    "json_serializer": json_codec.dumps,
+    "json_deserializer": json_codec.loads,
+}
+
+
 class Database:
     """
     Database connection manager
@@ -35,12 +61,13 @@ class Database:
     to create_all() for environments where Alembic isn't installed.
     """
 
-    def __init__(self, database_path: Path | None = None):
+    def __init__(self, database_path: Path | str | None = None):
         """
         Initialize database connection
 
         Args:
-            database_path: Path to SQLite database file. If None, uses consistent data directory
+            database_path: Path to SQLite database file, or MEMORY_DATABASE (":memory:")
+                for an in-memory database. If None, uses consistent data directory
         """
         if database_path is None:
             # Use consistent data directory instead of relative path
@@ -48,16 +75,28 @@ class Database:
             database_path = data_dir / "ignition_toolkit.db"
 
         self.database_path = database_path
-
-        # Ensure data directory exists
-        self.database_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create SQLAlchemy engine
-        self.engine = create_engine(
-            f"sqlite:///{self.database_path}",
-            echo=False,  # Set to True for SQL query logging
-            pool_pre_ping=True,  # Verify connections before using
-        )
+        self.in_memory = database_path == MEMORY_DATABASE
+
+        if self.in_memory:
+            # A single shared connection, so every session sees the same database
+            self.engine = create_engine(
+                "sqlite://",
+                echo=False,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+                **_JSON_ENGINE_OPTIONS,
+            )
+        else:
+            # Ensure data directory exists
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Create SQLAlchemy engine. No pool_pre_ping: a connection to a local
+            # SQLite file cannot go stale, so the ping was a wasted SELECT 1 per checkout
+            self.engine = create_engine(
+                f"sqlite:///{self.database_path}",
+                echo=False,  # Set to True for SQL query logging
+                **_JSON_ENGINE_OPTIONS,
+            )
 
         # Create session factory
         self.SessionLocal = sessionmaker(
@@ -66,8 +105,15 @@ class Database:
             bind=self.engine,
         )
 
-        # Apply schema (migrations or fallback)
-        self._apply_schema()
+        # Set once the schema has been applied, so create_tables() only runs DDL once
+        self._tables_created = False
+
+        # Apply schema (migrations or fallback). Alembic would open its own
+        # connection, which for :memory: is a different, empty database.
+        if self.in_memory:
+            self._create_tables_fallback()
+        else:
+            self._apply_schema()
 
         logger.info(f"Database initialized: {self.database_path}")
 
@@ -109,12 +155,13 @@ class Database:
                 # Existing database — stamp at baseline so future migrations apply
                 logger.info("Existing database detected, stamping at Alembic baseline (001)")
                 # First ensure all tables exist (in case some were added after last create_all)
-                Base.metadata.create_all(bind=self.engine)
+                self._create_all()
                 command.stamp(alembic_cfg, "001")
             else:
                 # New database or already tracked — run pending migrations
                 command.upgrade(alembic_cfg, "head")
 
+            self._tables_created = True
             logger.info("Database schema up to date (Alembic)")
 
         except ImportError:
@@ -125,12 +172,33 @@ class Database:
             self._create_tables_fallback()
 
     def create_tables(self) -> None:
-        """Create all database tables (idempotent)"""
+        """
+        Create all database tables (idempotent)
+
+        A no-op once the schema has been applied by this instance, so the
+        startup validator doesn't repeat the DDL run during construction.
+        """
+        if self._tables_created:
+            return
         self._create_tables_fallback()
 
+    def _create_all(self) -> None:
+        """
+        Create missing tables and indexes in a single transaction
+
+        pysqlite autocommits each DDL statement on its own, which costs one
+        sync per CREATE on a fresh database. An explicit BEGIN batches them
+        into one commit.
+        """
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("BEGIN")
+            Base.metadata.create_all(bind=conn)
+            conn.commit()
+
     def _create_tables_fallback(self) -> None:
         """Fallback: create tables using SQLAlchemy create_all()"""
-        Base.metadata.create_all(bind=self.engine)
+        self._create_all()
+        self._tables_created = True
         logger.info("Database tables created/verified (create_all fallback)")
 
     def verify_schema(self) -> bool:
@@ -144,22 +212,18 @@ class Database:
             Exception: If database query fails
         """
         try:
-            with self.session_scope() as session:
-                # Test basic query
-                result = session.execute(text("SELECT 1")).fetchone()
-                if result[0] != 1:
-                    return False
-
-                # Verify key tables exist
-                tables_query = text(
+            # One read-only query on a plain connection: it both proves the
+            # database answers and lists the key tables, without an ORM session
+            with self.engine.connect() as conn:
+                tables = conn.exec_driver_sql(
                     "SELECT name FROM sqlite_master WHERE type='table' "
                     "AND name IN ('executions', 'step_results')"
-                )
-                tables = session.execute(tables_query).fetchall()
-                expected_tables = {"executions", "step_results"}
-                found_tables = {row[0] for row in tables}
+                ).fetchall()
+
+            expected_tables = {"executions", "step_results"}
+            found_tables = {row[0] for row in tables}
 
-                return expected_tables.issubset(found_tables)
+            return expected_tables.issubset(found_tables)
 
         except Exception as e:
             logger.error(f"Schema verification failed: {e}")
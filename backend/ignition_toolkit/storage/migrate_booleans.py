@@ -7,95 +7,113 @@ Migrates:
 """
 
 import logging
+import re
+import sqlite3
 from pathlib import Path
 
-from sqlalchemy import Boolean, Column, inspect, text
+from sqlalchemy import Boolean, Column, text
 
 from ignition_toolkit.storage import get_database
 
 logger = logging.getLogger(__name__)
 
+# ALTER TABLE ... DROP COLUMN arrived in SQLite 3.35 (3.35.5 fixed its early bugs);
+# older libraries fall back to recreating the table
+SUPPORTS_DROP_COLUMN = sqlite3.sqlite_version_info >= (3, 35, 5)
+
+# Declared type of the "enabled" column in a CREATE TABLE statement
+_ENABLED_COLUMN_RE = re.compile(r"""[\s(,]["`\[]?enabled["`\]]?\s+(\w+)""", re.IGNORECASE)
+
+# SQLite gives a column TEXT affinity when its declared type contains one of these
+_STRING_AFFINITIES = ("CHAR", "CLOB", "TEXT")
+
 
 def migrate_boolean_columns():
     """
     Migrate string boolean columns to proper Boolean type
 
     This migration:
-    1. Adds new boolean columns (_enabled_bool)
-    2. Copies data with conversion
-    3. Drops old string columns
-    4. Renames new columns to original names
+    1. Adds a new INTEGER column and converts the values into it
+    2. Drops the old string column
+    3. Renames the new column to the original name
 
-    Note: SQLite doesn't support direct column type changes,
-    so we use add/copy/drop/rename pattern.
+    Note: SQLite doesn't support direct column type changes, so we use the
+    add/convert/drop/rename pattern. Before SQLite 3.35.5 (no DROP COLUMN)
+    the table is recreated instead, converting values as rows are copied.
     """
     db = get_database()
 
     with db.session_scope() as session:
-        # Check if migration already applied
-        inspector = inspect(session.bind)
+        # Run the whole migration as one write transaction (committed by
+        # session_scope) instead of letting each DDL statement autocommit;
+        # foreign keys are checked once at that commit
+        session.execute(text("BEGIN IMMEDIATE"))
+        session.execute(text("PRAGMA defer_foreign_keys=ON"))
+
+        # Check if migration already applied: read both table definitions in one query
+        schemas = dict(
+            session.execute(
+                text(
+                    "SELECT name, sql FROM sqlite_master WHERE type='table' "
+                    "AND name IN ('ai_settings', 'scheduled_playbooks')"
+                )
+            ).all()
+        )
 
         # Check ai_settings table
-        if "ai_settings" in inspector.get_table_names():
-            ai_columns = [col["name"] for col in inspector.get_columns("ai_settings")]
-
-            if "enabled" in ai_columns:
-                # Check column type
-                for col in inspector.get_columns("ai_settings"):
-                    if col["name"] == "enabled":
-                        col_type = str(col["type"]).upper()
-                        if "VARCHAR" in col_type or "STRING" in col_type:
-                            logger.info("Migrating ai_settings.enabled column...")
-                            _migrate_ai_settings_enabled(session)
-                        else:
-                            logger.info("ai_settings.enabled already Boolean type")
-                        break
+        col_type = _enabled_column_type(schemas.get("ai_settings"))
+        if col_type is not None:
+            if any(affinity in col_type for affinity in _STRING_AFFINITIES):
+                logger.info("Migrating ai_settings.enabled column...")
+                _migrate_ai_settings_enabled(session)
+            else:
+                logger.info("ai_settings.enabled already Boolean type")
 
         # Check scheduled_playbooks table
-        if "scheduled_playbooks" in inspector.get_table_names():
-            sched_columns = [
-                col["name"] for col in inspector.get_columns("scheduled_playbooks")
-            ]
-
-            if "enabled" in sched_columns:
-                # Check column type
-                for col in inspector.get_columns("scheduled_playbooks"):
-                    if col["name"] == "enabled":
-                        col_type = str(col["type"]).upper()
-                        if "VARCHAR" in col_type or "STRING" in col_type:
-                            logger.info("Migrating scheduled_playbooks.enabled column...")
-                            _migrate_scheduled_playbooks_enabled(session)
-                        else:
-                            logger.info("scheduled_playbooks.enabled already Boolean type")
-                        break
-
-        session.commit()
-        logger.info("✅ Boolean column migration complete")
+        col_type = _enabled_column_type(schemas.get("scheduled_playbooks"))
+        if col_type is not None:
+            if any(affinity in col_type for affinity in _STRING_AFFINITIES):
+                logger.info("Migrating scheduled_playbooks.enabled column...")
+                _migrate_scheduled_playbooks_enabled(session)
+            else:
+                logger.info("scheduled_playbooks.enabled already Boolean type")
 
+    logger.info("✅ Boolean column migration complete")
 
-def _migrate_ai_settings_enabled(session):
-    """Migrate ai_settings.enabled from String to Boolean"""
 
-    # Step 1: Add temporary boolean column
-    session.execute(
-        text("ALTER TABLE ai_settings ADD COLUMN enabled_bool INTEGER DEFAULT 0")
-    )
+def _enabled_column_type(create_sql: str | None) -> str | None:
+    """Get the upper-cased declared type of "enabled" from a table's SQL, if present"""
+    if not create_sql:
+        return None
+    match = _ENABLED_COLUMN_RE.search(create_sql)
+    return match.group(1).upper() if match else None
 
-    # Step 2: Copy data with conversion (SQLite stores Boolean as INTEGER: 0 or 1)
-    session.execute(
-        text(
-            """
-        UPDATE ai_settings
-        SET enabled_bool = CASE
-            WHEN enabled = 'true' THEN 1
-            ELSE 0
-        END
+
+def _replace_enabled_column(session, table: str, default: int) -> None:
+    """
+    Swap a string "enabled" column for an INTEGER one in place
+
+    Adds the new column, converts the values, drops the old column and renames
+    the new one, all inside a savepoint so a failure leaves the table untouched.
+    Any index on "enabled" must be dropped by the caller first.
     """
+    with session.begin_nested():
+        session.execute(
+            text(f"ALTER TABLE {table} ADD COLUMN enabled_new INTEGER NOT NULL DEFAULT {default}")
         )
-    )
+        # IIF needs SQLite 3.32, always present where DROP COLUMN is supported
+        session.execute(text(f"UPDATE {table} SET enabled_new = IIF(enabled = 'true', 1, 0)"))
+        session.execute(text(f"ALTER TABLE {table} DROP COLUMN enabled"))
+        session.execute(text(f"ALTER TABLE {table} RENAME COLUMN enabled_new TO enabled"))
+
 
-    # Step 3: Drop old column (SQLite requires table recreation for column drops)
-    # We'll use a simpler approach: rename columns directly
+def _migrate_ai_settings_enabled(session):
+    """Migrate ai_settings.enabled from String to Boolean"""
+
+    if SUPPORTS_DROP_COLUMN:
+        _replace_enabled_column(session, "ai_settings", default=0)
+        logger.info("✅ Migrated ai_settings.enabled to Boolean")
+        return
 
     # Create new table with correct schema
     session.execute(
@@ -116,12 +134,15 @@ def _migrate_ai_settings_enabled(session):
         )
     )
 
-    # Copy data
+    # Copy data, converting enabled in the same pass
+    # (SQLite stores Boolean as INTEGER: 0 or 1)
     session.execute(
         text(
             """
         INSERT INTO ai_settings_new (id, name, provider, api_key, api_base_url, model_name, enabled, created_at, updated_at)
-        SELECT id, name, provider, api_key, api_base_url, model_name, enabled_bool, created_at, updated_at
+        SELECT id, name, provider, api_key, api_base_url, model_name,
+               CASE WHEN enabled = 'true' THEN 1 ELSE 0 END,
+               created_at, updated_at
         FROM ai_settings
     """
         )
@@ -137,6 +158,20 @@ def _migrate_ai_settings_enabled(session):
 def _migrate_scheduled_playbooks_enabled(session):
     """Migrate scheduled_playbooks.enabled from String to Boolean"""
 
+    if SUPPORTS_DROP_COLUMN:
+        # SQLite refuses to drop an indexed column; the next_run_at index is kept
+        with session.begin_nested():
+            session.execute(text("DROP INDEX IF EXISTS idx_scheduled_playbooks_enabled"))
+            _replace_enabled_column(session, "scheduled_playbooks", default=1)
+            session.execute(
+                text(
+                    "CREATE INDEX idx_scheduled_playbooks_enabled "
+                    "ON scheduled_playbooks(enabled)"
+                )
+            )
+        logger.info("✅ Migrated scheduled_playbooks.enabled to Boolean")
+        return
+
     # Create new table with correct schema
     session.execute(
         text(
@@ -5,7 +5,7 @@ SQLAlchemy database models
 from datetime import UTC, datetime
 
 from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 
 Base = declarative_base()
 
@@ -255,7 +255,8 @@ class FATReportModel(Base):
     failed_tests = Column(Integer, nullable=False, default=0)
     skipped_tests = Column(Integer, nullable=False, default=0)
     visual_issues = Column(Integer, nullable=False, default=0)
-    report_html = Column(Text, nullable=True)  # Full HTML report
+    # Full HTML report; deferred so loading report rows doesn't pull in the HTML
+    report_html = deferred(Column(Text, nullable=True))
     report_metadata = Column(JSON, nullable=True)  # Additional metadata
     created_at = Column(DateTime, default=utcnow, nullable=False)
 
@@ -282,6 +283,7 @@ class FATReportModel(Base):
             "failed_tests": self.failed_tests,
             "skipped_tests": self.skipped_tests,
             "visual_issues": self.visual_issues,
+            # report_html is left out on purpose: whole HTML documents don't belong in JSON
             "report_metadata": self.report_metadata,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "component_tests": [test.to_dict() for test in self.component_tests],
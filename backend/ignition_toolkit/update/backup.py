@@ -6,11 +6,27 @@ Preserves user data during updates.
 
 import logging
 import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# The database runs in WAL mode; recent commits may still live in the -wal file
+DB_FILENAME = "ignition_toolkit.db"
+DB_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+# Backup files are independent, so copy them concurrently
+COPY_WORKERS = 8
+
+
+def _backup_database(src: Path, dst: Path) -> None:
+    """Copy a live SQLite database into a single self-contained file"""
+    with closing(sqlite3.connect(src)) as source, closing(sqlite3.connect(dst)) as target:
+        source.backup(target)
+
 
 def backup_user_data() -> Path:
     """
@@ -31,31 +47,26 @@ def backup_user_data() -> Path:
         backup_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Creating backup at {backup_dir}")
 
+        # Destination -> source; playbooks sharing a name keep the last one, as before
+        copies: dict[Path, Path] = {}
+
         # Backup credential vault
         vault_file = user_data_dir / "credentials.json"
         if vault_file.exists():
-            shutil.copy2(vault_file, backup_dir / "credentials.json")
-            logger.info("Backed up credential vault")
+            copies[backup_dir / "credentials.json"] = vault_file
 
         # Backup encryption key
         key_file = user_data_dir / "encryption.key"
         if key_file.exists():
-            shutil.copy2(key_file, backup_dir / "encryption.key")
-            logger.info("Backed up encryption key")
-
-        # Backup database (actual filename is ignition_toolkit.db)
-        db_file = user_data_dir / "ignition_toolkit.db"
-        if db_file.exists():
-            shutil.copy2(db_file, backup_dir / "ignition_toolkit.db")
-            logger.info("Backed up database")
+            copies[backup_dir / "encryption.key"] = key_file
 
         # Backup custom playbooks (if outside package)
+        custom_playbooks = []
         package_root = Path(__file__).parent.parent.parent
         playbooks_dir = package_root / "playbooks"
 
         if playbooks_dir.exists():
             # Only backup custom playbooks (user-created)
-            custom_playbooks = []
             for playbook in playbooks_dir.rglob("*.yaml"):
                 # Check if it's a custom playbook (not built-in)
                 # Built-in playbooks are in gateway/, perspective/, designer/, examples/
@@ -69,9 +80,29 @@ def backup_user_data() -> Path:
                 custom_backup_dir.mkdir(exist_ok=True)
 
                 for playbook in custom_playbooks:
-                    shutil.copy2(playbook, custom_backup_dir / playbook.name)
+                    copies[custom_backup_dir / playbook.name] = playbook
+
+        # Backup database (actual filename is ignition_toolkit.db) through SQLite's
+        # backup API, so commits still sitting in the WAL file are included
+        db_file = user_data_dir / DB_FILENAME
+
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            futures = [executor.submit(shutil.copy2, src, dst) for dst, src in copies.items()]
+            if db_file.exists():
+                futures.append(
+                    executor.submit(_backup_database, db_file, backup_dir / DB_FILENAME)
+                )
+            for future in futures:
+                future.result()
 
-                logger.info(f"Backed up {len(custom_playbooks)} custom playbooks")
+        if vault_file.exists():
+            logger.info("Backed up credential vault")
+        if key_file.exists():
+            logger.info("Backed up encryption key")
+        if db_file.exists():
+            logger.info("Backed up database")
+        if custom_playbooks:
+            logger.info(f"Backed up {len(custom_playbooks)} custom playbooks")
 
         # Create backup manifest
         manifest_path = backup_dir / "MANIFEST.txt"
@@ -118,10 +149,12 @@ def restore_backup(backup_dir: Path) -> bool:
             shutil.copy2(key_backup, user_data_dir / "encryption.key")
             logger.info("Restored encryption key")
 
-        # Restore database
-        db_backup = backup_dir / "ignition_toolkit.db"
+        # Restore database; stale WAL/SHM files must not be replayed onto the backup
+        db_backup = backup_dir / DB_FILENAME
         if db_backup.exists():
-            shutil.copy2(db_backup, user_data_dir / "ignition_toolkit.db")
+            for suffix in DB_SIDECAR_SUFFIXES:
+                (user_data_dir / f"{DB_FILENAME}{suffix}").unlink(missing_ok=True)
+            shutil.copy2(db_backup, user_data_dir / DB_FILENAME)
             logger.info("Restored database")
 
         # Restore custom playbooks
@@ -0,0 +1,54 @@
+"""
+Tests for execution API endpoints
+
+Tests listing executions stored in the database.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from ignition_toolkit.storage.database import MEMORY_DATABASE, Database
+from ignition_toolkit.storage.models import ExecutionModel, StepResultModel
+
+
+@pytest.fixture
+def db():
+    """In-memory database holding three executions with two steps each"""
+    database = Database(MEMORY_DATABASE)
+    with database.session_scope() as session:
+        for i in range(3):
+            execution = ExecutionModel(
+                execution_id=f"exec-{i}", playbook_name="Test Playbook", status="completed"
+            )
+            execution.step_results = [
+                StepResultModel(step_id=f"step-{j}", step_name=f"Step {j}", status="completed")
+                for j in range(2)
+            ]
+            session.add(execution)
+    return database
+
+
+class TestListExecutions:
+    """Test the execution list endpoint"""
+
+    async def test_steps_load_without_per_execution_queries(self, db):
+        """Test that listing executions loads all steps in a fixed number of queries"""
+        from ignition_toolkit.api.routers.executions import main
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        with (
+            patch.object(main, "get_database", return_value=db),
+            patch.object(main, "get_active_engines", return_value={}),
+        ):
+            executions = await main.list_executions(limit=10)
+
+        assert len(executions) == 3
+        assert all(len(execution.step_results) == 2 for execution in executions)
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2
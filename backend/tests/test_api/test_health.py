@@ -200,3 +200,125 @@ class TestHealthEndpoints:
         assert result["ready"] is False
         # Response should have 503 status
         assert mock_response.status_code == 503
+
+
+class TestHealthState:
+    """Test startup health state tracking"""
+
+    def setup_method(self):
+        from ignition_toolkit.startup.health import reset_health_state
+
+        reset_health_state()
+
+    def teardown_method(self):
+        from ignition_toolkit.startup.health import reset_health_state
+
+        reset_health_state()
+
+    def test_default_components_unknown(self):
+        """Test that all default components start out unknown"""
+        from ignition_toolkit.startup.health import DEFAULT_COMPONENTS, get_health_state
+
+        components = get_health_state().to_dict()["components"]
+
+        assert tuple(components) == DEFAULT_COMPONENTS
+        assert {c["status"] for c in components.values()} == {"unknown"}
+
+    def test_component_updates(self):
+        """Test that setters replace component state and record issues"""
+        from ignition_toolkit.startup.health import (
+            get_health_state,
+            set_component_degraded,
+            set_component_healthy,
+            set_component_unhealthy,
+        )
+
+        set_component_healthy("database", "ok")
+        set_component_degraded("browser", "missing")
+        set_component_unhealthy("services", "boom")
+
+        state = get_health_state()
+        result = state.to_dict()
+
+        assert result["components"]["database"]["message"] == "ok"
+        assert result["components"]["browser"]["status"] == "degraded"
+        assert state.components["services"].error == "boom"
+        assert result["warnings"] == ["browser: missing"]
+        assert result["errors"] == ["services: boom"]
+
+    def test_payload_reports_only_default_components(self):
+        """Test that non-default phases don't add keys to the public payload"""
+        from ignition_toolkit.startup.health import (
+            DEFAULT_COMPONENTS,
+            get_health_state,
+            set_component_healthy,
+            set_component_unhealthy,
+        )
+
+        set_component_unhealthy("environment", "bad")
+        set_component_healthy("services", "ok")
+
+        components = get_health_state().to_dict()["components"]
+
+        assert tuple(components) == DEFAULT_COMPONENTS
+
+    def test_mutating_payload_does_not_change_cached_components(self):
+        """Test that callers editing a response don't corrupt later responses"""
+        from ignition_toolkit.startup.health import get_health_state, set_component_healthy
+
+        set_component_healthy("database", "ok")
+        state = get_health_state()
+
+        first = state.to_dict()
+        first["components"]["database"]["status"] = "tampered"
+        first["components"].pop("vault")
+
+        second = state.to_dict()
+        assert second["components"]["database"]["status"] == "healthy"
+        assert "vault" in second["components"]
+
+    def test_health_payload_tracks_component_changes(self):
+        """Test that the encoded payload reflects updates after caching"""
+        import json
+
+        from ignition_toolkit.startup.health import get_health_payload, set_component_healthy
+
+        first = json.loads(get_health_payload())
+        set_component_healthy("vault", "Vault operational")
+        second = json.loads(get_health_payload())
+
+        assert first["components"]["vault"]["status"] == "unknown"
+        assert second["components"]["vault"]["message"] == "Vault operational"
+
+    def test_detailed_health_returns_json_payload(self):
+        """Test detailed endpoint serves the encoded health state"""
+        import asyncio
+        import json
+
+        from ignition_toolkit.api.routers.health import detailed_health
+        from ignition_toolkit.startup.health import (
+            HealthStatus,
+            get_health_state,
+            set_component_unhealthy,
+        )
+
+        set_component_unhealthy("database", "locked")
+        get_health_state().overall = HealthStatus.UNHEALTHY
+
+        response = asyncio.run(detailed_health())
+
+        assert response.status_code == 503
+        assert response.media_type == "application/json"
+        assert json.loads(response.body)["errors"] == ["database: locked"]
+
+    def test_reset_shares_unknown_default(self):
+        """Test that fresh states share one immutable unknown component"""
+        import dataclasses
+
+        from ignition_toolkit.startup.health import SystemHealth
+
+        first, second = SystemHealth(), SystemHealth()
+
+        assert first.components["vault"] is second.components["database"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.components["vault"].message = "changed"
@@ -0,0 +1,80 @@
+"""
+Tests for the shared JSON codec
+
+Runs every check against both the orjson and the stdlib json code paths.
+"""
+
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from ignition_toolkit.core import json_codec
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    """Select the orjson path, or force the stdlib fallback"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+class TestJsonCodec:
+    """Test encoding and decoding on both code paths"""
+
+    def test_round_trip(self, codec):
+        """Test that nested values decode to what was encoded"""
+        value = {"name": "Step", "output": {"items": [1, 2.5, None, True]}, "note": "caf\u00e9"}
+
+        assert codec.loads(codec.dumps(value)) == value
+        assert codec.loads(codec.dumps_bytes(value)) == value
+
+    def test_non_str_keys_become_strings(self, codec):
+        """Test that integer keys are written as strings, as json.dumps does"""
+        assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_indent_matches_json(self, codec):
+        """Test that indented output matches json.dumps(indent=2)"""
+        value = {"realm": "iiot", "clients": [{"clientId": "grafana"}]}
+
+        assert codec.dumps(value, indent=True) == json.dumps(value, indent=2)
+
+    @pytest.mark.parametrize("number", [math.nan, math.inf, -math.inf])
+    def test_non_finite_floats_round_trip(self, codec, number):
+        """Test that NaN and Infinity are kept rather than written as null"""
+        value = {"output": [1.0, number], "missing": None}
+
+        for decoded in (codec.loads(codec.dumps(value)), codec.loads(codec.dumps_bytes(value))):
+            assert decoded["missing"] is None
+            assert decoded["output"][0] == 1.0
+            assert math.isnan(number) == math.isnan(decoded["output"][1])
+            if not math.isnan(number):
+                assert decoded["output"][1] == number
+
+    def test_large_integers_round_trip(self, codec):
+        """Test that integers beyond 64 bits are encoded, as json.dumps does"""
+        value = {"big": 2**70, "negative": -(2**64)}
+
+        assert codec.loads(codec.dumps(value)) == value
+        assert codec.loads(codec.dumps_bytes(value)) == value
+
+    def test_unsupported_types_rejected(self, codec):
+        """Test that values json.dumps rejects are not silently stringified"""
+        for value in ({"when": datetime(2024, 1, 1, 12, 0)}, {datetime(2024, 1, 1): 1}):
+            with pytest.raises(TypeError):
+                codec.dumps(value)
+            with pytest.raises(TypeError):
+                codec.dumps_bytes(value)
+
+    def test_loads_accepts_nan(self, codec):
+        """Test that NaN written by json.dumps still decodes"""
+        assert math.isnan(codec.loads('{"value": NaN}')["value"])
+
+    def test_loads_invalid_raises_value_error(self, codec):
+        """Test that invalid JSON raises ValueError on both paths"""
+        with pytest.raises(ValueError):
+            codec.loads("{not json")
@@ -6,12 +6,14 @@ Tests the full lifecycle of executions and step results using a real SQLite data
 
 import pytest
 import tempfile
+import math
 import os
 from pathlib import Path
 from datetime import datetime, UTC
 import uuid
+from unittest.mock import patch
 
-from ignition_toolkit.storage.database import Database
+from ignition_toolkit.storage.database import MEMORY_DATABASE, Database
 from ignition_toolkit.storage.models import ExecutionModel, StepResultModel
 
 
@@ -457,3 +459,113 @@ class TestModelSerialization:
             assert data["config_data"]["gateway"] == "http://localhost:8088"
             assert len(data["step_results"]) == 1
             assert data["step_results"][0]["step_name"] == "First Step"
+
+
+class TestSchemaSetup:
+    """Test that schema DDL runs once per database instance."""
+
+    def test_create_tables_after_init_is_noop(self, temp_db):
+        """Test that create_tables() skips DDL already applied on construction."""
+        with patch.object(temp_db, "_create_all") as create_all:
+            temp_db.create_tables()
+
+        create_all.assert_not_called()
+
+    def test_create_tables_creates_schema(self, temp_db):
+        """Test that create_tables() still works when no schema was applied."""
+        temp_db._tables_created = False
+
+        temp_db.create_tables()
+
+        assert temp_db._tables_created is True
+        assert temp_db.verify_schema() is True
+
+    def test_verify_schema_detects_missing_tables(self, temp_db):
+        """Test that verify_schema() fails once a key table is gone."""
+        assert temp_db.verify_schema() is True
+
+        with temp_db.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE step_results")
+
+        assert temp_db.verify_schema() is False
+
+
+class TestInMemoryDatabase:
+    """Test the in-memory database mode."""
+
+    def test_sessions_share_one_database(self):
+        """Test that data written in one session is visible in the next."""
+        db = Database(MEMORY_DATABASE)
+        execution_id = str(uuid.uuid4())
+
+        with db.session_scope() as session:
+            session.add(
+                ExecutionModel(execution_id=execution_id, playbook_name="Mem", status="pending")
+            )
+
+        with db.session_scope() as session:
+            assert session.query(ExecutionModel).filter_by(execution_id=execution_id).count() == 1
+
+    def test_schema_is_created(self):
+        """Test that the in-memory schema passes verification."""
+        db = Database(MEMORY_DATABASE)
+
+        assert db.in_memory is True
+        assert db.verify_schema() is True
+
+
+class TestJsonColumns:
+    """Test JSON column encoding and decoding."""
+
+    def test_round_trip_with_int_keys(self, temp_db):
+        """Test that non-string keys are stored as strings, as json.dumps does."""
+        execution_id = str(uuid.uuid4())
+
+        with temp_db.session_scope() as session:
+            session.add(
+                ExecutionModel(
+                    execution_id=execution_id,
+                    playbook_name="Json",
+                    status="pending",
+                    config_data={1: "one", "nested": {"list": [1, 2.5, None, True]}},
+                )
+            )
+
+        with temp_db.session_scope() as session:
+            execution = session.query(ExecutionModel).filter_by(execution_id=execution_id).one()
+            assert execution.config_data == {"1": "one", "nested": {"list": [1, 2.5, None, True]}}
+
+    def test_round_trip_with_non_finite_floats(self, temp_db):
+        """Test that NaN and Infinity survive a write and read."""
+        execution_id = str(uuid.uuid4())
+
+        with temp_db.session_scope() as session:
+            session.add(
+                ExecutionModel(
+                    execution_id=execution_id,
+                    playbook_name="Json",
+                    status="pending",
+                    config_data={"nan": math.nan, "inf": math.inf, "ninf": -math.inf},
+                )
+            )
+
+        with temp_db.session_scope() as session:
+            execution = session.query(ExecutionModel).filter_by(execution_id=execution_id).one()
+            data = execution.config_data
+            assert math.isnan(data["nan"])
+            assert data["inf"] == math.inf
+            assert data["ninf"] == -math.inf
+
+    def test_reads_legacy_nan_values(self, temp_db):
+        """Test that rows written by json.dumps with NaN still load."""
+        execution_id = str(uuid.uuid4())
+        with temp_db.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO executions (execution_id, playbook_name, status, started_at, "
+                "config_data) VALUES (?, 'Legacy', 'completed', '2024-01-01', ?)",
+                (execution_id, '{"value": NaN}'),
+            )
+
+        with temp_db.session_scope() as session:
+            execution = session.query(ExecutionModel).filter_by(execution_id=execution_id).one()
+            assert math.isnan(execution.config_data["value"])
@@ -0,0 +1,151 @@
+"""
+Integration tests for the string-to-Boolean column migration.
+
+Builds a database with the legacy VARCHAR "enabled" columns and checks the
+migrated values, column types and indexes.
+"""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect, text
+
+from ignition_toolkit.storage import migrate_booleans
+from ignition_toolkit.storage.database import Database
+from ignition_toolkit.storage.migrate_booleans import migrate_boolean_columns
+
+LEGACY_SCHEMA = """
+CREATE TABLE ai_settings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL UNIQUE,
+    provider VARCHAR(50) NOT NULL,
+    api_key TEXT,
+    api_base_url VARCHAR(500),
+    model_name VARCHAR(100),
+    enabled VARCHAR(10) NOT NULL DEFAULT 'false',
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE TABLE scheduled_playbooks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(255) NOT NULL,
+    playbook_path VARCHAR(500) NOT NULL,
+    schedule_type VARCHAR(50) NOT NULL,
+    schedule_config JSON NOT NULL,
+    parameters JSON,
+    gateway_url VARCHAR(500),
+    credential_name VARCHAR(255),
+    enabled VARCHAR(10) NOT NULL DEFAULT 'true',
+    last_run_at DATETIME,
+    next_run_at DATETIME,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE INDEX idx_scheduled_playbooks_enabled ON scheduled_playbooks(enabled);
+CREATE INDEX idx_scheduled_playbooks_next_run ON scheduled_playbooks(next_run_at);
+INSERT INTO ai_settings (name, provider, enabled, created_at, updated_at) VALUES
+    ('on', 'openai', 'true', '2024-01-01', '2024-01-01'),
+    ('off', 'anthropic', 'false', '2024-01-01', '2024-01-01');
+INSERT INTO scheduled_playbooks
+    (name, playbook_path, schedule_type, schedule_config, enabled, created_at, updated_at)
+VALUES
+    ('nightly', 'a.yaml', 'cron', '{}', 'true', '2024-01-01', '2024-01-01'),
+    ('paused', 'b.yaml', 'cron', '{}', 'false', '2024-01-01', '2024-01-01');
+"""
+
+
+@pytest.fixture(params=[True, False], ids=["drop-column", "recreate-table"])
+def legacy_db(request, tmp_path: Path, monkeypatch):
+    """Create a database holding the legacy string boolean columns."""
+    monkeypatch.setattr(migrate_booleans, "SUPPORTS_DROP_COLUMN", request.param)
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.close()
+
+    db = Database(db_path)
+    with patch("ignition_toolkit.storage.migrate_booleans.get_database", return_value=db):
+        yield db
+    db.engine.dispose()
+
+
+def _enabled_type(db: Database, table: str) -> str:
+    columns = {col["name"]: col for col in inspect(db.engine).get_columns(table)}
+    return str(columns["enabled"]["type"]).upper()
+
+
+class TestBooleanMigration:
+    """Test migrating string booleans to integer columns."""
+
+    def test_converts_values(self, legacy_db):
+        """Test that 'true'/'false' strings become 1/0."""
+        migrate_boolean_columns()
+
+        with legacy_db.session_scope() as session:
+            ai = dict(session.execute(text("SELECT name, enabled FROM ai_settings")).all())
+            sched = dict(
+                session.execute(text("SELECT name, enabled FROM scheduled_playbooks")).all()
+            )
+
+        assert ai == {"on": 1, "off": 0}
+        assert sched == {"nightly": 1, "paused": 0}
+
+    def test_columns_no_longer_strings(self, legacy_db):
+        """Test that both enabled columns are integer typed after migration."""
+        migrate_boolean_columns()
+
+        assert _enabled_type(legacy_db, "ai_settings") == "INTEGER"
+        assert _enabled_type(legacy_db, "scheduled_playbooks") == "INTEGER"
+
+    def test_keeps_schedule_indexes(self, legacy_db):
+        """Test that the scheduled_playbooks indexes survive the migration."""
+        migrate_boolean_columns()
+
+        inspector = inspect(legacy_db.engine)
+        indexes = {ix["name"] for ix in inspector.get_indexes("scheduled_playbooks")}
+        assert {"idx_scheduled_playbooks_enabled", "idx_scheduled_playbooks_next_run"} <= indexes
+
+    def test_failure_rolls_back_whole_migration(self, legacy_db):
+        """Test that a failing table leaves the earlier table unmigrated."""
+        with patch.object(
+            migrate_booleans,
+            "_migrate_scheduled_playbooks_enabled",
+            side_effect=RuntimeError("boom"),
+        ):
+            with pytest.raises(RuntimeError):
+                migrate_boolean_columns()
+
+        assert _enabled_type(legacy_db, "ai_settings") == "VARCHAR(10)"
+        with legacy_db.session_scope() as session:
+            ai = dict(session.execute(text("SELECT name, enabled FROM ai_settings")).all())
+        assert ai == {"on": "true", "off": "false"}
+
+    def test_second_run_is_noop(self, legacy_db):
+        """Test that running the migration again leaves the data unchanged."""
+        migrate_boolean_columns()
+        migrate_boolean_columns()
+
+        with legacy_db.session_scope() as session:
+            ai = dict(session.execute(text("SELECT name, enabled FROM ai_settings")).all())
+
+        assert ai == {"on": 1, "off": 0}
+
+
+class TestEnabledColumnType:
+    """Test reading the enabled column type from CREATE TABLE SQL."""
+
+    @pytest.mark.parametrize(
+        "create_sql, expected",
+        [
+            ("CREATE TABLE t (id INTEGER, enabled VARCHAR(10) NOT NULL)", "VARCHAR"),
+            ('CREATE TABLE t (id INTEGER, "enabled" INTEGER NOT NULL)', "INTEGER"),
+            ("CREATE TABLE t (id INT,\n\tenabled boolean, CHECK (enabled IN (0, 1)))", "BOOLEAN"),
+            ("CREATE TABLE t (id INTEGER, is_enabled TEXT)", None),
+            (None, None),
+        ],
+    )
+    def test_parses_declared_type(self, create_sql, expected):
+        """Test that only the enabled column's own declaration is matched."""
+        assert migrate_booleans._enabled_column_type(create_sql) == expected
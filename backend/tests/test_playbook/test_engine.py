@@ -492,3 +492,54 @@ class TestDomainDetection:
 
         has_designer_steps = any(step.type.value.startswith("designer.") for step in playbook.steps)
         assert has_designer_steps is True
+
+
+class TestSaveExecutionStart:
+    """Test persisting a new execution with its pending steps"""
+
+    async def test_pending_steps_saved_in_one_insert(self):
+        """Test that all pending step rows are written by a single INSERT"""
+        from sqlalchemy import event
+
+        from ignition_toolkit.storage.database import MEMORY_DATABASE, Database
+        from ignition_toolkit.storage.models import StepResultModel
+
+        db = Database(MEMORY_DATABASE)
+        steps = [
+            PlaybookStep(id=f"step{i}", name=f"Step {i}", type=StepType.LOG, parameters={})
+            for i in range(3)
+        ]
+        playbook = Playbook(name="Test Playbook", version="1.0", steps=steps)
+        state = ExecutionState(
+            execution_id="test-123",
+            playbook_name=playbook.name,
+            status=ExecutionStatus.RUNNING,
+            started_at=datetime.now(),
+            total_steps=len(steps),
+            step_results=[
+                StepResult(
+                    step_id=step.id,
+                    step_name=step.name,
+                    status=StepStatus.PENDING,
+                    started_at=None,
+                )
+                for step in steps
+            ],
+        )
+
+        inserts = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT INTO STEP_RESULTS"):
+                inserts.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        engine = PlaybookEngine(database=db)
+        await engine._save_execution_start(state, playbook, {})
+
+        assert len(inserts) == 1
+        with db.session_scope() as session:
+            saved = session.query(StepResultModel).order_by(StepResultModel.id).all()
+            assert [s.step_id for s in saved] == ["step0", "step1", "step2"]
+            assert all(s.execution_id == state.db_execution_id for s in saved)
+            assert all(s.status == "pending" for s in saved)
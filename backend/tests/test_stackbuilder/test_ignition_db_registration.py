@@ -0,0 +1,175 @@
+"""
+Unit Tests for Ignition Database Registration
+
+Tests the ignition_db_registration.py module functionality:
+- Registration script generation
+- JDBC connection settings per database type
+- Running the generated script against a stub Gateway
+"""
+
+import ast
+import json
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ignition_toolkit.stackbuilder.ignition_db_registration import (
+    generate_ignition_db_registration_script,
+)
+
+
+def _generate(databases, host="ignition", port=8088):
+    return generate_ignition_db_registration_script(
+        ignition_host=host,
+        ignition_port=port,
+        admin_username="admin",
+        admin_password="password",
+        databases=databases,
+    )
+
+
+def _registered_databases(script):
+    """Extract the DATABASES constant embedded in a generated script."""
+    for node in ast.parse(script).body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "DATABASES":
+            return json.loads(ast.get_source_segment(script, node.value))
+    pytest.fail("DATABASES not found in generated script")
+
+
+class TestRegistrationScriptGeneration:
+    """Test registration script generation."""
+
+    def test_script_is_valid_python(self):
+        """Test generated script compiles."""
+        script = _generate([{"type": "postgres", "instance_name": "db"}])
+        compile(script, "register_databases.py", "exec")
+
+    def test_jdbc_url_uses_instance_name_as_host(self):
+        """Test a host key in the database config does not break URL formatting."""
+        script = _generate(
+            [
+                {
+                    "type": "postgres",
+                    "instance_name": "db",
+                    "config": {"host": "localhost", "port": 5433},
+                }
+            ]
+        )
+        (registered,) = _registered_databases(script)
+        assert registered["jdbc_url"] == "jdbc:postgresql://db:5433/postgres"
+
+    def test_unknown_database_type_skipped(self):
+        """Test unsupported database types are not registered."""
+        script = _generate([{"type": "oracle", "instance_name": "db"}])
+        assert _registered_databases(script) == []
+
+
+class StubGateway(ThreadingHTTPServer):
+    """Minimal Ignition Gateway answering the registration script's requests"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubGatewayHandler)
+        self.requests: list[tuple[str, str]] = []
+        # Status codes to answer in turn for (method, path); 200 once exhausted
+        self.statuses: dict[tuple[str, str], list[int]] = {}
+
+
+class _StubGatewayHandler(BaseHTTPRequestHandler):
+    def _reply(self):
+        key = (self.command, self.path)
+        self.server.requests.append(key)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+
+        pending = self.server.statuses.get(key)
+        status = pending.pop(0) if pending else 200
+        body = b"[]" if key == ("GET", "/data/db-connections") and status == 200 else b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gateway():
+    """Serve a stub Gateway on a free local port"""
+    server = StubGateway()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _run_script(gateway, tmp_path, databases):
+    """Generate the registration script for the stub Gateway and run it"""
+    pytest.importorskip("requests")
+    script = tmp_path / "register_databases.py"
+    script.write_text(_generate(databases, host="127.0.0.1", port=gateway.server_address[1]))
+    return subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, timeout=60
+    )
+
+
+class TestRegistrationScriptRun:
+    """Test the generated script against a stub Gateway."""
+
+    def test_registers_each_database(self, gateway, tmp_path):
+        """Test one connection is created per configured database."""
+        result = _run_script(
+            gateway,
+            tmp_path,
+            [
+                {"type": "postgres", "instance_name": "db1"},
+                {"type": "mysql", "instance_name": "db2"},
+            ],
+        )
+
+        assert result.returncode == 0, result.stdout
+        assert gateway.requests.count(("POST", "/data/login")) == 1
+        assert gateway.requests.count(("POST", "/data/db-connections")) == 2
+
+    def test_create_not_retried_on_gateway_error(self, gateway, tmp_path):
+        """Test a failed create is reported, not resent, so it cannot duplicate."""
+        gateway.statuses[("POST", "/data/db-connections")] = [503]
+
+        result = _run_script(gateway, tmp_path, [{"type": "postgres", "instance_name": "db"}])
+
+        assert result.returncode == 1
+        assert gateway.requests.count(("POST", "/data/db-connections")) == 1
+        assert "Failed to create connection: 503" in result.stdout
+
+    def test_lookup_retried_on_gateway_error(self, gateway, tmp_path):
+        """Test the existing-connection lookup is retried on a transient error."""
+        gateway.statuses[("GET", "/data/db-connections")] = [503]
+
+        result = _run_script(gateway, tmp_path, [{"type": "postgres", "instance_name": "db"}])
+
+        assert result.returncode == 0, result.stdout
+        assert gateway.requests.count(("GET", "/data/db-connections")) == 2
+        assert gateway.requests.count(("POST", "/data/db-connections")) == 1
+
+    def test_prints_separator_after_each_database(self, gateway, tmp_path):
+        """Test each database registration is followed by a blank line."""
+        databases = [
+            {"type": "postgres", "instance_name": "db1"},
+            {"type": "mysql", "instance_name": "db2"},
+            {"type": "mssql", "instance_name": "db3"},
+        ]
+
+        result = _run_script(gateway, tmp_path, databases)
+
+        lines = result.stdout.splitlines()
+        start = next(i for i, line in enumerate(lines) if "Configuring 3 database" in line)
+        summary = lines.index("Summary")
+        # One blank line after the "Configuring" banner, then one per database
+        assert lines[start + 1:summary - 1].count("") == 1 + len(databases)
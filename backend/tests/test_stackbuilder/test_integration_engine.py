@@ -9,6 +9,9 @@ Tests the integration_engine.py module functionality:
 - Traefik label generation
 """
 
+import json
+import os
+
 import pytest
 from pathlib import Path
 
@@ -42,9 +45,36 @@ class TestIntegrationEngineLoading:
     def test_engine_lazy_loading(self, integrations_path):
         """Test engine is lazily loaded."""
         engine = IntegrationEngine(integrations_path=integrations_path)
-        assert engine._integrations is None
+        assert "integrations" not in engine.__dict__
         _ = engine.integrations
-        assert engine._integrations is not None
+        assert "integrations" in engine.__dict__
+
+    def test_engine_eager_loading(self, integrations_path):
+        """Test eager engines resolve the config at construction."""
+        engine = IntegrationEngine(integrations_path=integrations_path, eager=True)
+        assert "integrations" in engine.__dict__
+        assert "_svc_integration" in engine.__dict__
+
+    def test_engines_share_parsed_file(self, integrations_path):
+        """Test the parsed file is reused across engine instances."""
+        engine1 = IntegrationEngine(integrations_path=integrations_path)
+        engine2 = IntegrationEngine(integrations_path=integrations_path)
+        assert engine1.integrations is engine2.integrations
+
+    def test_engine_maybe_reload_picks_up_edits(self, tmp_path):
+        """Test maybe_reload rebuilds the config after the file changes."""
+        path = tmp_path / "integrations.json"
+        path.write_text(json.dumps({"integration_types": {"a": {}}}))
+        engine = IntegrationEngine(integrations_path=path)
+        assert list(engine.integration_types) == ["a"]
+        assert engine.maybe_reload() is False
+
+        path.write_text(json.dumps({"integration_types": {"b": {}}}))
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert engine.maybe_reload() is True
+        assert list(engine.integration_types) == ["b"]
 
 
 class TestIntegrationTypeProperties:
@@ -100,6 +130,11 @@ class TestIntegrationDetection:
         assert result["conflicts"] == []
         assert result["warnings"] == []
 
+    def test_detect_empty_instances_skips_config_load(self, engine):
+        """Test detection with no instances does not load integrations.json."""
+        engine.detect_integrations([])
+        assert "integrations" not in engine.__dict__
+
     def test_detect_database_provider(self, engine, sample_ignition_instance, sample_postgres_instance):
         """Test detection identifies database provider integration."""
         instances = [sample_ignition_instance, sample_postgres_instance]
@@ -152,6 +187,59 @@ class TestIntegrationDetection:
         result = engine.detect_integrations(instances)
         assert "email_testing" in result["integrations"]
 
+    def test_detect_repeated_call_returns_independent_result(
+        self, engine, sample_ignition_instance, sample_postgres_instance
+    ):
+        """Test memoized detection results are not shared between callers."""
+        instances = [sample_ignition_instance, sample_postgres_instance]
+        first = engine.detect_integrations(instances)
+        first["summary"] = "mutated"
+        first["integrations"]["db_provider"]["providers"].clear()
+
+        second = engine.detect_integrations(instances)
+        assert "summary" not in second
+        assert len(second["integrations"]["db_provider"]["providers"]) > 0
+
+    def test_detect_result_does_not_alias_shared_config(
+        self, integrations_path, sample_ignition_instance, sample_traefik_instance
+    ):
+        """Test a caller cannot change the config another engine shares."""
+        instances = [sample_ignition_instance, sample_traefik_instance]
+        engine1 = IntegrationEngine(integrations_path=integrations_path)
+        engine2 = IntegrationEngine(integrations_path=integrations_path)
+        config_ports = engine1.service_capabilities["ignition"]["integrations"]["reverse_proxy"][
+            "ports"
+        ]
+        expected_ports = json.loads(json.dumps(config_ports))
+
+        rp = engine1.detect_integrations(instances)["integrations"]["reverse_proxy"]
+        target = rp["targets"][0]
+        assert isinstance(target["ports"], list)
+        target["ports"][0]["container"] = 1
+        target["ports"].clear()
+
+        second = engine2.detect_integrations(instances)["integrations"]["reverse_proxy"]
+        assert config_ports == expected_ports
+        assert second["targets"][0]["ports"] == expected_ports
+
+    def test_detect_config_change_is_not_served_from_cache(self, engine, sample_grafana_instance):
+        """Test detection reflects changed instance config on repeat calls."""
+        postgres = {"app_id": "postgres", "instance_name": "postgres", "config": {"port": 5432}}
+        engine.detect_integrations([sample_grafana_instance, postgres])
+
+        postgres_changed = {**postgres, "config": {"port": 5433}}
+        result = engine.detect_integrations([sample_grafana_instance, postgres_changed])
+        datasources = result["integrations"]["visualization"]["datasources"]
+        assert datasources[0]["config"] == {"port": 5433}
+
+    def test_detect_repeated_service_reported_once(self, engine, sample_ignition_instance):
+        """Test a service selected twice is only reported once by the detectors."""
+        mosquitto = {"app_id": "mosquitto", "instance_name": "mosquitto", "config": {}}
+        result = engine.detect_integrations([sample_ignition_instance, mosquitto, mosquitto])
+        mqtt = result["integrations"]["mqtt_broker"]
+        assert [p["service_id"] for p in mqtt["providers"]] == ["mosquitto"]
+        assert len(mqtt["clients"][0]["matched_providers"]) == 1
+
 
 class TestMutualExclusivity:
     """Test mutual exclusivity checking."""
@@ -277,6 +365,23 @@ class TestTraefikLabelGeneration:
         assert any("websecure" in label for label in labels)  # HTTPS entrypoint
         assert any("tls" in label.lower() for label in labels)
 
+    def test_one_label_per_template(self, engine):
+        """Test each template renders exactly one label, even for multi-line values."""
+        templates = engine.config_templates["traefik_label"]
+        labels = engine.generate_traefik_labels(
+            service_name="ignition-1",
+            subdomain="ignition\nextra",
+            port=8088,
+        )
+        assert len(labels) == len(templates)
+        values = {
+            "service_name": "ignition-1",
+            "subdomain": "ignition\nextra",
+            "domain": "localhost",
+            "port": 8088,
+        }
+        assert labels == [template.format(**values) for template in templates]
+
 
 class TestIntegrationSummary:
     """Test integration summary generation."""
@@ -16,6 +16,7 @@ from ignition_toolkit.stackbuilder.keycloak_generator import (
     generate_client_secret,
     generate_keycloak_realm,
     generate_keycloak_readme_section,
+    serialize_keycloak_realm,
 )
 
 
@@ -291,6 +292,16 @@ class TestRealmClientGeneration:
         secrets = [client["secret"] for client in realm["clients"]]
         assert len(set(secrets)) == len(secrets)
 
+    def test_client_secrets_match_standalone_format(self):
+        """Test batch-generated client secrets look like generate_client_secret output."""
+        realm = generate_keycloak_realm(services=["grafana", "n8n", "portainer", "ignition"])
+        safe_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+        expected_length = len(generate_client_secret())
+
+        for client in realm["clients"]:
+            assert len(client["secret"]) == expected_length
+            assert set(client["secret"]) <= safe_chars
+
 
 class TestRealmClientConfiguration:
     """Test detailed client configuration."""
@@ -375,6 +386,18 @@ class TestRealmSerialization:
         assert parsed["realm"] == realm["realm"]
         assert len(parsed["clients"]) == len(realm["clients"])
 
+    def test_serialize_realm_matches_indented_json(self):
+        """Test serialize_keycloak_realm produces the indented realm-import JSON."""
+        realm = generate_keycloak_realm(
+            services=["grafana", "ignition"],
+            users=[{"username": "admin", "password": "admin"}],
+        )
+
+        json_str = serialize_keycloak_realm(realm)
+
+        assert json.loads(json_str) == realm
+        assert json_str == json.dumps(realm, indent=2)
+
 
 class TestReadmeSectionGeneration:
     """Test Keycloak README section generation."""
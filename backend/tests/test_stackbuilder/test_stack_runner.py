@@ -0,0 +1,209 @@
+"""
+Tests for StackRunner
+
+Runs the runner against a stand-in docker executable (a Python script) so the
+real subprocess handling is exercised without Docker installed.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from ignition_toolkit.stackbuilder import stack_runner
+from ignition_toolkit.stackbuilder.stack_runner import StackRunner
+
+STACK_NAME = "test-stack"
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """StackRunner storing stacks under a temporary directory"""
+    monkeypatch.setattr(StackRunner, "STACKS_DIR", tmp_path / "stacks")
+    return StackRunner()
+
+
+@pytest.fixture
+def fake_docker(monkeypatch):
+    """Replace docker with a script; call it with the script's source"""
+
+    def install(script: str) -> None:
+        monkeypatch.setattr(
+            stack_runner, "_get_docker_command", lambda: [sys.executable, "-c", script]
+        )
+
+    return install
+
+
+def _ps_output(*lines: str) -> str:
+    return "import sys\n" + "".join(f"print({line!r})\n" for line in lines)
+
+
+class TestGetStackStatus:
+    """Test parsing `docker compose ps` output"""
+
+    @pytest.fixture(autouse=True)
+    def deployed(self, runner):
+        runner._get_stack_dir(STACK_NAME).mkdir(parents=True)
+
+    def test_not_deployed_without_directory(self, tmp_path, monkeypatch):
+        """Test that a stack with no directory is reported as not deployed"""
+        monkeypatch.setattr(StackRunner, "STACKS_DIR", tmp_path / "empty")
+        assert StackRunner().get_stack_status(STACK_NAME).status == "not_deployed"
+
+    def test_line_per_container(self, runner, fake_docker):
+        """Test the one-object-per-line output of newer Compose releases"""
+        fake_docker(_ps_output(
+            '{"Service": "db", "State": "running"}',
+            '{"Service": "web", "State": "exited"}',
+        ))
+
+        status = runner.get_stack_status(STACK_NAME)
+
+        assert status.status == "partial"
+        assert status.services == {"db": "running", "web": "exited"}
+
+    def test_single_array(self, runner, fake_docker):
+        """Test the single JSON array output of older Compose releases"""
+        fake_docker(_ps_output('[{"Service": "db", "State": "Running"}]'))
+
+        status = runner.get_stack_status(STACK_NAME)
+
+        assert status.status == "running"
+        assert status.services == {"db": "running"}
+
+    def test_malformed_lines(self, runner, fake_docker):
+        """Test that unparseable lines, non-dict entries and null states are tolerated"""
+        fake_docker(_ps_output(
+            "WARN: compose is deprecated",
+            '[1, "x", {"Service": "db", "State": "running"}]',
+            '{"Service": "web", "State": null}',
+            "{broken",
+        ))
+
+        status = runner.get_stack_status(STACK_NAME)
+
+        assert status.status == "partial"
+        assert status.services == {"db": "running", "web": "unknown"}
+
+    def test_no_containers(self, runner, fake_docker):
+        """Test that empty output means the stack is not deployed"""
+        fake_docker("pass")
+
+        assert runner.get_stack_status(STACK_NAME).status == "not_deployed"
+
+    def test_timeout_kills_docker(self, runner, fake_docker, monkeypatch):
+        """Test that the watchdog kills a hung docker and reports unknown"""
+        monkeypatch.setattr(stack_runner, "_STATUS_TIMEOUT", 0.2)
+        fake_docker("import time\ntime.sleep(30)")
+
+        status = runner.get_stack_status(STACK_NAME)
+
+        assert status.status == "unknown"
+        assert status.error == "Docker command timed out"
+
+    def test_parse_error_reaps_docker(self, runner, fake_docker, monkeypatch):
+        """Test that docker is killed and waited on when parsing fails part-way"""
+        fake_docker('print("{}", flush=True)\nimport time\ntime.sleep(30)')
+        procs = []
+        popen = subprocess.Popen
+
+        def recording_popen(*args, **kwargs):
+            procs.append(popen(*args, **kwargs))
+            return procs[-1]
+
+        def failing_parse(lines):
+            next(iter(lines))
+            raise RuntimeError("bad output")
+            yield
+
+        monkeypatch.setattr(stack_runner.subprocess, "Popen", recording_popen)
+        monkeypatch.setattr(stack_runner, "_iter_compose_ps", failing_parse)
+
+        status = runner.get_stack_status(STACK_NAME)
+
+        assert status.status == "unknown"
+        assert status.error == "bad output"
+        assert procs[0].returncode is not None
+
+
+# Stand-in docker for deploys: logs each call, `up` exits with FAKE_DOCKER_UP_RC
+# and `ps` reports one container in FAKE_DOCKER_STATE
+DEPLOY_DOCKER = """
+import json, os, sys
+args = sys.argv[1:]
+with open(os.environ["FAKE_DOCKER_LOG"], "a") as log:
+    log.write(" ".join(args) + "\\n")
+if "up" in args:
+    sys.exit(int(os.environ.get("FAKE_DOCKER_UP_RC", "0")))
+if "ps" in args:
+    print(json.dumps({"Service": "web", "State": os.environ.get("FAKE_DOCKER_STATE", "running")}))
+"""
+
+
+class TestDeployStack:
+    """Test skipping redeploys of unchanged running stacks"""
+
+    @pytest.fixture(autouse=True)
+    def docker_log(self, tmp_path, fake_docker, monkeypatch):
+        log = tmp_path / "docker.log"
+        log.touch()
+        monkeypatch.setenv("FAKE_DOCKER_LOG", str(log))
+        fake_docker(DEPLOY_DOCKER)
+        return log
+
+    @staticmethod
+    def _up_calls(log) -> int:
+        return sum(" up " in f" {line} " for line in log.read_text().splitlines())
+
+    @staticmethod
+    def _deploy(runner, config: str = "a: 1"):
+        return runner.deploy_stack(
+            STACK_NAME, "services: {}", "TZ=UTC", config_files={"configs/app.yml": config}
+        )
+
+    def test_unchanged_running_stack_is_skipped(self, runner, docker_log):
+        """Test that redeploying identical content does not run compose up again"""
+        assert self._deploy(runner).success
+        second = self._deploy(runner)
+
+        assert second.success
+        assert second.output == "Stack is already running with this configuration."
+        assert self._up_calls(docker_log) == 1
+
+    def test_changed_file_redeploys(self, runner, docker_log):
+        """Test that a changed config file forces compose up"""
+        self._deploy(runner)
+        self._deploy(runner, config="a: 2")
+
+        assert self._up_calls(docker_log) == 2
+        stack_dir = runner._get_stack_dir(STACK_NAME)
+        assert (stack_dir / "configs" / "app.yml").read_text() == "a: 2"
+
+    def test_missing_hash_redeploys(self, runner, docker_log):
+        """Test that a stack without a recorded hash is deployed again"""
+        self._deploy(runner)
+        (runner._get_stack_dir(STACK_NAME) / stack_runner._DEPLOY_HASH_FILE).unlink()
+        self._deploy(runner)
+
+        assert self._up_calls(docker_log) == 2
+
+    def test_failed_deploy_is_retried(self, runner, docker_log, monkeypatch):
+        """Test that a failed compose up leaves no hash, so the next deploy runs"""
+        self._deploy(runner)
+        monkeypatch.setenv("FAKE_DOCKER_UP_RC", "1")
+        assert not self._deploy(runner, config="a: 2").success
+        assert not (runner._get_stack_dir(STACK_NAME) / stack_runner._DEPLOY_HASH_FILE).exists()
+
+        monkeypatch.setenv("FAKE_DOCKER_UP_RC", "0")
+        assert self._deploy(runner, config="a: 2").success
+
+        assert self._up_calls(docker_log) == 3
+
+    def test_stopped_stack_redeploys(self, runner, docker_log, monkeypatch):
+        """Test that unchanged content is redeployed when the stack is not running"""
+        self._deploy(runner)
+        monkeypatch.setenv("FAKE_DOCKER_STATE", "exited")
+        self._deploy(runner)
+
+        assert self._up_calls(docker_log) == 2
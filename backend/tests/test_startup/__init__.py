@@ -0,0 +1,3 @@
+"""
+Startup module tests package
+"""
@@ -0,0 +1,89 @@
+"""
+Tests for the startup lifespan
+
+Tests phase ordering, failure recording and deferred readiness.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from ignition_toolkit.startup import lifecycle
+from ignition_toolkit.startup.exceptions import DatabaseInitError
+from ignition_toolkit.startup.health import get_health_state, reset_health_state
+
+
+def _stub_phase(message="ok"):
+    return AsyncMock(return_value=message)
+
+
+@pytest.fixture
+def phases():
+    """Replace every phase body with a stub"""
+    reset_health_state()
+    stubs = {spec.component: _stub_phase() for spec in lifecycle.PHASES}
+    patched = tuple(
+        lifecycle.PhaseSpec(spec.component, spec.label, stubs[spec.component], spec.critical)
+        for spec in lifecycle.PHASES
+    )
+    with (
+        patch.object(lifecycle, "PHASES", patched),
+        patch.object(lifecycle, "_stop_scheduler", AsyncMock()),
+    ):
+        yield stubs
+    reset_health_state()
+
+
+async def _run_lifespan(app, during=None):
+    async with lifecycle.lifespan(app):
+        if during:
+            await during()
+
+
+class TestLifespan:
+    """Test startup lifespan orchestration"""
+
+    def test_ready_after_deferred_phases(self, phases):
+        """Test that the system is only ready once non-fatal phases finish"""
+        states = []
+
+        async def during():
+            states.append(get_health_state().ready)
+            await asyncio.sleep(0.05)
+            states.append(get_health_state().ready)
+
+        asyncio.run(_run_lifespan(FastAPI(), during))
+
+        assert states == [False, True]
+        assert get_health_state().overall.value == "healthy"
+        for stub in phases.values():
+            stub.assert_awaited_once()
+
+    def test_critical_failure_recorded_once(self, phases):
+        """Test that a StartupError aborts startup and is recorded once"""
+        phases["database"].side_effect = DatabaseInitError("disk full")
+
+        with pytest.raises(DatabaseInitError):
+            asyncio.run(_run_lifespan(FastAPI()))
+
+        health = get_health_state()
+        assert health.ready is False
+        assert health.components["database"].status.value == "unhealthy"
+        assert len(health.errors) == 1
+        phases["vault"].assert_not_awaited()
+
+    def test_non_fatal_failure_degrades(self, phases):
+        """Test that a failing non-fatal phase degrades instead of aborting"""
+        phases["browser"].side_effect = RuntimeError("no chromium")
+
+        async def during():
+            await asyncio.sleep(0.05)
+
+        asyncio.run(_run_lifespan(FastAPI(), during))
+
+        health = get_health_state()
+        assert health.ready is True
+        assert health.overall.value == "degraded"
+        assert health.warnings == ["browser: no chromium"]
@@ -0,0 +1,206 @@
+"""
+Tests for the Playwright browser installer helpers
+
+Tests browser detection and the cached startup check.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ignition_toolkit.startup import playwright_installer
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="uses the Linux browser layout")
+
+
+@pytest.fixture(autouse=True)
+def clear_browser_cache():
+    """Start every test without a remembered executable or browsers path"""
+    playwright_installer._clear_browser_cache()
+    playwright_installer.get_playwright_browsers_path.cache_clear()
+    yield
+    playwright_installer._clear_browser_cache()
+    playwright_installer.get_playwright_browsers_path.cache_clear()
+
+
+@pytest.fixture
+def browsers_dir(tmp_path, monkeypatch):
+    """Point Playwright and the data directory at a temporary tree"""
+    browsers = tmp_path / "browsers"
+    browsers.mkdir()
+    data = tmp_path / "data"
+    data.mkdir()
+    monkeypatch.setenv("PLAYWRIGHT_BROWSERS_PATH", str(browsers))
+    with patch("ignition_toolkit.core.paths.get_data_dir", return_value=data):
+        yield browsers
+
+
+def _install_chromium(browsers):
+    exe = browsers / "chromium-1000" / "chrome-linux" / "chrome"
+    exe.parent.mkdir(parents=True)
+    exe.write_text("")
+    return exe
+
+
+class TestBrowserDetection:
+    """Test Chromium executable detection"""
+
+    def test_missing_directory(self, tmp_path, monkeypatch):
+        """Test that a missing browsers directory means not installed"""
+        monkeypatch.setenv("PLAYWRIGHT_BROWSERS_PATH", str(tmp_path / "missing"))
+
+        assert playwright_installer.is_browser_installed() is False
+
+    def test_finds_chromium(self, browsers_dir):
+        """Test that an installed Chromium executable is found"""
+        _install_chromium(browsers_dir)
+
+        assert playwright_installer.is_browser_installed() is True
+
+    def test_finds_headless_shell(self, browsers_dir):
+        """Test that the headless shell variant is found"""
+        exe = browsers_dir / "chromium_headless_shell-1000" / "chrome-linux" / "headless_shell"
+        exe.parent.mkdir(parents=True)
+        exe.write_text("")
+
+        assert playwright_installer._find_browser_executable() == exe
+
+    def test_prefers_full_chromium(self, browsers_dir):
+        """Test that a full Chromium install wins over the headless shell"""
+        shell = browsers_dir / "chromium_headless_shell-1000" / "chrome-linux" / "headless_shell"
+        shell.parent.mkdir(parents=True)
+        shell.write_text("")
+        exe = _install_chromium(browsers_dir)
+
+        assert playwright_installer._find_browser_executable() == exe
+
+    def test_prefers_newest_revision(self, browsers_dir):
+        """Test that the most recently installed revision is checked first"""
+        old = _install_chromium(browsers_dir)
+        os.utime(old.parents[1], (1_000_000, 1_000_000))
+        new = browsers_dir / "chromium-1001" / "chrome-linux" / "chrome"
+        new.parent.mkdir(parents=True)
+        new.write_text("")
+
+        assert playwright_installer._find_browser_executable() == new
+
+    def test_repeat_check_uses_memory_cache(self, browsers_dir):
+        """Test that a found executable is reused without re-walking"""
+        _install_chromium(browsers_dir)
+        assert playwright_installer.is_browser_installed() is True
+
+        with patch.object(playwright_installer, "_find_browser_executable") as find:
+            assert playwright_installer.is_browser_installed() is True
+        find.assert_not_called()
+
+    def test_browser_info_reports_install_dir(self, browsers_dir):
+        """Test that browser info points at the chromium install directory"""
+        _install_chromium(browsers_dir)
+
+        info = playwright_installer.get_browser_info()
+
+        assert info["chromium_installed"] is True
+        assert info["chromium_path"] == str(browsers_dir / "chromium-1000")
+
+
+class TestCachedBrowserCheck:
+    """Test the sentinel-backed browser check"""
+
+    def test_second_check_skips_walk(self, browsers_dir):
+        """Test that a recorded executable skips the directory walk"""
+        _install_chromium(browsers_dir)
+        assert playwright_installer.is_browser_installed_cached() is True
+        playwright_installer._clear_browser_cache()
+
+        with patch.object(playwright_installer, "_find_browser_executable") as find:
+            assert playwright_installer.is_browser_installed_cached() is True
+        find.assert_not_called()
+
+    def test_removed_browser_is_detected(self, browsers_dir):
+        """Test that the cache is not trusted once the executable is gone"""
+        exe = _install_chromium(browsers_dir)
+        assert playwright_installer.is_browser_installed_cached() is True
+
+        exe.unlink()
+
+        assert playwright_installer.is_browser_installed_cached() is False
+
+
+class TestInstallCommand:
+    """Test streaming of the install subprocess output"""
+
+    async def test_reports_progress_while_running(self):
+        """Test that download percentages are forwarded as they are printed"""
+        script = "print('10% of 100 MiB'); print('50% of 100 MiB'); print('100% of 100 MiB')"
+        updates = []
+
+        async def progress(message, fraction):
+            updates.append((message, fraction))
+
+        returncode, stdout, stderr = await playwright_installer._run_install_command(
+            [sys.executable, "-c", script], progress, 0.1
+        )
+
+        assert returncode == 0
+        assert "50% of 100 MiB" in stdout
+        assert [message for message, _ in updates] == [
+            "10% of 100 MiB",
+            "50% of 100 MiB",
+            "100% of 100 MiB",
+        ]
+        assert updates[-1][1] == pytest.approx(0.95)
+
+    async def test_progress_never_moves_backwards(self):
+        """Test that a second download restarting at 0% keeps the bar in place"""
+        script = "print('80%'); print('5%')"
+        fractions = []
+
+        async def progress(message, fraction):
+            fractions.append(fraction)
+
+        await playwright_installer._run_install_command(
+            [sys.executable, "-c", script], progress, 0.0
+        )
+
+        assert fractions[1] == fractions[0]
+
+    async def test_collects_stderr(self):
+        """Test that stderr output is returned for error reporting"""
+        script = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+
+        returncode, _, stderr = await playwright_installer._run_install_command(
+            [sys.executable, "-c", script], None, 0.1
+        )
+
+        assert returncode == 3
+        assert stderr == "boom"
+
+    async def test_failing_progress_callback_stops_install(self, monkeypatch):
+        """Test that a raising progress callback kills the child and its readers"""
+        script = "import time; print('10%', flush=True); time.sleep(60)"
+        processes = []
+        create = asyncio.create_subprocess_exec
+
+        async def recording_create(*args, **kwargs):
+            process = await create(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        async def progress(message, fraction):
+            raise ConnectionError("websocket closed")
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_create)
+
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(
+                playwright_installer._run_install_command(
+                    [sys.executable, "-c", script], progress, 0.1
+                ),
+                timeout=30,
+            )
+
+        assert processes[0].returncode is not None
+        assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,71 @@
+"""
+Tests for the startup validators
+
+Tests the playbook library check against a temporary playbooks directory.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ignition_toolkit.startup import validators
+
+
+@pytest.fixture
+def playbooks_dir(tmp_path):
+    """Point the validators at an empty temporary playbooks directory"""
+    with (
+        patch.object(validators, "get_playbooks_dir", return_value=tmp_path),
+        patch("ignition_toolkit.playbook.metadata.PlaybookMetadataStore"),
+    ):
+        yield tmp_path
+
+
+def _add_playbooks(directory, *names):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_text("name: test\n")
+
+
+class TestValidatePlaybooks:
+    """Test playbook counting by domain"""
+
+    async def test_counts_by_domain(self, playbooks_dir):
+        """Test that YAML files are counted per domain directory"""
+        _add_playbooks(playbooks_dir / "gateway", "a.yaml", "b.yaml")
+        _add_playbooks(playbooks_dir / "perspective", "c.yaml")
+        _add_playbooks(playbooks_dir / "examples", "d.yaml", "e.yaml", "f.yaml")
+
+        stats = await validators.validate_playbooks()
+
+        assert stats == {"total": 6, "gateway": 2, "perspective": 1, "examples": 3}
+
+    async def test_ignores_other_files(self, playbooks_dir):
+        """Test that non-YAML files and subdirectories are not counted"""
+        _add_playbooks(playbooks_dir / "gateway", "a.yaml", "notes.txt", "b.yml")
+        (playbooks_dir / "gateway" / "nested.yaml").mkdir()
+
+        stats = await validators.validate_playbooks()
+
+        assert stats["gateway"] == 1
+
+    async def test_counts_nested_playbooks(self, playbooks_dir):
+        """Test that playbooks in domain subdirectories are counted too"""
+        _add_playbooks(playbooks_dir / "gateway", "a.yaml")
+        _add_playbooks(playbooks_dir / "gateway" / "backup", "b.yaml", "c.yaml")
+
+        stats = await validators.validate_playbooks()
+
+        assert stats["gateway"] == 3
+
+    async def test_missing_domains_count_zero(self, playbooks_dir):
+        """Test that absent domain directories are treated as empty"""
+        stats = await validators.validate_playbooks()
+
+        assert stats == {"total": 0, "gateway": 0, "perspective": 0, "examples": 0}
+
+    async def test_missing_playbooks_dir_raises(self, tmp_path):
+        """Test that a missing playbooks directory fails the phase"""
+        with patch.object(validators, "get_playbooks_dir", return_value=tmp_path / "missing"):
+            with pytest.raises(Exception, match="Playbooks directory not found"):
+                await validators.validate_playbooks()
@@ -0,0 +1,3 @@
+"""
+Update module tests package
+"""
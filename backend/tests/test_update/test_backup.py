@@ -0,0 +1,79 @@
+"""
+Tests for the update backup service
+
+Tests backing up and restoring user data in a temporary data directory.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from ignition_toolkit.update.backup import DB_FILENAME, backup_user_data, restore_backup
+
+
+@pytest.fixture
+def user_data_dir(tmp_path):
+    """Point the backup service at a temporary user data directory"""
+    with patch("ignition_toolkit.core.paths.get_user_data_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def live_db(user_data_dir):
+    """Open a WAL-mode database whose latest commit has not been checkpointed"""
+    conn = sqlite3.connect(user_data_dir / DB_FILENAME)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    conn.execute("CREATE TABLE items (name TEXT)")
+    conn.execute("INSERT INTO items VALUES ('saved')")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _item_names(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT name FROM items")]
+    finally:
+        conn.close()
+
+
+class TestBackupUserData:
+    """Test creating a pre-update backup"""
+
+    def test_copies_user_files(self, user_data_dir):
+        """Test that the vault and encryption key are copied"""
+        (user_data_dir / "credentials.json").write_text("{}")
+        (user_data_dir / "encryption.key").write_bytes(b"key")
+
+        backup_dir = backup_user_data()
+
+        assert (backup_dir / "credentials.json").read_text() == "{}"
+        assert (backup_dir / "encryption.key").read_bytes() == b"key"
+        assert not (backup_dir / DB_FILENAME).exists()
+
+    def test_database_includes_wal_commits(self, live_db, user_data_dir):
+        """Test that the database backup is self-contained"""
+        assert (user_data_dir / f"{DB_FILENAME}-wal").stat().st_size > 0
+
+        backup_dir = backup_user_data()
+
+        assert not (backup_dir / f"{DB_FILENAME}-wal").exists()
+        assert _item_names(backup_dir / DB_FILENAME) == ["saved"]
+
+
+class TestRestoreBackup:
+    """Test rolling back to a backup"""
+
+    def test_restores_database(self, live_db, user_data_dir):
+        """Test that the database is rolled back to the backed-up rows"""
+        backup_dir = backup_user_data()
+        live_db.execute("INSERT INTO items VALUES ('after backup')")
+        live_db.commit()
+        live_db.close()
+
+        assert restore_backup(backup_dir) is True
+
+        assert _item_names(user_data_dir / DB_FILENAME) == ["saved"]